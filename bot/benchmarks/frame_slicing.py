@@ -0,0 +1,81 @@
+"""
+Compares the per-frame conversion LiveKitStreamer used to do against
+_to_frames: CPU time per second of audio and peak traced memory.
+
+Run from the bot directory:
+
+    PYTHONPATH=src python benchmarks/frame_slicing.py --format float32
+"""
+
+import argparse
+import time
+import tracemalloc
+import types
+
+import numpy as np
+from livekit.rtc import AudioFrame
+
+from bot.livekit_streamer.lk_streamer import LiveKitStreamer
+
+
+def per_frame(blocks, samples_per_frame, sample_rate):
+    # the previous path: slice, pad, clip, scale, cast and copy every frame
+    for block in blocks:
+        for i in range(0, len(block), samples_per_frame):
+            chunk = block[i : i + samples_per_frame]
+            if len(chunk) < samples_per_frame:
+                chunk = np.pad(chunk, (0, samples_per_frame - len(chunk)), "constant")
+            if chunk.dtype == np.int16:
+                int16_chunk = chunk
+            else:
+                int16_chunk = (np.clip(chunk, -1.0, 1.0) * 32767).astype(np.int16)
+            AudioFrame(int16_chunk.tobytes(), sample_rate, 1, samples_per_frame)
+
+
+def block_views(blocks, samples_per_frame, sample_rate):
+    streamer = types.SimpleNamespace(samples_per_frame=samples_per_frame, remainders={})
+    for block in blocks:
+        for frame in LiveKitStreamer._to_frames(streamer, 0, block):
+            AudioFrame(memoryview(frame), sample_rate, 1, samples_per_frame)
+
+
+def measure(func, *args):
+    start = time.process_time()
+    func(*args)
+    cpu = time.process_time() - start
+
+    # separate run, tracing slows the code down
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--format", default="float32", choices=["int16", "float32"])
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    parser.add_argument("--block-size", type=int, default=4096)
+    parser.add_argument("--seconds", type=int, default=600, help="of audio")
+    args = parser.parse_args()
+
+    samples_per_frame = args.sample_rate // 100
+    count = args.seconds * args.sample_rate // args.block_size
+    rng = np.random.default_rng(0)
+    block = rng.uniform(-1, 1, args.block_size).astype(np.float32)
+    if args.format == "int16":
+        block = (block * 32767).astype(np.int16)
+    blocks = [block.copy() for _ in range(count)]
+    audio_seconds = count * args.block_size / args.sample_rate
+
+    for name, func in (("per-frame", per_frame), ("block", block_views)):
+        cpu, peak = measure(func, blocks, samples_per_frame, args.sample_rate)
+        print(
+            f"{name:>10}: {cpu / audio_seconds * 1e6:7.1f} us CPU per second "
+            f"of audio, {peak / 1024:7.1f} KiB peak traced memory"
+        )
+
+
+if __name__ == "__main__":
+    main()
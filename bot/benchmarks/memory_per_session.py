@@ -0,0 +1,63 @@
+"""
+Compares resident memory per session between one browser per bot and
+several bots sharing a browser in tabs (bot.browser_mode: multi-tab).
+
+Needs a working Chromium/chromedriver as configured in config.yaml. Run from
+the bot directory:
+
+    PYTHONPATH=src xvfb-run -a python benchmarks/memory_per_session.py --sessions 8 --url <meeting or test page>
+"""
+
+import argparse
+import time
+
+from bot.selenium_bot.google_meets import create_driver
+from bot.selenium_bot.browser_host import BrowserHostManager, process_tree_rss
+
+
+def per_bot(sessions: int, url: str, settle: float) -> int:
+    drivers = [create_driver() for _ in range(sessions)]
+    try:
+        for driver in drivers:
+            driver.get(url)
+        time.sleep(settle)
+        return sum(process_tree_rss(driver.browser_pid) for driver in drivers)
+    finally:
+        for driver in drivers:
+            driver.quit()
+
+
+def multi_tab(sessions: int, url: str, settle: float, per_browser: int) -> int:
+    manager = BrowserHostManager(create_driver, sessions_per_browser=per_browser)
+    try:
+        for i in range(sessions):
+            manager.acquire(f"bench-{i}").get(url)
+        time.sleep(settle)
+        return sum(r["rss_bytes"] for r in manager.memory_report().values())
+    finally:
+        manager.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--sessions-per-browser", type=int, default=4)
+    parser.add_argument("--url", default="about:blank")
+    parser.add_argument("--settle", type=float, default=10.0, help="seconds")
+    args = parser.parse_args()
+
+    results = {
+        "per-bot": per_bot(args.sessions, args.url, args.settle),
+        "multi-tab": multi_tab(
+            args.sessions, args.url, args.settle, args.sessions_per_browser
+        ),
+    }
+    for mode, rss in results.items():
+        print(
+            f"{mode:>10}: {rss / 2**20:8.1f} MiB total, "
+            f"{rss / args.sessions / 2**20:8.1f} MiB per session"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+CPU time per second of audio of the streaming Resampler for common
+capture-to-publish rate pairs, fed in capture-sized blocks.
+
+Run from the bot directory:
+
+    PYTHONPATH=src python benchmarks/resample.py --seconds 600
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from bot.audio.resampler import Resampler
+
+
+PAIRS = ((48000, 16000), (44100, 16000), (16000, 48000), (48000, 24000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--block-size", type=int, default=4096)
+    parser.add_argument("--seconds", type=int, default=120, help="of audio")
+    parser.add_argument("--taps", type=int, default=32)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for input_rate, output_rate in PAIRS:
+        block = (rng.uniform(-1, 1, args.block_size) * 32767).astype(np.int16)
+        count = args.seconds * input_rate // args.block_size
+        resampler = Resampler(input_rate, output_rate, args.taps)
+
+        start = time.process_time()
+        for _ in range(count):
+            resampler.process(block)
+        cpu = time.process_time() - start
+
+        audio_seconds = count * args.block_size / input_rate
+        print(
+            f"{input_rate:>6} -> {output_rate:>6} Hz: "
+            f"{cpu / audio_seconds * 1e6:7.1f} us CPU per second of audio"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import asyncio
+import collections
+import os
+import time
+
+from typing import AsyncIterator
+
+
+class AdmissionTimeout(Exception):
+    """
+    A join waited in the admission queue for longer than queue_timeout.
+    """
+
+
+class AdmissionController:
+    """
+    Decides when JoinMeeting may start a session so that a burst of joins
+    does not overload the node.
+
+    A join is admitted while there are fewer than max_sessions sessions,
+    fewer than max_joining of them still joining (launching Chrome is the
+    expensive part), at least min_free_memory MB available and the load
+    average per CPU below max_load. Other joins wait in FIFO order and are
+    re-checked whenever a session is released or finishes joining, and
+    every poll_interval for the host headroom. A join that waited
+    queue_timeout seconds is rejected.
+
+    Runs on the server's event loop; not thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int,
+        max_joining: int = 2,
+        min_free_memory: float = 512.0,
+        max_load: float = 0.9,
+        queue_timeout: float = 120.0,
+        poll_interval: float = 5.0,
+    ):
+        self.max_sessions = max_sessions
+        self.max_joining = max_joining
+        self.min_free_memory = min_free_memory  # MB
+        self.max_load = max_load  # load average per CPU
+        self.queue_timeout = queue_timeout  # seconds
+        self.poll_interval = poll_interval  # seconds
+
+        self.sessions: set[str] = set()  # admitted, joining or joined
+        self.joining: set[str] = set()
+        self._waiting = collections.deque()  # (bot id, future)
+
+        self.stats = {
+            "admitted": 0,
+            "queued": 0,
+            "rejected": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    async def wait_for_slot(self, bot_id: str) -> AsyncIterator[int]:
+        """
+        Yields the join's queue position (0 is next) every poll_interval
+        until it is admitted. Raises AdmissionTimeout after queue_timeout.
+        """
+        if not self._waiting and self._has_capacity():
+            self._admit(bot_id)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.append((bot_id, future))
+        self.stats["queued"] += 1
+        start = time.monotonic()
+        deadline = start + self.queue_timeout
+        done = False
+        try:
+            while True:
+                self._admit_waiting()
+                if future.done():
+                    done = True
+                    waited = time.monotonic() - start
+                    self.stats["wait_seconds"] += waited
+                    self.stats["max_wait_seconds"] = max(
+                        self.stats["max_wait_seconds"], waited
+                    )
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.stats["rejected"] += 1
+                    raise AdmissionTimeout(
+                        f"no capacity for {self.queue_timeout:.0f}s "
+                        f"({len(self.sessions)} sessions, {len(self.joining)} joining)"
+                    )
+
+                yield self._position(future)
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(future), min(self.poll_interval, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if not future.done():
+                self._waiting = collections.deque(
+                    (b, f) for b, f in self._waiting if f is not future
+                )
+            elif not done:
+                # admitted while the caller went away
+                self.release(bot_id)
+
+    def joined(self, bot_id: str):
+        """
+        The session finished joining, its joining slot is free.
+        """
+        self.joining.discard(bot_id)
+        self._admit_waiting()
+
+    def release(self, bot_id: str):
+        """
+        The session ended or failed to start.
+        """
+        self.sessions.discard(bot_id)
+        self.joining.discard(bot_id)
+        self._admit_waiting()
+
+    def headroom(self) -> dict:
+        return {
+            "sessions": len(self.sessions),
+            "joining": len(self.joining),
+            "waiting": len(self._waiting),
+            "free_memory_mb": _available_memory_mb(),
+            "load": _load_per_cpu(),
+        }
+
+    def _has_capacity(self) -> bool:
+        if len(self.sessions) >= self.max_sessions:
+            return False
+        if len(self.joining) >= self.max_joining:
+            return False
+        memory = _available_memory_mb()
+        if memory is not None and memory < self.min_free_memory:
+            return False
+        load = _load_per_cpu()
+        if load is not None and load > self.max_load and self.sessions:
+            # with no sessions the load is someone else's, do not stall forever
+            return False
+        return True
+
+    def _admit_waiting(self):
+        while self._waiting and self._has_capacity():
+            bot_id, future = self._waiting.popleft()
+            if future.done():
+                continue
+            self._admit(bot_id)
+            future.set_result(None)
+
+    def _admit(self, bot_id: str):
+        self.sessions.add(bot_id)
+        self.joining.add(bot_id)
+        self.stats["admitted"] += 1
+
+    def _position(self, future: asyncio.Future) -> int:
+        for position, (_, waiting) in enumerate(self._waiting):
+            if waiting is future:
+                return position
+        return 0
+
+
+def _available_memory_mb() -> float | None:
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _load_per_cpu() -> float | None:
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except OSError:
+        return None
@@ -0,0 +1,193 @@
+import asyncio
+import collections
+import queue
+import threading
+import time
+
+from typing import Any
+
+
+OVERFLOW_POLICIES = ("block", "drop-oldest", "drop-newest")
+
+
+class AudioChannel:
+    """
+    Bounded channel from producer threads (the Bot's capture and sink
+    threads) to a consumer running on an asyncio event loop.
+
+    put() may be called from any thread. Instead of the consumer polling, a
+    waiting consumer is woken through call_soon_threadsafe on its own loop.
+    The consumer awaits get()/wait() or iterates with `async for`, which ends
+    once the channel is closed and drained.
+
+    The channel is full at `capacity` items or, with max_samples set, once
+    the queued items would hold more than max_samples samples (the length of
+    their `data`), so memory stays bounded whatever the block size. A single
+    item larger than max_samples is still accepted into an empty channel.
+    When the channel is full, "block" makes the producer wait for space,
+    "drop-oldest" discards the oldest queued items and "drop-newest" discards
+    the item being put.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 64,
+        overflow: str = "drop-oldest",
+        max_samples: int | None = None,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy {overflow}")
+        self.capacity = capacity
+        self.overflow = overflow
+        self.max_samples = max_samples
+        self.samples = 0  # queued samples
+
+        self._items = collections.deque()
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._loop = None
+        self._waiter = None  # future of the consumer waiting for items
+        self.closed = False
+
+        self.stats = {
+            "put": 0,
+            "dropped_oldest": 0,
+            "dropped_newest": 0,
+            "dropped_samples": 0,
+            "blocked_seconds": 0.0,
+            "wakeups": 0,
+        }
+
+    def qsize(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def put(self, item: Any, timeout: float | None = None) -> bool:
+        """
+        Queues an item, from any thread. Returns False if the item was
+        dropped, the channel is closed or blocking timed out.
+        """
+        with self._lock:
+            if self.closed:
+                return False
+
+            size = _samples(item)
+            if not self._fits(size):
+                if self.overflow == "drop-newest":
+                    self.stats["dropped_newest"] += 1
+                    self.stats["dropped_samples"] += size
+                    return False
+                if self.overflow == "drop-oldest":
+                    while not self._fits(size):
+                        dropped = _samples(self._items.popleft())
+                        self.samples -= dropped
+                        self.stats["dropped_oldest"] += 1
+                        self.stats["dropped_samples"] += dropped
+                else:
+                    start = time.monotonic()
+                    has_space = self._not_full.wait_for(
+                        lambda: self.closed or self._fits(size), timeout
+                    )
+                    self.stats["blocked_seconds"] += time.monotonic() - start
+                    if not has_space or self.closed:
+                        return False
+
+            self._items.append(item)
+            self.samples += size
+            self.stats["put"] += 1
+            self._wake_consumer()
+            return True
+
+    # queue.Queue compatible spelling for producers
+    put_nowait = put
+
+    def get_nowait(self) -> Any:
+        with self._lock:
+            if not self._items:
+                raise queue.Empty
+            item = self._items.popleft()
+            self.samples -= _samples(item)
+            self._not_full.notify_all()
+            return item
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        """
+        Waits until items are available or the channel is closed. Returns
+        whether items are available.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._items or self.closed:
+                return bool(self._items)
+            self._loop = loop
+            self._waiter = loop.create_future()
+            waiter = self._waiter
+
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                if self._waiter is waiter:
+                    self._waiter = None
+        return not self.empty()
+
+    async def get(self) -> Any:
+        """
+        Next item; raises queue.Empty if the channel was closed and drained.
+        """
+        while True:
+            try:
+                return self.get_nowait()
+            except queue.Empty:
+                if self.closed:
+                    raise
+            await self.wait()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return await self.get()
+        except queue.Empty:
+            raise StopAsyncIteration
+
+    def close(self):
+        with self._lock:
+            self.closed = True
+            self._not_full.notify_all()
+            self._wake_consumer()
+
+    def _fits(self, size: int) -> bool:
+        # called with the lock held
+        if len(self._items) >= self.capacity:
+            return False
+        if self.max_samples is None or not self._items:
+            return True
+        return self.samples + size <= self.max_samples
+
+    def _wake_consumer(self):
+        # called with the lock held; only schedules onto the consumer's loop
+        # when the consumer is actually waiting
+        if self._waiter is not None and not self._waiter.done():
+            self.stats["wakeups"] += 1
+            waiter, self._waiter = self._waiter, None
+            try:
+                self._loop.call_soon_threadsafe(_resolve, waiter)
+            except RuntimeError:
+                pass  # consumer loop already closed
+
+
+def _samples(item: Any) -> int:
+    data = getattr(item, "data", None)
+    return 0 if data is None else len(data)
+
+
+def _resolve(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
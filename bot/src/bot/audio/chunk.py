@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+import numpy as np
+
+
+@dataclass(slots=True)
+class AudioChunk:
+    """
+    A block of mono audio travelling from the Bot to the LiveKit streamer.
+    """
+
+    data: np.ndarray  # float32 in [-1.0, 1.0] or int16
+    sample_rate: int
+    timestamp: float  # capture time of the first sample, ms since epoch
+    position: int = 0  # index of the first sample on the source's timeline
+    source_id: int = 0  # 0 is the mixed meeting audio, 1+ individual sources
+
+    @property
+    def duration(self) -> float:
+        return len(self.data) / self.sample_rate
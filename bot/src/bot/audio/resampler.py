@@ -0,0 +1,82 @@
+import math
+
+import numpy as np
+
+
+class Resampler:
+    """
+    Streaming rational resampler (polyphase FIR) from input_rate to
+    output_rate for one audio source.
+
+    The rate ratio is reduced to up/down = L/M and a Kaiser-windowed sinc
+    low-pass is split into L phases of `taps` coefficients each. All output
+    samples of a block are computed at once as dot products of input
+    windows with their phase's coefficients. The last taps-1 input samples
+    and the output phase carry over between blocks, so a stream resampled in
+    chunks matches the same stream resampled in one go.
+    """
+
+    def __init__(self, input_rate: int, output_rate: int, taps: int = 32):
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        divisor = math.gcd(input_rate, output_rate)
+        self.up = output_rate // divisor
+        self.down = input_rate // divisor
+        self.taps = taps
+
+        self.phases = self._design_filter()
+        self._history = np.zeros(taps - 1, dtype=np.float32)
+        self._position = 0  # input samples consumed so far
+        self._next_time = 0  # next output, in 1/up input samples
+
+    def _design_filter(self) -> np.ndarray:
+        up, down, taps = self.up, self.down, self.taps
+        length = up * taps
+        # cutoff below the lower of the two Nyquist rates, in cycles per
+        # sample of the upsampled signal
+        cutoff = 0.5 / max(up, down) * 0.92
+        n = np.arange(length) - (length - 1) / 2
+        prototype = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(length, 8.0)
+        prototype *= up / prototype.sum()
+
+        # phases[p, j] multiplies input sample i - (taps - 1 - j) for output
+        # phase p, i.e. rows line up with ascending input windows
+        phases = prototype.reshape(taps, up).T[:, ::-1]
+        return np.ascontiguousarray(phases, dtype=np.float32)
+
+    @property
+    def delay(self) -> float:
+        """Group delay of the filter in output samples."""
+        return (self.up * self.taps - 1) / 2 / self.down
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Resamples the next block of the stream; float input gives float32
+        output and int16 input int16 output.
+        """
+        if self.up == self.down:
+            return samples
+
+        block = samples.astype(np.float32)
+        if samples.dtype == np.int16:
+            block /= 32768
+
+        extended = np.concatenate((self._history, block))
+        last = self._position + len(block) - 1  # last input index available
+        count = (last * self.up + self.up - 1 - self._next_time) // self.down + 1
+        count = max(count, 0)
+
+        times = self._next_time + np.arange(count, dtype=np.int64) * self.down
+        indices = times // self.up - self._position
+        windows = np.lib.stride_tricks.sliding_window_view(extended, self.taps)
+        output = np.einsum(
+            "nk,nk->n", windows[indices], self.phases[times % self.up]
+        )
+
+        self._history = extended[len(extended) - (self.taps - 1) :]
+        self._position += len(block)
+        self._next_time += count * self.down
+
+        if samples.dtype == np.int16:
+            return np.clip(np.rint(output * 32768), -32768, 32767).astype(np.int16)
+        return output.astype(np.float32, copy=False)
@@ -0,0 +1,314 @@
+import mmap
+import os
+import queue
+import re
+import struct
+import threading
+import time
+
+from typing import Iterator
+
+import numpy as np
+
+from bot.config import CAPTURE_SAMPLE_RATE, SPOOL_DIR, SPOOL_SECONDS
+from bot.audio.chunk import AudioChunk
+
+
+MAGIC = b"MEEPOSPL"
+VERSION = 1
+# magic, version, index capacity, data capacity (samples), entries written,
+# samples written
+HEADER = struct.Struct("<8sIIQQQ")
+HEADER_SIZE = 64
+# timestamp (ms since epoch), absolute sample position in the spool, length,
+# sample rate, source id
+INDEX_ENTRY = struct.Struct("<dQIII")
+# bot ids come from the client, only these are used in a file name
+SPOOL_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]{0,127}")
+
+
+class AudioSpool:
+    """
+    On-disk ring of one session's captured audio, so it can be replayed into
+    LiveKit or a transcriber after the live path failed.
+
+    The file is preallocated and memory-mapped: a header, a ring of index
+    entries (timestamp, offset, length, rate and source of every block) and
+    a ring of int16 samples. Once full, the oldest audio is overwritten.
+
+    append() only queues the block; a writer thread converts and copies it
+    into the map, so the capture thread never waits on the disk. read()
+    streams back the blocks overlapping any time range, from this process or
+    from a spool reopened with AudioSpool.open(). An existing file is never
+    overwritten, creating a spool at its path raises FileExistsError.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        data_capacity: int,
+        index_capacity: int,
+        pending: int = 256,
+    ):
+        self.path = path
+        self.data_capacity = data_capacity  # samples
+        self.index_capacity = index_capacity  # blocks
+        self._data_offset = HEADER_SIZE + index_capacity * INDEX_ENTRY.size
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "xb") as f:
+            f.truncate(self._data_offset + data_capacity * 2)
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._samples = np.frombuffer(
+            self._map, dtype=np.int16, count=data_capacity, offset=self._data_offset
+        )
+
+        self.entries_written = 0
+        self.samples_written = 0
+        self._reserved = 0  # end of the samples being written
+        self._write_header()
+
+        self._lock = threading.Lock()
+        self._close_lock = threading.Lock()
+        self._pending = queue.Queue(maxsize=pending)
+        self._writer = None
+        self.dropped_blocks = 0  # writer fell behind
+
+    @classmethod
+    def open(cls, path: str) -> "AudioSpool":
+        """
+        Read-only view of an existing spool file.
+        """
+        spool = cls.__new__(cls)
+        spool.path = path
+        spool._file = open(path, "rb")
+        spool._map = mmap.mmap(spool._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_capacity, data_capacity, entries, samples = (
+            HEADER.unpack_from(spool._map, 0)
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not an audio spool")
+
+        spool.index_capacity = index_capacity
+        spool.data_capacity = data_capacity
+        spool.entries_written = entries
+        spool.samples_written = samples
+        spool._reserved = samples
+        spool._data_offset = HEADER_SIZE + index_capacity * INDEX_ENTRY.size
+        spool._samples = np.frombuffer(
+            spool._map, dtype=np.int16, count=data_capacity, offset=spool._data_offset
+        )
+        spool._lock = threading.Lock()
+        spool._close_lock = threading.Lock()
+        spool._pending = None
+        spool._writer = None
+        spool.dropped_blocks = 0
+        return spool
+
+    def start(self):
+        self._writer = threading.Thread(
+            target=self._write_pending, name=f"spool-{self.path}", daemon=True
+        )
+        self._writer.start()
+
+    def append(self, chunk: AudioChunk) -> bool:
+        """
+        Queues a block for writing, never blocks. Returns False if the
+        writer is behind and the block was dropped.
+        """
+        try:
+            self._pending.put_nowait(chunk)
+            return True
+        except queue.Full:
+            self.dropped_blocks += 1
+            return False
+
+    def close(self):
+        """
+        Writes what is still queued and closes the file. Safe to call more
+        than once and from several threads, e.g. the Bot and the reaper.
+        """
+        # not self._lock, the writer takes that one while it drains
+        with self._close_lock:
+            if self._map.closed:
+                return
+            if self._writer is not None:
+                self._pending.put(None)
+                self._writer.join()
+                self._writer = None
+            if self._pending is not None:
+                self._map.flush()
+            # views into the map must go before it can be closed
+            self._samples = None
+            self._map.close()
+            self._file.close()
+
+    def _write_pending(self):
+        while True:
+            chunk = self._pending.get()
+            if chunk is None:
+                return
+            try:
+                self.write(chunk)
+            except Exception as e:
+                print(f"Audio spool {self.path}: failed to write block: {e}")
+
+    def write(self, chunk: AudioChunk):
+        """
+        Copies a block into the spool, on the calling thread.
+        """
+        data = chunk.data
+        if data.dtype != np.int16:
+            data = (np.clip(data, -1.0, 1.0) * 32767).astype(np.int16)
+        if len(data) > self.data_capacity:
+            # keep the newest part of a block larger than the whole ring
+            skipped = len(data) - self.data_capacity
+            data = data[skipped:]
+            timestamp = chunk.timestamp + skipped * 1000 / chunk.sample_rate
+        else:
+            timestamp = chunk.timestamp
+
+        position = self.samples_written
+        with self._lock:
+            # readers treat everything this write laps as overwritten already
+            self._reserved = position + len(data)
+        start = position % self.data_capacity
+        first = min(len(data), self.data_capacity - start)
+        self._samples[start : start + first] = data[:first]
+        self._samples[: len(data) - first] = data[first:]
+
+        slot = self.entries_written % self.index_capacity
+        INDEX_ENTRY.pack_into(
+            self._map,
+            HEADER_SIZE + slot * INDEX_ENTRY.size,
+            timestamp,
+            position,
+            len(data),
+            chunk.sample_rate,
+            chunk.source_id,
+        )
+
+        # publish the block only once its samples and entry are in place
+        with self._lock:
+            self.entries_written += 1
+            self.samples_written += len(data)
+            self._write_header()
+
+    def _write_header(self):
+        HEADER.pack_into(
+            self._map,
+            0,
+            MAGIC,
+            VERSION,
+            self.index_capacity,
+            self.data_capacity,
+            self.entries_written,
+            self.samples_written,
+        )
+
+    def _entries(self) -> list[tuple]:
+        with self._lock:
+            if self._pending is None:
+                # reopened spool, another process may still be writing
+                _, _, _, _, self.entries_written, self.samples_written = (
+                    HEADER.unpack_from(self._map, 0)
+                )
+                self._reserved = self.samples_written
+            written = self.entries_written
+        first = max(0, written - self.index_capacity)
+        entries = [
+            INDEX_ENTRY.unpack_from(
+                self._map, HEADER_SIZE + (i % self.index_capacity) * INDEX_ENTRY.size
+            )
+            for i in range(first, written)
+        ]
+        # leave out entries whose slots the writer reused meanwhile
+        with self._lock:
+            reused = self.entries_written + 1 - self.index_capacity
+        return entries[max(0, reused - first) :]
+
+    def _overwritten(self, position: int) -> bool:
+        with self._lock:
+            return position < self._reserved - self.data_capacity
+
+    def read(
+        self,
+        start_ms: float | None = None,
+        end_ms: float | None = None,
+        source_id: int | None = None,
+    ) -> Iterator[AudioChunk]:
+        """
+        Yields the spooled blocks overlapping [start_ms, end_ms), trimmed to
+        the range, oldest first. Blocks already overwritten are skipped.
+        """
+        for timestamp, position, length, sample_rate, source in self._entries():
+            if source_id is not None and source != source_id:
+                continue
+            duration = length * 1000 / sample_rate
+            if end_ms is not None and timestamp >= end_ms:
+                continue
+            if start_ms is not None and timestamp + duration <= start_ms:
+                continue
+
+            first = 0
+            if start_ms is not None and start_ms > timestamp:
+                first = int((start_ms - timestamp) * sample_rate / 1000)
+            last = length
+            if end_ms is not None and end_ms < timestamp + duration:
+                last = int(np.ceil((end_ms - timestamp) * sample_rate / 1000))
+            if self._overwritten(position + first) or first >= last:
+                continue
+
+            begin = (position + first) % self.data_capacity
+            count = last - first
+            head = self._samples[begin : begin + count]
+            data = np.concatenate((head, self._samples[: count - len(head)]))
+            # the writer may have lapped the block while it was copied
+            if self._overwritten(position + first):
+                continue
+            yield AudioChunk(
+                data,
+                sample_rate,
+                timestamp + first * 1000 / sample_rate,
+                source_id=source,
+            )
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "blocks": self.entries_written,
+                "samples": self.samples_written,
+                "dropped_blocks": self.dropped_blocks,
+                "pending": self._pending.qsize() if self._pending is not None else 0,
+            }
+
+
+def create_session_spool(bot_id: str) -> AudioSpool:
+    """
+    Starts the audio spool of a session, sized for the highest rate the
+    browser may capture at. All audio sources of the session share the
+    ring: with several participants captured separately it keeps less than
+    SPOOL_SECONDS of each.
+
+    Every session gets a file of its own, named after the bot id and the
+    time it started, inside SPOOL_DIR.
+    """
+    if not SPOOL_NAME.fullmatch(bot_id):
+        raise ValueError(f"Bot id {bot_id!r} cannot name a spool file")
+    directory = os.path.realpath(SPOOL_DIR)
+    path = os.path.realpath(
+        os.path.join(directory, f"{bot_id}-{int(time.time() * 1000)}.spool")
+    )
+    if os.path.dirname(path) != directory:
+        # e.g. a symlink left in the directory
+        raise ValueError(f"Spool file of {bot_id} would be outside {SPOOL_DIR}")
+
+    sample_rate = CAPTURE_SAMPLE_RATE or 48000
+    spool = AudioSpool(
+        path,
+        data_capacity=SPOOL_SECONDS * sample_rate,
+        index_capacity=SPOOL_SECONDS * 100,  # blocks of 10 ms or more
+    )
+    spool.start()
+    return spool
@@ -0,0 +1,101 @@
+import numpy as np
+
+from bot.audio.chunk import AudioChunk
+
+
+class CaptureTimeline:
+    """
+    Re-establishes a continuous timeline from decoded capture chunks of a
+    single audio source.
+
+    Each chunk from audio_capture.js carries a sequence number and the index
+    of its first sample on the capture timeline. Skipped sequence numbers are
+    counted as dropped chunks, and any jump in position is filled with silence
+    of the same length so that downstream audio stays time-aligned.
+    """
+
+    def __init__(self, max_gap: float = 30.0):
+        self.max_gap = max_gap  # seconds, longer gaps restart the timeline
+
+        self.next_seq = None
+        self.next_position = None
+        self.sample_rate = None
+
+        self.chunks_received = 0
+        self.chunks_dropped = 0
+        self.gaps = 0
+        self.silence_samples = 0
+        self.overlap_samples = 0
+
+    def push(self, decoded: dict) -> list[AudioChunk]:
+        audio_data = decoded["audio_data"]
+        sample_rate = decoded["sample_rate"]
+        seq = decoded.get("seq")
+        position = decoded.get("position")
+
+        self.chunks_received += 1
+        if seq is not None:
+            if self.next_seq is not None and seq > self.next_seq:
+                self.chunks_dropped += seq - self.next_seq
+            self.next_seq = seq + 1
+
+        if (
+            position is None
+            or self.next_position is None
+            or sample_rate != self.sample_rate
+        ):
+            # nothing to align against, (re)start the timeline here
+            self.sample_rate = sample_rate
+            if position is None:
+                position = self.next_position or 0
+            self.next_position = position + len(audio_data)
+            return [self._chunk(audio_data, decoded, position)]
+
+        chunks = []
+        gap = position - self.next_position
+        if gap > self.max_gap * sample_rate:
+            self.gaps += 1
+        elif gap > 0:
+            self.gaps += 1
+            self.silence_samples += gap
+            silence = np.zeros(gap, dtype=audio_data.dtype)
+            timestamp = decoded["timestamp"] - gap * 1000 / sample_rate
+            chunks.append(
+                AudioChunk(
+                    silence,
+                    sample_rate,
+                    timestamp,
+                    self.next_position,
+                    decoded.get("source_id", 0),
+                )
+            )
+        elif gap < 0:
+            # overlaps an already delivered chunk, keep only the new samples
+            overlap = min(-gap, len(audio_data))
+            self.overlap_samples += overlap
+            audio_data = audio_data[overlap:]
+            position += overlap
+            if len(audio_data) == 0:
+                return chunks
+
+        chunks.append(self._chunk(audio_data, decoded, position))
+        self.next_position = position + len(audio_data)
+        return chunks
+
+    def _chunk(self, audio_data: np.ndarray, decoded: dict, position: int):
+        return AudioChunk(
+            audio_data,
+            decoded["sample_rate"],
+            decoded["timestamp"],
+            position,
+            decoded.get("source_id", 0),
+        )
+
+    def stats(self) -> dict:
+        return {
+            "chunks_received": self.chunks_received,
+            "chunks_dropped": self.chunks_dropped,
+            "gaps": self.gaps,
+            "silence_samples": self.silence_samples,
+            "overlap_samples": self.overlap_samples,
+        }
@@ -0,0 +1,122 @@
+import collections
+import math
+
+import numpy as np
+
+
+class VoiceGate:
+    """
+    Energy/zero-crossing voice activity detector that drops long silent
+    stretches from one audio source before they are published.
+
+    A frame counts as speech when its level is margin_db above the tracked
+    noise floor (and above min_db) and its zero-crossing rate is below
+    max_zcr, which rules out broadband noise. Frames are kept for hangover
+    seconds after speech so trailing syllables are not cut, and the last
+    pre_roll seconds of silence are held back and sent ahead of the next
+    speech onset so it is not clipped either.
+    """
+
+    def __init__(
+        self,
+        frame_duration: float,
+        margin_db: float = 12.0,
+        min_db: float = -55.0,
+        max_zcr: float = 0.35,
+        hangover: float = 0.3,
+        pre_roll: float = 0.1,
+    ):
+        self.margin_db = margin_db
+        self.min_db = min_db
+        self.max_zcr = max_zcr
+        self.hangover_frames = math.ceil(hangover / frame_duration)
+
+        self.noise_floor = min_db  # dBFS
+        self._hang = 0
+        self._pending = collections.deque(maxlen=math.ceil(pre_roll / frame_duration))
+
+        self.speech_frames = 0
+        self.silence_frames = 0
+        self.sent_frames = 0
+        self.suppressed_frames = 0
+
+    def classify(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Speech flags for a (frames, samples) int16 block.
+        """
+        samples = frames.astype(np.float32) / 32768
+        power = np.mean(samples * samples, axis=1)
+        level = 10 * np.log10(power + 1e-10)
+        signs = np.signbit(samples)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (
+            frames.shape[1] - 1
+        )
+
+        speech = (
+            (level > self.noise_floor + self.margin_db)
+            & (level > self.min_db)
+            & (zcr < self.max_zcr)
+        )
+
+        # follow the quietest frames of the block, drops fast and rises slowly
+        quiet = float(np.min(level))
+        rate = 0.5 if quiet < self.noise_floor else 0.05
+        self.noise_floor += rate * (quiet - self.noise_floor)
+        self.noise_floor = max(self.noise_floor, self.min_db - self.margin_db)
+        return speech
+
+    @property
+    def held(self) -> int:
+        """
+        Silent frames held back as pre-roll, not yet sent nor left out.
+        """
+        return len(self._pending)
+
+    def process(
+        self, frames: np.ndarray, items: list | None = None, gaps: bool = False
+    ) -> list:
+        """
+        The frames of a block that should be sent, in order, preceded by any
+        pre-roll held back from earlier blocks. With items, one per frame,
+        the items of those frames are returned instead (e.g. frames paired
+        with their capture times). With gaps, None takes the place of every
+        frame left out for good, so the result keeps the audio's timing.
+        """
+        if len(frames) == 0:
+            return []
+        speech = self.classify(frames)
+        self.speech_frames += int(np.count_nonzero(speech))
+        self.silence_frames += len(frames) - int(np.count_nonzero(speech))
+
+        out = []
+        left_out = 0
+        for frame, is_speech in zip(frames if items is None else items, speech):
+            if is_speech:
+                out.extend(self._pending)
+                self._pending.clear()
+                self._hang = self.hangover_frames
+                out.append(frame)
+            elif self._hang > 0:
+                self._hang -= 1
+                out.append(frame)
+            else:
+                if len(self._pending) == self._pending.maxlen:
+                    self.suppressed_frames += 1
+                    if gaps:
+                        out.append(None)
+                        left_out += 1
+                self._pending.append(frame)
+
+        self.sent_frames += len(out) - left_out
+        return out
+
+    def stats(self) -> dict:
+        total = self.speech_frames + self.silence_frames
+        return {
+            "speech_frames": self.speech_frames,
+            "silence_frames": self.silence_frames,
+            "speech_ratio": self.speech_frames / total if total else 0.0,
+            "sent_frames": self.sent_frames,
+            "suppressed_frames": self.suppressed_frames,
+            "noise_floor_db": self.noise_floor,
+        }
@@ -17,6 +17,41 @@ LIVEKIT_ROOM = os.environ.get("LIVEKIT_ROOM", "")
 # audio configuration
 SAMPLE_RATE = yaml_config.get("audio", {}).get("sample_rate", 48000)
 FRAME_DURATION = yaml_config.get("audio", {}).get("frame_duration", 0.01)  # in seconds
+# bounds of the adaptive jitter buffer in front of LiveKit, in seconds
+JITTER_BUFFER_MIN = yaml_config.get("audio", {}).get("jitter_buffer_min", 0.02)
+JITTER_BUFFER_MAX = yaml_config.get("audio", {}).get("jitter_buffer_max", 0.5)
+# "websocket" pushes frames to a loopback sink, "poll" uses WebDriver polling only
+AUDIO_TRANSPORT = yaml_config.get("audio", {}).get("transport", "websocket")
+# "worklet" (AudioWorklet + ring buffer) or "script-processor" (legacy)
+CAPTURE_ENGINE = yaml_config.get("audio", {}).get("engine", "worklet")
+CAPTURE_CHUNK_SIZE = yaml_config.get("audio", {}).get("chunk_size", 4096)  # samples
+CAPTURE_RING_BUFFER_SIZE = yaml_config.get("audio", {}).get(
+    "ring_buffer_size", 65536
+)  # samples
+# resample/quantize in the browser; 0 keeps the AudioContext rate
+CAPTURE_SAMPLE_RATE = yaml_config.get("audio", {}).get("capture_sample_rate", 0)
+CAPTURE_FORMAT = yaml_config.get("audio", {}).get("capture_format", "float32")
+# "mixed" publishes one track, "per-source" one track per meeting audio source
+CAPTURE_MODE = yaml_config.get("audio", {}).get("capture_mode", "mixed")
+# queue between the Bot and LiveKitStreamer threads, in audio blocks
+CHANNEL_CAPACITY = yaml_config.get("audio", {}).get("channel_capacity", 64)
+CHANNEL_OVERFLOW = yaml_config.get("audio", {}).get("channel_overflow", "drop-oldest")
+# also bounds the queued audio in samples, whatever the block size; 0 disables
+MAX_SAMPLES = yaml_config.get("audio", {}).get("max_samples", 0)
+# optional on-disk ring of each session's captured audio, for replay
+SPOOL_ENABLED = yaml_config.get("audio", {}).get("spool_enabled", False)
+SPOOL_DIR = yaml_config.get("audio", {}).get("spool_dir", "/tmp/meepo-spool")
+SPOOL_SECONDS = yaml_config.get("audio", {}).get("spool_seconds", 600)
+# voice activity gate in front of LiveKit, off by default
+VAD_ENABLED = yaml_config.get("audio", {}).get("vad_enabled", False)
+VAD_MARGIN_DB = yaml_config.get("audio", {}).get("vad_margin_db", 12.0)
+VAD_MIN_DB = yaml_config.get("audio", {}).get("vad_min_db", -55.0)  # dBFS
+VAD_MAX_ZCR = yaml_config.get("audio", {}).get("vad_max_zcr", 0.35)
+VAD_HANGOVER = yaml_config.get("audio", {}).get("vad_hangover", 0.3)  # seconds
+VAD_PRE_ROLL = yaml_config.get("audio", {}).get("vad_pre_roll", 0.1)  # seconds
+# bounds of the adaptive WebDriver polling interval, in seconds
+CAPTURE_POLL_INTERVAL_MIN = yaml_config.get("audio", {}).get("poll_interval_min", 0.02)
+CAPTURE_POLL_INTERVAL_MAX = yaml_config.get("audio", {}).get("poll_interval_max", 0.25)
 
 # bot configuration
 BROWSER_EXECUTABLE = yaml_config.get("bot", {}).get(
@@ -25,3 +60,35 @@ BROWSER_EXECUTABLE = yaml_config.get("bot", {}).get(
 DRIVER_EXECUTABLE = yaml_config.get("bot", {}).get(
     "driver_executable", "/usr/bin/chromedriver"
 )
+
+# pre-warmed driver pool, 0 disables it
+DRIVER_POOL_SIZE = yaml_config.get("bot", {}).get("driver_pool_size", 0)
+DRIVER_MAX_IDLE = yaml_config.get("bot", {}).get("driver_max_idle", 600)  # seconds
+DRIVER_HEALTH_CHECK_INTERVAL = yaml_config.get("bot", {}).get(
+    "driver_health_check_interval", 30
+)  # seconds
+# "per-bot" gives each bot its own browser, "multi-tab" shares browsers
+BROWSER_MODE = yaml_config.get("bot", {}).get("browser_mode", "per-bot")
+SESSIONS_PER_BROWSER = yaml_config.get("bot", {}).get("sessions_per_browser", 4)
+# event loops running the LiveKit streamers, 0 gives each session its own thread
+LIVEKIT_LOOPS = yaml_config.get("bot", {}).get("livekit_loops", 0)
+# sessions run in this many worker processes, 0 runs them in the server
+WORKER_PROCESSES = yaml_config.get("bot", {}).get("worker_processes", 0)
+SESSIONS_PER_WORKER = yaml_config.get("bot", {}).get("sessions_per_worker", 4)
+# admission control of JoinMeeting, max_sessions 0 admits every join at once
+MAX_SESSIONS = yaml_config.get("bot", {}).get("max_sessions", 0)
+MAX_JOINING = yaml_config.get("bot", {}).get("max_joining", 2)
+MIN_FREE_MEMORY = yaml_config.get("bot", {}).get("min_free_memory", 512)  # MB
+MAX_LOAD = yaml_config.get("bot", {}).get("max_load", 0.9)  # load average per CPU
+JOIN_QUEUE_TIMEOUT = yaml_config.get("bot", {}).get("join_queue_timeout", 120)  # seconds
+JOIN_QUEUE_POLL = yaml_config.get("bot", {}).get("join_queue_poll", 5)  # seconds
+# JoinMeeting deadlines per phase: until the bot asks to join, then until admitted
+JOIN_PENDING_TIMEOUT = yaml_config.get("bot", {}).get("join_pending_timeout", 120)
+JOIN_ADMITTED_TIMEOUT = yaml_config.get("bot", {}).get("join_admitted_timeout", 180)
+# session teardown: seconds to stop by itself, before SIGKILL, between sweeps
+TEARDOWN_TIMEOUT = yaml_config.get("bot", {}).get("teardown_timeout", 15)
+KILL_TIMEOUT = yaml_config.get("bot", {}).get("kill_timeout", 5)
+REAP_INTERVAL = yaml_config.get("bot", {}).get("reap_interval", 30)
+# Prometheus metrics over HTTP, port 0 disables them
+METRICS_HOST = yaml_config.get("bot", {}).get("metrics_host", "127.0.0.1")
+METRICS_PORT = yaml_config.get("bot", {}).get("metrics_port", 9464)
@@ -0,0 +1,155 @@
+import collections
+import math
+import time
+
+import numpy as np
+
+
+class JitterBuffer:
+    """
+    Holds the frames of one audio source between their bursty arrival from
+    the Bot and their paced release to LiveKit, one frame per tick.
+
+    The target depth follows the measured arrival jitter (RFC 3550 style
+    interarrival estimate) plus the size of the blocks the capture delivers,
+    bounded by [min_delay, max_delay]. Playback starts once the target depth
+    is reached; running dry is an underrun and re-enters buffering, and
+    growing past max_delay is an overrun that drops the oldest frames back
+    down to the target.
+
+    Frames the voice gate left out arrive as None in their place and take
+    their tick like any frame, so silence is paid for as it happens, in
+    order. Ticks of frames the gate still holds back as pre-roll are not
+    late either; the entries that arrive for them afterwards are skipped if
+    they turned out to be gaps, and played if they were sent after all.
+    """
+
+    def __init__(self, frame_duration: float, min_delay: float, max_delay: float):
+        self.frame_duration = frame_duration  # seconds
+        self.min_frames = max(1, math.ceil(min_delay / frame_duration))
+        self.max_frames = max(self.min_frames, math.ceil(max_delay / frame_duration))
+
+        self.frames = collections.deque()
+        self.buffering = True
+        self.target_depth = self.min_frames
+
+        self.jitter = 0.0  # seconds
+        self.block_duration = 0.0  # seconds, largest recent arrival
+        self._media_time = 0.0  # seconds of audio received so far
+        self._transit = None
+        self._held = 0  # frames the voice gate holds back as pre-roll
+        self._excused = 0  # ticks already passed for some of them
+
+        self.frames_received = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.underruns = 0
+        self.overruns = 0
+        self.suppressed_ticks = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self.frames)
+
+    def push(
+        self,
+        frames: list[tuple[np.ndarray, float] | None],
+        arrival: float | None = None,
+        media_frames: int | None = None,
+        held: int = 0,
+    ):
+        """
+        Adds the frames of one arriving block, arrival on the monotonic clock.
+        Each frame is paired with its capture time, (frame, captured_at) in ms
+        since the epoch, or is None where the voice gate left it out.
+        media_frames is the block's length on the audio clock, which differs
+        from len(frames) once the voice gate holds frames back or sends them
+        later, it keeps the jitter estimate on the audio clock. held is how
+        many frames the gate holds back after this block.
+        """
+        media_frames = len(frames) if media_frames is None else media_frames
+        self._held = held
+        if media_frames == 0:
+            return
+        arrival = time.monotonic() if arrival is None else arrival
+        self._update_jitter(arrival, media_frames * self.frame_duration)
+
+        # the first frames are the ones that were held back while their ticks
+        # passed, gaps among them are already paid for
+        late = frames[: self._excused]
+        self._excused -= len(late)
+        self.suppressed_ticks += sum(1 for frame in late if frame is None)
+        frames = [frame for frame in late if frame is not None] + frames[len(late) :]
+
+        self.frames.extend(frames)
+        self.frames_received += sum(1 for frame in frames if frame is not None)
+
+        if len(self.frames) > self.max_frames:
+            # fell too far behind real time, catch up instead of adding delay
+            self.overruns += 1
+            while len(self.frames) > self.target_depth:
+                if self.frames.popleft() is not None:
+                    self.frames_dropped += 1
+
+    def pop(self) -> tuple[np.ndarray, float] | None:
+        """
+        Next (frame, captured_at) pair to send on this tick, or None while
+        (re)buffering or on a tick the voice gate left empty.
+        """
+        if self.buffering:
+            # left out frames fill the buffer as much as sent ones would
+            if len(self.frames) < self.target_depth:
+                return None
+            self.buffering = False
+
+        if not self.frames:
+            if self._excused < self._held:
+                # held back as pre-roll by the voice gate, nothing is late
+                self._excused += 1
+                return None
+            self.underruns += 1
+            self.buffering = True
+            return None
+
+        frame = self.frames.popleft()
+        if frame is None:
+            # silence the voice gate left out
+            self.suppressed_ticks += 1
+            return None
+        self.frames_sent += 1
+        return frame
+
+    def _update_jitter(self, arrival: float, duration: float):
+        self._media_time += duration
+        # delay between the end of a block on the audio clock and its arrival
+        transit = arrival - self._media_time
+        if self._transit is not None:
+            delta = abs(transit - self._transit)
+            if delta > 4 * self.max_frames * self.frame_duration:
+                # capture restarted or stalled for long, start measuring again
+                self._media_time = duration
+                transit = arrival - duration
+            else:
+                self.jitter += (delta - self.jitter) / 16
+        self._transit = transit
+
+        # decay slowly so one small block does not shrink the buffer
+        self.block_duration = max(duration, self.block_duration * 0.95)
+        # tolerance keeps float noise from adding a whole frame of delay
+        target = math.ceil(
+            (self.block_duration + 2 * self.jitter) / self.frame_duration - 1e-6
+        )
+        self.target_depth = min(max(target, self.min_frames), self.max_frames)
+
+    def stats(self) -> dict:
+        return {
+            "depth": len(self.frames),
+            "target_depth": self.target_depth,
+            "jitter_ms": self.jitter * 1000,
+            "frames_received": self.frames_received,
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "underruns": self.underruns,
+            "overruns": self.overruns,
+            "suppressed_ticks": self.suppressed_ticks,
+        }
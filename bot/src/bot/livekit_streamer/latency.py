@@ -0,0 +1,65 @@
+import bisect
+import math
+
+
+# upper bounds in ms, the last bucket takes everything above
+LATENCY_BUCKETS_MS = (10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+# for the lateness of the streamer's 10-20 ms ticks
+PACING_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100)
+
+
+class LatencyHistogram:
+    """
+    Latencies counted into fixed buckets, so it costs the same however
+    long the session runs; capture-to-publish latency of a session's audio
+    frames with the default buckets.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.bounds = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0  # ms
+        self.max = 0.0  # ms
+
+    def record(self, latency_ms: float):
+        self.counts[bisect.bisect_left(self.bounds, latency_ms)] += 1
+        self.count += 1
+        self.total += latency_ms
+        self.max = max(self.max, latency_ms)
+
+    def percentile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the q-th percentile (0-100), the
+        largest latency seen for the overflow bucket.
+        """
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * q / 100)
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def buckets(self) -> dict[str, int]:
+        """
+        Cumulative counts per upper bound, Prometheus style.
+        """
+        cumulative, seen = {}, 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            cumulative[str(bound)] = seen
+        cumulative["+Inf"] = self.count
+        return cumulative
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max,
+            "buckets": self.buckets(),
+        }
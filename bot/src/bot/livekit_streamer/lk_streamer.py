@@ -5,7 +5,22 @@ from bot.config import (
     LIVEKIT_ROOM,
     SAMPLE_RATE,
     FRAME_DURATION,
+    JITTER_BUFFER_MIN,
+    JITTER_BUFFER_MAX,
+    CAPTURE_MODE,
+    VAD_ENABLED,
+    VAD_MARGIN_DB,
+    VAD_MIN_DB,
+    VAD_MAX_ZCR,
+    VAD_HANGOVER,
+    VAD_PRE_ROLL,
 )
+from bot.livekit_streamer.jitter_buffer import JitterBuffer
+from bot.livekit_streamer.latency import LatencyHistogram, PACING_BUCKETS_MS
+from bot.audio.channel import AudioChannel
+from bot.audio.vad import VoiceGate
+from bot.audio.resampler import Resampler
+from bot.audio.chunk import AudioChunk
 
 from livekit import rtc
 from livekit import api
@@ -14,11 +29,12 @@ import threading
 import queue
 import numpy as np
 import asyncio
+import time
 
 
 class LiveKitStreamer:
     def __init__(
-        self, id: str, name: str, audio_queue: queue.Queue, running: threading.Event
+        self, id: str, name: str, audio_queue: AudioChannel, running: threading.Event
     ):
         self.api_key = LIVEKIT_API_KEY
         self.api_secret = LIVEKIT_API_SECRET
@@ -33,8 +49,34 @@ class LiveKitStreamer:
         self.samples_per_frame = int(self.sample_rate * self.frame_duration)
 
         self.audio_queue = audio_queue
+        self.capture_mode = CAPTURE_MODE
         self.room = None
-        self.audio_source = None
+        self.audio_source = None  # mixed meeting audio (source 0)
+        self.audio_sources: dict[int, rtc.AudioSource] = {}  # per-source tracks
+
+        # frames wait here until their tick, see _stream_audio
+        self.jitter_min = JITTER_BUFFER_MIN
+        self.jitter_max = JITTER_BUFFER_MAX
+        self.jitter_buffers: dict[int, JitterBuffer] = {}
+        self.remainders: dict[int, np.ndarray] = {}  # int16 samples short of a frame
+        # per source, for audio captured at another rate than sample_rate
+        self.resamplers: dict[int, Resampler] = {}
+        # optional voice gate per source, leaves long silences unpublished
+        self.vad_enabled = VAD_ENABLED
+        self.voice_gates: dict[int, VoiceGate] = {}
+        # behind schedule by more than this, restart the schedule from now
+        self.max_lag = 0.1  # seconds
+        # with nothing to send, wait for audio this long before checking running
+        self.idle_timeout = 0.5  # seconds
+        # capture of a frame's last sample to handing it to LiveKit
+        self.latency = LatencyHistogram()
+        self.pacing = LatencyHistogram(PACING_BUCKETS_MS)  # tick lateness
+        self.pacing_stats = {
+            "ticks": 0,
+            "late_ticks": 0,
+            "error_sum": 0.0,
+            "max_error": 0.0,
+        }
 
         self.running = running
 
@@ -43,16 +85,12 @@ class LiveKitStreamer:
         try:
             print(f"[{self.participant_id}] Connecting to LiveKit...")
             self.room = rtc.Room()
-            self.audio_source = rtc.AudioSource(self.sample_rate, 1)
 
             await self.room.connect(url=self.url, token=self.token)
 
-            track = rtc.LocalAudioTrack.create_audio_track(
-                "meeting_audio", self.audio_source
-            )
-            options = rtc.TrackPublishOptions()
-            options.source = rtc.TrackSource.SOURCE_MICROPHONE
-            await self.room.local_participant.publish_track(track, options)
+            # per-source tracks are published as their sources appear
+            if self.capture_mode == "mixed":
+                self.audio_source = await self._publish_track(0)
             print(f"[{self.participant_id}] Connected to LiveKit. Streaming audio...")
 
             await asyncio.sleep(1)
@@ -62,6 +100,9 @@ class LiveKitStreamer:
         except Exception as e:
             raise RuntimeError(f"Failed to connect to LiveKit: {e}")
         finally:
+            # release a Bot blocked on a full channel
+            self.audio_queue.close()
+            print(f"[{self.participant_id}] Stream stats: {self.get_stream_stats()}")
             print(f"[{self.participant_id}] Disconnecting from LiveKit...")
             await self.room.disconnect()
 
@@ -75,44 +116,211 @@ class LiveKitStreamer:
         )
         return token.to_jwt()
 
+    async def _publish_track(self, source_id: int) -> rtc.AudioSource:
+        audio_source = rtc.AudioSource(self.sample_rate, 1)
+        name = "meeting_audio" if source_id == 0 else f"meeting_audio_{source_id}"
+
+        track = rtc.LocalAudioTrack.create_audio_track(name, audio_source)
+        options = rtc.TrackPublishOptions()
+        options.source = rtc.TrackSource.SOURCE_MICROPHONE
+        await self.room.local_participant.publish_track(track, options)
+
+        self.audio_sources[source_id] = audio_source
+        print(f"[{self.participant_id}] Published track {name}")
+        return audio_source
+
+    async def _get_audio_source(self, source_id: int) -> rtc.AudioSource:
+        if source_id == 0 and self.audio_source is not None:
+            return self.audio_source
+        audio_source = self.audio_sources.get(source_id)
+        if audio_source is None:
+            audio_source = await self._publish_track(source_id)
+        return audio_source
+
+    # release one frame per source every frame_duration, on the monotonic
+    # clock rather than as fast as frames arrive
     async def _stream_audio(self):
+        next_tick = time.monotonic()
         while self.running.is_set():
             try:
-                audio_data = self.audio_queue.get_nowait()
-
-                for i in range(0, len(audio_data), self.samples_per_frame):
-                    if not self.running.is_set():
-                        break
-
-                    # get next audio chunk
-                    chunk = audio_data[i : i + self.samples_per_frame]
-                    if len(chunk) < self.samples_per_frame:
-                        # pad with zeros to maintain frame size
-                        chunk = np.pad(
-                            chunk,
-                            (0, self.samples_per_frame - len(chunk)),
-                            "constant",
+                self._receive_audio()
+                if not any(b.depth for b in self.jitter_buffers.values()):
+                    # idle, sleep until the Bot delivers audio instead of ticking
+                    if await self.audio_queue.wait(self.idle_timeout):
+                        self._receive_audio()
+                    next_tick = time.monotonic()
+
+                for source_id, buffer in list(self.jitter_buffers.items()):
+                    entry = buffer.pop()
+                    if entry is None:
+                        continue
+                    frame, captured_at = entry
+                    audio_source = await self._get_audio_source(source_id)
+                    await audio_source.capture_frame(
+                        AudioFrame(
+                            memoryview(frame),
+                            self.sample_rate,
+                            1,
+                            self.samples_per_frame,
                         )
-                    # clamp the values to the range [-1.0, 1.0] and convert to int16
-                    clamped = np.clip(chunk, -1.0, 1.0)
-                    int16_chunk = (clamped * 32767).astype(np.int16)
-
-                    frame = AudioFrame(
-                        int16_chunk.tobytes(),
-                        self.sample_rate,
-                        1,
-                        self.samples_per_frame,
                     )
+                    self.latency.record(time.time() * 1000 - captured_at)
 
-                    await self.audio_source.capture_frame(frame)
+                next_tick += self.frame_duration
+                next_tick = await self._wait_until(next_tick)
 
-                    await asyncio.sleep(0.001)
-
-            except queue.Empty:
-                await asyncio.sleep(0.01)
             except Exception as e:
                 raise RuntimeError(f"Failed to stream audio: {e}")
 
+    # move everything the Bot delivered into the jitter buffers as int16
+    # frames, each paired with the capture time of its last sample
+    def _receive_audio(self):
+        while True:
+            try:
+                audio_chunk = self.audio_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            buffer = self.jitter_buffers.get(audio_chunk.source_id)
+            if buffer is None:
+                buffer = self.jitter_buffers[audio_chunk.source_id] = JitterBuffer(
+                    self.frame_duration, self.jitter_min, self.jitter_max
+                )
+            audio_data = self._resample(audio_chunk)
+            remainder = self.remainders.get(audio_chunk.source_id)
+            carried = 0 if remainder is None else len(remainder)
+            frames = self._to_frames(audio_chunk.source_id, audio_data)
+            captured_at = self._capture_times(audio_chunk, carried, len(frames))
+            entries = list(zip(frames, captured_at))
+            gate = self._get_voice_gate(audio_chunk.source_id)
+            if gate is not None:
+                buffer.push(
+                    gate.process(frames, entries, gaps=True),
+                    media_frames=len(frames),
+                    held=gate.held,
+                )
+            else:
+                buffer.push(entries)
+
+    # capture times (ms since epoch) of the ends of the frames a chunk
+    # completes, the first frame starting with the `carried` samples left
+    # over from the previous chunk
+    def _capture_times(
+        self, audio_chunk: AudioChunk, carried: int, count: int
+    ) -> list[float]:
+        start = audio_chunk.timestamp - carried * 1000 / self.sample_rate
+        frame_ms = self.frame_duration * 1000
+        return [start + frame_ms * (i + 1) for i in range(count)]
+
+    # convert to the publish rate from whatever rate the browser captured at
+    def _resample(self, audio_chunk: AudioChunk) -> np.ndarray:
+        if audio_chunk.sample_rate == self.sample_rate:
+            return audio_chunk.data
+
+        resampler = self.resamplers.get(audio_chunk.source_id)
+        if resampler is None or resampler.input_rate != audio_chunk.sample_rate:
+            print(
+                f"[{self.participant_id}] Resampling source {audio_chunk.source_id} "
+                f"from {audio_chunk.sample_rate} Hz to {self.sample_rate} Hz"
+            )
+            resampler = Resampler(audio_chunk.sample_rate, self.sample_rate)
+            self.resamplers[audio_chunk.source_id] = resampler
+        return resampler.process(audio_chunk.data)
+
+    def _get_voice_gate(self, source_id: int) -> VoiceGate | None:
+        if not self.vad_enabled:
+            return None
+        gate = self.voice_gates.get(source_id)
+        if gate is None:
+            gate = self.voice_gates[source_id] = VoiceGate(
+                self.frame_duration,
+                margin_db=VAD_MARGIN_DB,
+                min_db=VAD_MIN_DB,
+                max_zcr=VAD_MAX_ZCR,
+                hangover=VAD_HANGOVER,
+                pre_roll=VAD_PRE_ROLL,
+            )
+        return gate
+
+    # convert a block to int16 once and cut it into frame-sized rows that are
+    # views of that one buffer; samples short of a full frame are carried
+    # over to the next block of the source instead of being padded with silence
+    def _to_frames(self, source_id: int, audio_data: np.ndarray) -> np.ndarray:
+        if audio_data.dtype == np.int16:
+            # already quantized in the browser
+            samples = audio_data
+        else:
+            # clamp the values to the range [-1.0, 1.0] and convert to int16
+            scaled = np.clip(audio_data, -1.0, 1.0)
+            scaled *= 32767
+            samples = scaled.astype(np.int16)
+
+        remainder = self.remainders.get(source_id)
+        if remainder is not None and len(remainder):
+            samples = np.concatenate((remainder, samples))
+
+        usable = len(samples) - len(samples) % self.samples_per_frame
+        # copy the few leftover samples so the block can be freed once sent
+        self.remainders[source_id] = samples[usable:].copy()
+
+        return np.ascontiguousarray(samples[:usable]).reshape(
+            -1, self.samples_per_frame
+        )
+
+    # sleep until the tick is due, returns the deadline of the tick
+    async def _wait_until(self, deadline: float) -> float:
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        error = time.monotonic() - deadline
+        stats = self.pacing_stats
+        stats["ticks"] += 1
+        stats["error_sum"] += abs(error)
+        stats["max_error"] = max(stats["max_error"], error)
+        self.pacing.record(max(error, 0.0) * 1000)
+        if error > self.max_lag:
+            # the loop stalled, skip the missed ticks instead of bursting
+            stats["late_ticks"] += 1
+            return time.monotonic()
+        return deadline
+
+    def get_stream_stats(self) -> dict:
+        pacing = self.pacing_stats
+        ticks = pacing["ticks"] or 1
+        return {
+            "ticks": pacing["ticks"],
+            "late_ticks": pacing["late_ticks"],
+            "pacing_error_ms": pacing["error_sum"] * 1000 / ticks,
+            "max_pacing_error_ms": pacing["max_error"] * 1000,
+            "sources": {
+                source_id: buffer.stats()
+                for source_id, buffer in self.jitter_buffers.items()
+            },
+            "vad": self._vad_stats(),
+            "latency": self.latency.summary(),
+            "pacing": self.pacing.summary(),
+            "channel": dict(self.audio_queue.stats),
+        }
+
+    # speech/silence ratio of the session, over all sources
+    def _vad_stats(self) -> dict:
+        if not self.voice_gates:
+            return {}
+        speech = sum(g.speech_frames for g in self.voice_gates.values())
+        silence = sum(g.silence_frames for g in self.voice_gates.values())
+        total = speech + silence
+        return {
+            "speech_ratio": speech / total if total else 0.0,
+            "silence_ratio": silence / total if total else 0.0,
+            "suppressed_frames": sum(
+                g.suppressed_frames for g in self.voice_gates.values()
+            ),
+            "sources": {
+                source_id: gate.stats() for source_id, gate in self.voice_gates.items()
+            },
+        }
+
     def execute(self):
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
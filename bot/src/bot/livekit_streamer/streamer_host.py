@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import zlib
+
+from concurrent.futures import Future
+
+from bot.livekit_streamer.lk_streamer import LiveKitStreamer
+
+
+class StreamerHost:
+    """
+    Runs the LiveKit connection of every session as a task on a small, fixed
+    set of event loops instead of one thread and loop per session.
+
+    Sessions are sharded over the loops by bot id. Each loop runs on its own
+    daemon thread, so the LiveKit side uses `loops` threads however many
+    sessions there are.
+    """
+
+    def __init__(self, loops: int = 1):
+        self.size = loops
+        self.loops: list[asyncio.AbstractEventLoop] = []
+        self._threads: list[threading.Thread] = []
+        self.sessions: dict[str, tuple[LiveKitStreamer, Future]] = {}
+        self._lock = threading.Lock()
+
+    def start(self):
+        for i in range(self.size):
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=self._run, args=(loop,), name=f"livekit-loop-{i}", daemon=True
+            )
+            thread.start()
+            self.loops.append(loop)
+            self._threads.append(thread)
+        print(f"LiveKit streamer host started with {self.size} event loops.")
+
+    def stop(self, timeout: float = 5.0):
+        with self._lock:
+            sessions = list(self.sessions.values())
+        for streamer, _ in sessions:
+            streamer.running.clear()
+        for _, future in sessions:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                future.cancel()
+
+        for loop in self.loops:
+            loop.call_soon_threadsafe(loop.stop)
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self.loops.clear()
+        self._threads.clear()
+
+    def start_streamer(self, streamer: LiveKitStreamer) -> Future:
+        """
+        Schedules the streamer's connection on its loop, callable from any
+        thread. The returned future completes when the streamer stops.
+        """
+        bot_id = streamer.participant_id
+        loop = self.loop_for(bot_id)
+        future = asyncio.run_coroutine_threadsafe(self._stream(streamer), loop)
+        with self._lock:
+            self.sessions[bot_id] = (streamer, future)
+        future.add_done_callback(lambda f: self._finished(bot_id, f))
+        return future
+
+    def stop_streamer(self, bot_id: str):
+        """
+        Asks a session's streamer to disconnect; it leaves its loop shortly
+        after.
+        """
+        with self._lock:
+            session = self.sessions.get(bot_id)
+        if session is not None:
+            session[0].running.clear()
+
+    def loop_for(self, bot_id: str) -> asyncio.AbstractEventLoop:
+        # stable across processes, unlike hash()
+        return self.loops[zlib.crc32(bot_id.encode()) % len(self.loops)]
+
+    def stats(self) -> dict:
+        with self._lock:
+            sessions = list(self.sessions)
+        per_loop = [0] * len(self.loops)
+        for bot_id in sessions:
+            per_loop[self.loops.index(self.loop_for(bot_id))] += 1
+        return {"loops": len(self.loops), "sessions": len(sessions), "per_loop": per_loop}
+
+    async def _stream(self, streamer: LiveKitStreamer):
+        try:
+            await streamer.connect()
+        except Exception as e:
+            print(f"[{streamer.participant_id}] LiveKit streaming failed: {e}")
+            raise
+
+    def _finished(self, bot_id: str, future: Future):
+        with self._lock:
+            session = self.sessions.get(bot_id)
+            if session is not None and session[1] is future:
+                del self.sessions[bot_id]
+
+    def _run(self, loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.close()
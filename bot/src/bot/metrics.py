@@ -0,0 +1,259 @@
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable
+
+from grpc import aio
+
+from bot.livekit_streamer.latency import LatencyHistogram
+
+
+# upper bounds in ms of the RPC latency buckets, joins take minutes
+RPC_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000, 30000, 120000, 300000)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# every exported family: name -> (type, help)
+FAMILIES = {
+    "meepo_sessions_active": ("gauge", "Sessions joined to a meeting."),
+    "meepo_sessions_joining": ("gauge", "Admitted sessions still joining."),
+    "meepo_sessions_waiting": ("gauge", "Joins waiting for capacity."),
+    "meepo_joins_admitted_total": ("counter", "Joins admitted."),
+    "meepo_joins_rejected_total": ("counter", "Joins rejected for lack of capacity."),
+    "meepo_join_step_duration_seconds": ("histogram", "Duration of each join step."),
+    "meepo_rpc_duration_seconds": ("histogram", "Duration of the RPCs by method."),
+    "meepo_sessions_torn_down_total": ("counter", "Sessions torn down."),
+    "meepo_processes_killed_total": ("counter", "Chrome processes left to SIGKILL."),
+    "meepo_worker_processes_alive": ("gauge", "Session worker processes running."),
+    "meepo_worker_restarts_total": ("counter", "Session worker processes replaced."),
+    "meepo_capture_polls_total": ("counter", "WebDriver polls for audio."),
+    "meepo_capture_chunks_total": ("counter", "Audio chunks captured by polling."),
+    "meepo_capture_decode_seconds_total": (
+        "counter",
+        "Time spent decoding polled audio chunks.",
+    ),
+    "meepo_capture_chunks_received_total": ("counter", "Audio chunks captured."),
+    "meepo_capture_chunks_dropped_total": ("counter", "Audio chunks dropped."),
+    "meepo_capture_gaps_total": ("counter", "Gaps in the captured audio."),
+    "meepo_queue_depth": ("gauge", "Audio blocks queued for LiveKit."),
+    "meepo_queue_samples": ("gauge", "Audio samples queued for LiveKit."),
+    "meepo_queue_dropped_total": ("counter", "Audio blocks dropped by the queue."),
+    "meepo_jitter_buffer_depth": ("gauge", "Frames held in the jitter buffers."),
+    "meepo_frames_published_total": ("counter", "Audio frames published."),
+    "meepo_frames_dropped_total": ("counter", "Audio frames dropped, not published."),
+    "meepo_jitter_underruns_total": ("counter", "Ticks with no frame to publish."),
+    "meepo_pacing_error_seconds": ("histogram", "Lateness of the publishing ticks."),
+    "meepo_pacing_late_ticks_total": ("counter", "Ticks skipped after a stall."),
+    "meepo_publish_latency_seconds": ("histogram", "Capture-to-publish latency."),
+}
+
+
+class MetricsRegistry:
+    """
+    Metrics of the bot server in the Prometheus text format.
+
+    Nothing is counted here: components keep their counters in plain stats
+    dicts and histograms written only by their own thread, and collectors
+    registered here read them when the metrics are scraped. The hot paths
+    pay nothing for being exported and take no extra locks.
+
+    A collector returns (name, labels, value) samples, the value is a
+    number or a LatencyHistogram (recorded in ms, exported in seconds).
+    """
+
+    def __init__(self, families: dict[str, tuple[str, str]] = FAMILIES):
+        self.families = families
+        self._collectors: dict[str, Callable[[], Iterable[tuple]]] = {}
+        self._lock = threading.Lock()  # registration and scrapes only
+
+    def register(self, key: str, collector: Callable[[], Iterable[tuple]]):
+        with self._lock:
+            self._collectors[key] = collector
+
+    def unregister(self, key: str):
+        with self._lock:
+            self._collectors.pop(key, None)
+
+    def collect(self) -> dict[str, list[tuple[dict, object]]]:
+        with self._lock:
+            collectors = list(self._collectors.items())
+        samples: dict[str, list] = {}
+        for key, collector in collectors:
+            try:
+                for name, labels, value in collector():
+                    samples.setdefault(name, []).append((labels, value))
+            except Exception as e:
+                print(f"Metrics collector {key} failed: {e}")
+        return samples
+
+    def render(self) -> str:
+        lines = []
+        for name, samples in self.collect().items():
+            kind, help_text = self.families.get(name, ("untyped", ""))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                if isinstance(value, LatencyHistogram):
+                    lines.extend(_histogram_lines(name, labels, value))
+                else:
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class RpcMetricsInterceptor(aio.ServerInterceptor):
+    """
+    Records the duration of every RPC, until the last response of a
+    streaming one. Long-lived streams listed in `exclude` are not timed.
+    """
+
+    def __init__(self, exclude: Iterable[str] = ()):
+        self.exclude = set(exclude)
+        self.latency: dict[str, LatencyHistogram] = {}
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+        if handler is None or method in self.exclude:
+            return handler
+
+        histogram = self.latency.get(method)
+        if histogram is None:
+            histogram = self.latency[method] = LatencyHistogram(RPC_BUCKETS_MS)
+
+        if handler.unary_unary is not None:
+            behavior = handler.unary_unary
+
+            async def unary_unary(request, context):
+                start = time.perf_counter()
+                try:
+                    return await behavior(request, context)
+                finally:
+                    histogram.record((time.perf_counter() - start) * 1000)
+
+            return handler._replace(unary_unary=unary_unary)
+
+        if handler.unary_stream is not None:
+            behavior = handler.unary_stream
+
+            async def unary_stream(request, context):
+                start = time.perf_counter()
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                finally:
+                    histogram.record((time.perf_counter() - start) * 1000)
+
+            return handler._replace(unary_stream=unary_stream)
+
+        return handler
+
+    def samples(self) -> Iterable[tuple]:
+        for method, histogram in list(self.latency.items()):
+            yield "meepo_rpc_duration_seconds", {"method": method}, histogram
+
+
+def session_samples(bot_id: str, session: dict) -> Iterable[tuple]:
+    """
+    Pipeline metrics of one session run by this process.
+    """
+    labels = {"bot_id": bot_id}
+
+    bot_instance = session.get("bot")
+    if bot_instance is not None:
+        polls = bot_instance.poll_stats
+        yield "meepo_capture_polls_total", labels, polls["polls"]
+        yield "meepo_capture_chunks_total", labels, polls["chunks"]
+        yield "meepo_capture_decode_seconds_total", labels, polls["decode_seconds"]
+        capture = bot_instance.get_capture_stats()
+        yield "meepo_capture_chunks_received_total", labels, capture.get(
+            "chunks_received", 0
+        )
+        yield "meepo_capture_chunks_dropped_total", labels, capture.get(
+            "chunks_dropped", 0
+        )
+        yield "meepo_capture_gaps_total", labels, capture.get("gaps", 0)
+
+    audio_queue = session.get("audio_queue")
+    if audio_queue is not None:
+        stats = audio_queue.stats
+        yield "meepo_queue_depth", labels, audio_queue.qsize()
+        yield "meepo_queue_samples", labels, audio_queue.samples
+        yield "meepo_queue_dropped_total", labels, (
+            stats["dropped_oldest"] + stats["dropped_newest"]
+        )
+
+    streamer = session.get("livekit_streamer")
+    if streamer is not None:
+        buffers = list(streamer.jitter_buffers.values())
+        yield "meepo_jitter_buffer_depth", labels, sum(b.depth for b in buffers)
+        yield "meepo_frames_published_total", labels, sum(
+            b.frames_sent for b in buffers
+        )
+        yield "meepo_frames_dropped_total", labels, sum(
+            b.frames_dropped for b in buffers
+        )
+        yield "meepo_jitter_underruns_total", labels, sum(b.underruns for b in buffers)
+        yield "meepo_pacing_error_seconds", labels, streamer.pacing
+        yield "meepo_pacing_late_ticks_total", labels, streamer.pacing_stats[
+            "late_ticks"
+        ]
+        yield "meepo_publish_latency_seconds", labels, streamer.latency
+
+
+def start_metrics_server(
+    host: str, port: int, metrics: MetricsRegistry
+) -> ThreadingHTTPServer:
+    """
+    Serves GET /metrics from a daemon thread; shutdown() stops it.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # scraped every few seconds, not worth a log line
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="metrics-http", daemon=True
+    ).start()
+    print(f"Metrics served on http://{host}:{server.server_port}/metrics")
+    return server
+
+
+def _histogram_lines(name: str, labels: dict, histogram: LatencyHistogram):
+    # cumulative buckets in seconds from the ms the histogram records
+    seen = 0
+    for bound, count in zip(histogram.bounds, list(histogram.counts)):
+        seen += count
+        le = {**labels, "le": _number(bound / 1000)}
+        yield f"{name}_bucket{_labels(le)} {seen}"
+    count = histogram.count
+    yield f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {max(count, seen)}"
+    yield f"{name}_sum{_labels(labels)} {_number(histogram.total / 1000)}"
+    yield f"{name}_count{_labels(labels)} {max(count, seen)}"
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(int(value))
@@ -1,11 +1,23 @@
 from typing import TypedDict
+from concurrent.futures import Future
 import threading
 import bot.selenium_bot.google_meets as bot
 import bot.livekit_streamer.lk_streamer as lk_streamer
+from bot.audio.spool import AudioSpool
+from bot.audio.channel import AudioChannel
+from bot.roster import RosterFeed
+from bot.session_state import SessionState
 
 
-class Session(TypedDict):
+class Session(TypedDict, total=False):
     bot: bot.Bot
     livekit_streamer: lk_streamer.LiveKitStreamer
     selenium_evt: threading.Event
     livekit_evt: threading.Event
+    spool: AudioSpool | None
+    state: SessionState
+    roster: RosterFeed
+    selenium_thread: threading.Thread
+    livekit: threading.Thread | Future  # thread, or future on a StreamerHost loop
+    audio_queue: AudioChannel
+    worker: int  # index of the worker process running the session, if any
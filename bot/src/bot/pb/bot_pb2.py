@@ -6,7 +6,7 @@ from google.protobuf import symbol_database as _symbol_database
 from google.protobuf.internal import builder as _builder
 _runtime_version.ValidateProtobufRuntimeVersion(_runtime_version.Domain.PUBLIC, 6, 32, 0, '', 'bot.proto')
 _sym_db = _symbol_database.Default()
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tbot.proto"Q\n\x12JoinMeetingRequest\x12\x10\n\x08meepo_id\x18\x01 \x01(\t\x12\x0e\n\x06bot_id\x18\x02 \x01(\t\x12\x0b\n\x03url\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x04 \x01(\t"\x9d\x01\n\x13JoinMeetingResponse\x12)\n\x05state\x18\x01 \x01(\x0e2\x1a.JoinMeetingResponse.State\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06bot_id\x18\x03 \x01(\t":\n\x05State\x12\x0c\n\x08RECEIVED\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\n\n\x06JOINED\x10\x02\x12\n\n\x06FAILED\x10\x03"9\n\x15MeetingDetailsRequest\x12\x0e\n\x06bot_id\x18\x01 \x01(\t\x12\x10\n\x08meepo_id\x18\x02 \x01(\t"<\n\x16MeetingDetailsResponse\x12"\n\x0cparticipants\x18\x01 \x03(\x0b2\x0c.Participant"\x1b\n\x0bParticipant\x12\x0c\n\x04name\x18\x01 \x01(\t"7\n\x13LeaveMeetingRequest\x12\x0e\n\x06bot_id\x18\x01 \x01(\t\x12\x10\n\x08meepo_id\x18\x02 \x01(\t"\x80\x01\n\x14LeaveMeetingResponse\x12*\n\x05state\x18\x01 \x01(\x0e2\x1b.LeaveMeetingResponse.State\x12\x0f\n\x07message\x18\x02 \x01(\t"+\n\x05State\x12\x0c\n\x08RECEIVED\x10\x00\x12\x08\n\x04DONE\x10\x01\x12\n\n\x06FAILED\x10\x022\xcb\x01\n\nBotService\x12:\n\x0bJoinMeeting\x12\x13.JoinMeetingRequest\x1a\x14.JoinMeetingResponse0\x01\x12D\n\x11GetMeetingDetails\x12\x16.MeetingDetailsRequest\x1a\x17.MeetingDetailsResponse\x12;\n\x0cLeaveMeeting\x12\x14.LeaveMeetingRequest\x1a\x15.LeaveMeetingResponseB4Z2github.com/xyberii4/meepo/gateway/internal/grpc/pbb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tbot.proto"Q\n\x12JoinMeetingRequest\x12\x10\n\x08meepo_id\x18\x01 \x01(\t\x12\x0e\n\x06bot_id\x18\x02 \x01(\t\x12\x0b\n\x03url\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x04 \x01(\t"\xb7\x01\n\x13JoinMeetingResponse\x12)\n\x05state\x18\x01 \x01(\x0e2\x1a.JoinMeetingResponse.State\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06bot_id\x18\x03 \x01(\t\x12\x18\n\x05steps\x18\x04 \x03(\x0b2\t.JoinStep":\n\x05State\x12\x0c\n\x08RECEIVED\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\n\n\x06JOINED\x10\x02\x12\n\n\x06FAILED\x10\x03"c\n\x08JoinStep\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x14\n\x0ccompleted_at\x18\x02 \x01(\x01\x12\x13\n\x0bduration_ms\x18\x03 \x01(\x01\x12\x0e\n\x06p50_ms\x18\x04 \x01(\x01\x12\x0e\n\x06p99_ms\x18\x05 \x01(\x01"9\n\x15MeetingDetailsRequest\x12\x0e\n\x06bot_id\x18\x01 \x01(\t\x12\x10\n\x08meepo_id\x18\x02 \x01(\t"<\n\x16MeetingDetailsResponse\x12"\n\x0cparticipants\x18\x01 \x03(\x0b2\x0c.Participant"\x1b\n\x0bParticipant\x12\x0c\n\x04name\x18\x01 \x01(\t"<\n\x18WatchParticipantsRequest\x12\x0e\n\x06bot_id\x18\x01 \x01(\t\x12\x10\n\x08meepo_id\x18\x02 \x01(\t"\x99\x01\n\x10ParticipantEvent\x12$\n\x04kind\x18\x01 \x01(\x0e2\x16.ParticipantEvent.Kind\x12"\n\x0cparticipants\x18\x02 \x03(\x0b2\x0c.Participant\x12\x0f\n\x07version\x18\x03 \x01(\x04"*\n\x04Kind\x12\x0c\n\x08SNAPSHOT\x10\x00\x12\n\n\x06JOINED\x10\x01\x12\x08\n\x04LEFT\x10\x02"7\n\x13LeaveMeetingRequest\x12\x0e\n\x06bot_id\x18\x01 \x01(\t\x12\x10\n\x08meepo_id\x18\x02 \x01(\t"\x90\x01\n\x14LeaveMeetingResponse\x12*\n\x05state\x18\x01 \x01(\x0e2\x1b.LeaveMeetingResponse.State\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06bot_id\x18\x03 \x01(\t"+\n\x05State\x12\x0c\n\x08RECEIVED\x10\x00\x12\x08\n\x04DONE\x10\x01\x12\n\n\x06FAILED\x10\x02"6\n\x10BatchJoinRequest\x12"\n\x05joins\x18\x01 \x03(\x0b2\x13.JoinMeetingRequest"9\n\x11BatchLeaveRequest\x12$\n\x06leaves\x18\x01 \x03(\x0b2\x14.LeaveMeetingRequest"<\n\x12BatchLeaveResponse\x12&\n\x07results\x18\x01 \x03(\x0b2\x15.LeaveMeetingResponse"\x16\n\x14WatchSessionsRequest"\xcc\x01\n\x0cSessionEvent\x12\x0e\n\x06bot_id\x18\x01 \x01(\t\x12\x10\n\x08meepo_id\x18\x02 \x01(\t\x12"\n\x05state\x18\x03 \x01(\x0e2\x13.SessionEvent.State\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\n\n\x02at\x18\x05 \x01(\x01\x12\x10\n\x08snapshot\x18\x06 \x01(\x08"G\n\x05State\x12\x0c\n\x08RECEIVED\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\n\n\x06JOINED\x10\x02\x12\n\n\x06FAILED\x10\x03\x12\x0b\n\x07STOPPED\x10\x042\xb8\x03\n\nBotService\x12:\n\x0bJoinMeeting\x12\x13.JoinMeetingRequest\x1a\x14.JoinMeetingResponse0\x01\x12D\n\x11GetMeetingDetails\x12\x16.MeetingDetailsRequest\x1a\x17.MeetingDetailsResponse\x12;\n\x0cLeaveMeeting\x12\x14.LeaveMeetingRequest\x1a\x15.LeaveMeetingResponse\x12C\n\x11WatchParticipants\x12\x19.WatchParticipantsRequest\x1a\x11.ParticipantEvent0\x01\x126\n\tBatchJoin\x12\x11.BatchJoinRequest\x1a\x14.JoinMeetingResponse0\x01\x125\n\nBatchLeave\x12\x12.BatchLeaveRequest\x1a\x13.BatchLeaveResponse\x127\n\rWatchSessions\x12\x15.WatchSessionsRequest\x1a\r.SessionEvent0\x01B4Z2github.com/xyberii4/meepo/gateway/internal/grpc/pbb\x06proto3')
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'bot_pb2', _globals)
@@ -16,20 +16,40 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals['_JOINMEETINGREQUEST']._serialized_start = 13
     _globals['_JOINMEETINGREQUEST']._serialized_end = 94
     _globals['_JOINMEETINGRESPONSE']._serialized_start = 97
-    _globals['_JOINMEETINGRESPONSE']._serialized_end = 254
-    _globals['_JOINMEETINGRESPONSE_STATE']._serialized_start = 196
-    _globals['_JOINMEETINGRESPONSE_STATE']._serialized_end = 254
-    _globals['_MEETINGDETAILSREQUEST']._serialized_start = 256
-    _globals['_MEETINGDETAILSREQUEST']._serialized_end = 313
-    _globals['_MEETINGDETAILSRESPONSE']._serialized_start = 315
-    _globals['_MEETINGDETAILSRESPONSE']._serialized_end = 375
-    _globals['_PARTICIPANT']._serialized_start = 377
-    _globals['_PARTICIPANT']._serialized_end = 404
-    _globals['_LEAVEMEETINGREQUEST']._serialized_start = 406
-    _globals['_LEAVEMEETINGREQUEST']._serialized_end = 461
-    _globals['_LEAVEMEETINGRESPONSE']._serialized_start = 464
-    _globals['_LEAVEMEETINGRESPONSE']._serialized_end = 592
-    _globals['_LEAVEMEETINGRESPONSE_STATE']._serialized_start = 549
-    _globals['_LEAVEMEETINGRESPONSE_STATE']._serialized_end = 592
-    _globals['_BOTSERVICE']._serialized_start = 595
-    _globals['_BOTSERVICE']._serialized_end = 798
\ No newline at end of file
+    _globals['_JOINMEETINGRESPONSE']._serialized_end = 280
+    _globals['_JOINMEETINGRESPONSE_STATE']._serialized_start = 222
+    _globals['_JOINMEETINGRESPONSE_STATE']._serialized_end = 280
+    _globals['_JOINSTEP']._serialized_start = 282
+    _globals['_JOINSTEP']._serialized_end = 381
+    _globals['_MEETINGDETAILSREQUEST']._serialized_start = 383
+    _globals['_MEETINGDETAILSREQUEST']._serialized_end = 440
+    _globals['_MEETINGDETAILSRESPONSE']._serialized_start = 442
+    _globals['_MEETINGDETAILSRESPONSE']._serialized_end = 502
+    _globals['_PARTICIPANT']._serialized_start = 504
+    _globals['_PARTICIPANT']._serialized_end = 531
+    _globals['_WATCHPARTICIPANTSREQUEST']._serialized_start = 533
+    _globals['_WATCHPARTICIPANTSREQUEST']._serialized_end = 593
+    _globals['_PARTICIPANTEVENT']._serialized_start = 596
+    _globals['_PARTICIPANTEVENT']._serialized_end = 749
+    _globals['_PARTICIPANTEVENT_KIND']._serialized_start = 707
+    _globals['_PARTICIPANTEVENT_KIND']._serialized_end = 749
+    _globals['_LEAVEMEETINGREQUEST']._serialized_start = 751
+    _globals['_LEAVEMEETINGREQUEST']._serialized_end = 806
+    _globals['_LEAVEMEETINGRESPONSE']._serialized_start = 809
+    _globals['_LEAVEMEETINGRESPONSE']._serialized_end = 953
+    _globals['_LEAVEMEETINGRESPONSE_STATE']._serialized_start = 910
+    _globals['_LEAVEMEETINGRESPONSE_STATE']._serialized_end = 953
+    _globals['_BATCHJOINREQUEST']._serialized_start = 955
+    _globals['_BATCHJOINREQUEST']._serialized_end = 1009
+    _globals['_BATCHLEAVEREQUEST']._serialized_start = 1011
+    _globals['_BATCHLEAVEREQUEST']._serialized_end = 1068
+    _globals['_BATCHLEAVERESPONSE']._serialized_start = 1070
+    _globals['_BATCHLEAVERESPONSE']._serialized_end = 1130
+    _globals['_WATCHSESSIONSREQUEST']._serialized_start = 1132
+    _globals['_WATCHSESSIONSREQUEST']._serialized_end = 1154
+    _globals['_SESSIONEVENT']._serialized_start = 1157
+    _globals['_SESSIONEVENT']._serialized_end = 1361
+    _globals['_SESSIONEVENT_STATE']._serialized_start = 1290
+    _globals['_SESSIONEVENT_STATE']._serialized_end = 1361
+    _globals['_BOTSERVICE']._serialized_start = 1364
+    _globals['_BOTSERVICE']._serialized_end = 1804
\ No newline at end of file
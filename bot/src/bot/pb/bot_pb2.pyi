@@ -21,7 +21,7 @@ class JoinMeetingRequest(_message.Message):
         ...
 
 class JoinMeetingResponse(_message.Message):
-    __slots__ = ('state', 'message', 'bot_id')
+    __slots__ = ('state', 'message', 'bot_id', 'steps')
 
     class State(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
         __slots__ = ()
@@ -36,11 +36,29 @@ class JoinMeetingResponse(_message.Message):
     STATE_FIELD_NUMBER: _ClassVar[int]
     MESSAGE_FIELD_NUMBER: _ClassVar[int]
     BOT_ID_FIELD_NUMBER: _ClassVar[int]
+    STEPS_FIELD_NUMBER: _ClassVar[int]
     state: JoinMeetingResponse.State
     message: str
     bot_id: str
+    steps: _containers.RepeatedCompositeFieldContainer[JoinStep]
 
-    def __init__(self, state: _Optional[_Union[JoinMeetingResponse.State, str]]=..., message: _Optional[str]=..., bot_id: _Optional[str]=...) -> None:
+    def __init__(self, state: _Optional[_Union[JoinMeetingResponse.State, str]]=..., message: _Optional[str]=..., bot_id: _Optional[str]=..., steps: _Optional[_Iterable[_Union[JoinStep, _Mapping]]]=...) -> None:
+        ...
+
+class JoinStep(_message.Message):
+    __slots__ = ('name', 'completed_at', 'duration_ms', 'p50_ms', 'p99_ms')
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    COMPLETED_AT_FIELD_NUMBER: _ClassVar[int]
+    DURATION_MS_FIELD_NUMBER: _ClassVar[int]
+    P50_MS_FIELD_NUMBER: _ClassVar[int]
+    P99_MS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    completed_at: float
+    duration_ms: float
+    p50_ms: float
+    p99_ms: float
+
+    def __init__(self, name: _Optional[str]=..., completed_at: _Optional[float]=..., duration_ms: _Optional[float]=..., p50_ms: _Optional[float]=..., p99_ms: _Optional[float]=...) -> None:
         ...
 
 class MeetingDetailsRequest(_message.Message):
@@ -69,6 +87,37 @@ class Participant(_message.Message):
     def __init__(self, name: _Optional[str]=...) -> None:
         ...
 
+class WatchParticipantsRequest(_message.Message):
+    __slots__ = ('bot_id', 'meepo_id')
+    BOT_ID_FIELD_NUMBER: _ClassVar[int]
+    MEEPO_ID_FIELD_NUMBER: _ClassVar[int]
+    bot_id: str
+    meepo_id: str
+
+    def __init__(self, bot_id: _Optional[str]=..., meepo_id: _Optional[str]=...) -> None:
+        ...
+
+class ParticipantEvent(_message.Message):
+    __slots__ = ('kind', 'participants', 'version')
+
+    class Kind(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        SNAPSHOT: _ClassVar[ParticipantEvent.Kind]
+        JOINED: _ClassVar[ParticipantEvent.Kind]
+        LEFT: _ClassVar[ParticipantEvent.Kind]
+    SNAPSHOT: ParticipantEvent.Kind
+    JOINED: ParticipantEvent.Kind
+    LEFT: ParticipantEvent.Kind
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    PARTICIPANTS_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    kind: ParticipantEvent.Kind
+    participants: _containers.RepeatedCompositeFieldContainer[Participant]
+    version: int
+
+    def __init__(self, kind: _Optional[_Union[ParticipantEvent.Kind, str]]=..., participants: _Optional[_Iterable[_Union[Participant, _Mapping]]]=..., version: _Optional[int]=...) -> None:
+        ...
+
 class LeaveMeetingRequest(_message.Message):
     __slots__ = ('bot_id', 'meepo_id')
     BOT_ID_FIELD_NUMBER: _ClassVar[int]
@@ -80,7 +129,7 @@ class LeaveMeetingRequest(_message.Message):
         ...
 
 class LeaveMeetingResponse(_message.Message):
-    __slots__ = ('state', 'message')
+    __slots__ = ('state', 'message', 'bot_id')
 
     class State(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
         __slots__ = ()
@@ -92,8 +141,71 @@ class LeaveMeetingResponse(_message.Message):
     FAILED: LeaveMeetingResponse.State
     STATE_FIELD_NUMBER: _ClassVar[int]
     MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    BOT_ID_FIELD_NUMBER: _ClassVar[int]
     state: LeaveMeetingResponse.State
     message: str
+    bot_id: str
+
+    def __init__(self, state: _Optional[_Union[LeaveMeetingResponse.State, str]]=..., message: _Optional[str]=..., bot_id: _Optional[str]=...) -> None:
+        ...
+
+class BatchJoinRequest(_message.Message):
+    __slots__ = ('joins',)
+    JOINS_FIELD_NUMBER: _ClassVar[int]
+    joins: _containers.RepeatedCompositeFieldContainer[JoinMeetingRequest]
+
+    def __init__(self, joins: _Optional[_Iterable[_Union[JoinMeetingRequest, _Mapping]]]=...) -> None:
+        ...
+
+class BatchLeaveRequest(_message.Message):
+    __slots__ = ('leaves',)
+    LEAVES_FIELD_NUMBER: _ClassVar[int]
+    leaves: _containers.RepeatedCompositeFieldContainer[LeaveMeetingRequest]
+
+    def __init__(self, leaves: _Optional[_Iterable[_Union[LeaveMeetingRequest, _Mapping]]]=...) -> None:
+        ...
+
+class BatchLeaveResponse(_message.Message):
+    __slots__ = ('results',)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[LeaveMeetingResponse]
+
+    def __init__(self, results: _Optional[_Iterable[_Union[LeaveMeetingResponse, _Mapping]]]=...) -> None:
+        ...
+
+class WatchSessionsRequest(_message.Message):
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        ...
+
+class SessionEvent(_message.Message):
+    __slots__ = ('bot_id', 'meepo_id', 'state', 'message', 'at', 'snapshot')
+
+    class State(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        RECEIVED: _ClassVar[SessionEvent.State]
+        PENDING: _ClassVar[SessionEvent.State]
+        JOINED: _ClassVar[SessionEvent.State]
+        FAILED: _ClassVar[SessionEvent.State]
+        STOPPED: _ClassVar[SessionEvent.State]
+    RECEIVED: SessionEvent.State
+    PENDING: SessionEvent.State
+    JOINED: SessionEvent.State
+    FAILED: SessionEvent.State
+    STOPPED: SessionEvent.State
+    BOT_ID_FIELD_NUMBER: _ClassVar[int]
+    MEEPO_ID_FIELD_NUMBER: _ClassVar[int]
+    STATE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    AT_FIELD_NUMBER: _ClassVar[int]
+    SNAPSHOT_FIELD_NUMBER: _ClassVar[int]
+    bot_id: str
+    meepo_id: str
+    state: SessionEvent.State
+    message: str
+    at: float
+    snapshot: bool
 
-    def __init__(self, state: _Optional[_Union[LeaveMeetingResponse.State, str]]=..., message: _Optional[str]=...) -> None:
+    def __init__(self, bot_id: _Optional[str]=..., meepo_id: _Optional[str]=..., state: _Optional[_Union[SessionEvent.State, str]]=..., message: _Optional[str]=..., at: _Optional[float]=..., snapshot: bool=...) -> None:
         ...
\ No newline at end of file
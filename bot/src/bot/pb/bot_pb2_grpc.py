@@ -25,6 +25,10 @@ class BotServiceStub(object):
         self.JoinMeeting = channel.unary_stream('/BotService/JoinMeeting', request_serializer=bot__pb2.JoinMeetingRequest.SerializeToString, response_deserializer=bot__pb2.JoinMeetingResponse.FromString, _registered_method=True)
         self.GetMeetingDetails = channel.unary_unary('/BotService/GetMeetingDetails', request_serializer=bot__pb2.MeetingDetailsRequest.SerializeToString, response_deserializer=bot__pb2.MeetingDetailsResponse.FromString, _registered_method=True)
         self.LeaveMeeting = channel.unary_unary('/BotService/LeaveMeeting', request_serializer=bot__pb2.LeaveMeetingRequest.SerializeToString, response_deserializer=bot__pb2.LeaveMeetingResponse.FromString, _registered_method=True)
+        self.WatchParticipants = channel.unary_stream('/BotService/WatchParticipants', request_serializer=bot__pb2.WatchParticipantsRequest.SerializeToString, response_deserializer=bot__pb2.ParticipantEvent.FromString, _registered_method=True)
+        self.BatchJoin = channel.unary_stream('/BotService/BatchJoin', request_serializer=bot__pb2.BatchJoinRequest.SerializeToString, response_deserializer=bot__pb2.JoinMeetingResponse.FromString, _registered_method=True)
+        self.BatchLeave = channel.unary_unary('/BotService/BatchLeave', request_serializer=bot__pb2.BatchLeaveRequest.SerializeToString, response_deserializer=bot__pb2.BatchLeaveResponse.FromString, _registered_method=True)
+        self.WatchSessions = channel.unary_stream('/BotService/WatchSessions', request_serializer=bot__pb2.WatchSessionsRequest.SerializeToString, response_deserializer=bot__pb2.SessionEvent.FromString, _registered_method=True)
 
 class BotServiceServicer(object):
     """Missing associated documentation comment in .proto file."""
@@ -47,8 +51,36 @@ class BotServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchParticipants(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchJoin(self, request, context):
+        """Many joins or leaves in one call, run concurrently on the bot server.
+        BatchJoin streams the responses of all joins interleaved, told apart by
+        their bot_id; BatchLeave answers in request order.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchLeave(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchSessions(self, request, context):
+        """State transitions of every session on the bot server.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 def add_BotServiceServicer_to_server(servicer, server):
-    rpc_method_handlers = {'JoinMeeting': grpc.unary_stream_rpc_method_handler(servicer.JoinMeeting, request_deserializer=bot__pb2.JoinMeetingRequest.FromString, response_serializer=bot__pb2.JoinMeetingResponse.SerializeToString), 'GetMeetingDetails': grpc.unary_unary_rpc_method_handler(servicer.GetMeetingDetails, request_deserializer=bot__pb2.MeetingDetailsRequest.FromString, response_serializer=bot__pb2.MeetingDetailsResponse.SerializeToString), 'LeaveMeeting': grpc.unary_unary_rpc_method_handler(servicer.LeaveMeeting, request_deserializer=bot__pb2.LeaveMeetingRequest.FromString, response_serializer=bot__pb2.LeaveMeetingResponse.SerializeToString)}
+    rpc_method_handlers = {'JoinMeeting': grpc.unary_stream_rpc_method_handler(servicer.JoinMeeting, request_deserializer=bot__pb2.JoinMeetingRequest.FromString, response_serializer=bot__pb2.JoinMeetingResponse.SerializeToString), 'GetMeetingDetails': grpc.unary_unary_rpc_method_handler(servicer.GetMeetingDetails, request_deserializer=bot__pb2.MeetingDetailsRequest.FromString, response_serializer=bot__pb2.MeetingDetailsResponse.SerializeToString), 'LeaveMeeting': grpc.unary_unary_rpc_method_handler(servicer.LeaveMeeting, request_deserializer=bot__pb2.LeaveMeetingRequest.FromString, response_serializer=bot__pb2.LeaveMeetingResponse.SerializeToString), 'WatchParticipants': grpc.unary_stream_rpc_method_handler(servicer.WatchParticipants, request_deserializer=bot__pb2.WatchParticipantsRequest.FromString, response_serializer=bot__pb2.ParticipantEvent.SerializeToString), 'BatchJoin': grpc.unary_stream_rpc_method_handler(servicer.BatchJoin, request_deserializer=bot__pb2.BatchJoinRequest.FromString, response_serializer=bot__pb2.JoinMeetingResponse.SerializeToString), 'BatchLeave': grpc.unary_unary_rpc_method_handler(servicer.BatchLeave, request_deserializer=bot__pb2.BatchLeaveRequest.FromString, response_serializer=bot__pb2.BatchLeaveResponse.SerializeToString), 'WatchSessions': grpc.unary_stream_rpc_method_handler(servicer.WatchSessions, request_deserializer=bot__pb2.WatchSessionsRequest.FromString, response_serializer=bot__pb2.SessionEvent.SerializeToString)}
     generic_handler = grpc.method_handlers_generic_handler('BotService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
     server.add_registered_method_handlers('BotService', rpc_method_handlers)
@@ -66,4 +98,20 @@ class BotService(object):
 
     @staticmethod
     def LeaveMeeting(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/BotService/LeaveMeeting', bot__pb2.LeaveMeetingRequest.SerializeToString, bot__pb2.LeaveMeetingResponse.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
\ No newline at end of file
+        return grpc.experimental.unary_unary(request, target, '/BotService/LeaveMeeting', bot__pb2.LeaveMeetingRequest.SerializeToString, bot__pb2.LeaveMeetingResponse.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
+
+    @staticmethod
+    def WatchParticipants(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/BotService/WatchParticipants', bot__pb2.WatchParticipantsRequest.SerializeToString, bot__pb2.ParticipantEvent.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
+
+    @staticmethod
+    def BatchJoin(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/BotService/BatchJoin', bot__pb2.BatchJoinRequest.SerializeToString, bot__pb2.JoinMeetingResponse.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
+
+    @staticmethod
+    def BatchLeave(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/BotService/BatchLeave', bot__pb2.BatchLeaveRequest.SerializeToString, bot__pb2.BatchLeaveResponse.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
+
+    @staticmethod
+    def WatchSessions(request, target, options=(), channel_credentials=None, call_credentials=None, insecure=False, compression=None, wait_for_ready=None, timeout=None, metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/BotService/WatchSessions', bot__pb2.WatchSessionsRequest.SerializeToString, bot__pb2.SessionEvent.FromString, options, channel_credentials, insecure, call_credentials, compression, wait_for_ready, timeout, metadata, _registered_method=True)
\ No newline at end of file
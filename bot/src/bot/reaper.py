@@ -0,0 +1,190 @@
+import asyncio
+import os
+import signal
+import time
+
+from concurrent.futures import Future
+
+from bot.selenium_bot.browser_host import process_tree_rss
+
+
+class SessionReaper:
+    """
+    Tears sessions down completely and collects the ones that ended on
+    their own.
+
+    teardown() stops a session's Bot and LiveKit streamer, waits a bounded
+    time for their threads (the Bot leaves the meeting and quits Chrome on
+    its way out), closes its audio channel, spool and roster, and escalates
+    to SIGTERM and then SIGKILL for Chrome processes that are still around.
+    A session in a tab of a shared browser has no processes of its own;
+    its tab is closed instead.
+    It awaits on the event loop without blocking it.
+
+    reap() does the same for the sessions whose Bot thread has exited or
+    whose state ended, and removes them.
+    """
+
+    def __init__(self, timeout: float = 15.0, kill_timeout: float = 5.0):
+        self.timeout = timeout  # seconds for the session to stop by itself
+        self.kill_timeout = kill_timeout  # seconds between SIGTERM and SIGKILL
+
+        self.stats = {
+            "sessions": 0,
+            "reaped": 0,
+            "timeouts": 0,
+            "processes_terminated": 0,
+            "processes_killed": 0,
+            "memory_reclaimed": 0,  # bytes
+        }
+
+    async def teardown(self, bot_id: str, session: dict, streamer_host=None) -> dict:
+        """
+        Stops every resource of a session; returns what was reclaimed.
+        """
+        start = time.monotonic()
+        bot_instance = session.get("bot")
+        pids = bot_instance.get_process_ids() if bot_instance is not None else []
+        memory = sum(process_tree_rss(pid) for pid in pids)
+
+        for key in ("selenium_evt", "livekit_evt"):
+            if session.get(key) is not None:
+                session[key].clear()
+        if streamer_host is not None:
+            streamer_host.stop_streamer(bot_id)
+
+        deadline = start + self.timeout
+        stopped = await _wait_stopped(session.get("selenium_thread"), deadline)
+        stopped &= await _wait_stopped(session.get("livekit"), deadline)
+        if not stopped:
+            self.stats["timeouts"] += 1
+            print(f"[{bot_id}] Session did not stop within {self.timeout:.0f}s.")
+
+        if session.get("audio_queue") is not None:
+            session["audio_queue"].close()
+        if session.get("spool") is not None:
+            # waits for its writer to drain, and the Bot may be closing it too
+            await asyncio.to_thread(session["spool"].close)
+        if session.get("roster") is not None:
+            session["roster"].close()  # ends its WatchParticipants streams
+
+        if bot_instance is not None and not pids:
+            # a tab of a shared browser has no processes of its own, close it
+            await _quit_driver(bot_id, bot_instance)
+
+        terminated, killed = await self._kill(pids)
+        report = {
+            "stopped": stopped,
+            "seconds": time.monotonic() - start,
+            "processes": len(pids),
+            "processes_terminated": terminated,
+            "processes_killed": killed,
+            "memory_reclaimed": memory if not _alive(pids) else 0,
+        }
+        self.stats["sessions"] += 1
+        self.stats["processes_terminated"] += terminated
+        self.stats["processes_killed"] += killed
+        self.stats["memory_reclaimed"] += report["memory_reclaimed"]
+        print(f"[{bot_id}] Session torn down: {report}")
+        return report
+
+    async def reap(self, sessions: dict, streamer_host=None, on_reaped=None) -> list:
+        """
+        Tears down and removes the sessions that ended on their own.
+        """
+        reports = []
+        for bot_id, session in list(sessions.items()):
+            if not _ended(session):
+                continue
+            if sessions.get(bot_id) is session:
+                del sessions[bot_id]
+            reports.append(await self.teardown(bot_id, session, streamer_host))
+            self.stats["reaped"] += 1
+            if on_reaped is not None:
+                on_reaped(bot_id)
+        if reports:
+            reclaimed = sum(r["memory_reclaimed"] for r in reports)
+            print(
+                f"Reaped {len(reports)} dead sessions, "
+                f"{sum(r['processes'] for r in reports)} processes, "
+                f"{reclaimed / 2**20:.0f} MiB."
+            )
+        return reports
+
+    async def _kill(self, pids: list[int]) -> tuple[int, int]:
+        # processes still running once their session stopped or timed out
+        alive = [pid for pid in pids if _alive([pid])]
+        for pid in alive:
+            _signal(pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + self.kill_timeout
+        while _alive(alive) and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+
+        stubborn = [pid for pid in alive if _alive([pid])]
+        for pid in stubborn:
+            _signal(pid, signal.SIGKILL)
+        return len(alive) - len(stubborn), len(stubborn)
+
+
+def _ended(session: dict) -> bool:
+    state = session.get("state")
+    if state is not None and state.done:
+        return True
+    thread = session.get("selenium_thread")
+    return thread is not None and not thread.is_alive()
+
+
+async def _wait_stopped(worker, deadline: float) -> bool:
+    # worker is a thread or the future of a streamer on a StreamerHost loop
+    if worker is None:
+        return True
+    if isinstance(worker, Future):
+        try:
+            await asyncio.wait_for(
+                asyncio.wrap_future(worker), max(0, deadline - time.monotonic())
+            )
+        except (TimeoutError, asyncio.CancelledError):
+            return worker.done()
+        except Exception:
+            pass  # failed, but stopped
+        return True
+    while worker.is_alive() and time.monotonic() < deadline:
+        await asyncio.sleep(0.1)
+    return not worker.is_alive()
+
+
+async def _quit_driver(bot_id: str, bot_instance):
+    # no-op when the Bot already quit it on its way out
+    driver = getattr(bot_instance, "driver", None)
+    if driver is None:
+        return
+    try:
+        await asyncio.to_thread(driver.quit)
+    except Exception as e:
+        print(f"[{bot_id}] Error quitting driver: {e}")
+
+
+def _alive(pids: list[int]) -> bool:
+    for pid in pids:
+        try:
+            # reap our own exited children, they stay zombies otherwise
+            if os.waitpid(pid, os.WNOHANG) != (0, 0):
+                continue
+        except ChildProcessError:
+            pass
+        try:
+            os.kill(pid, 0)
+            return True
+        except ProcessLookupError:
+            continue
+        except PermissionError:
+            return True
+    return False
+
+
+def _signal(pid: int, sig: int):
+    try:
+        os.kill(pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
@@ -0,0 +1,92 @@
+import asyncio
+import collections
+
+from typing import AsyncIterator
+
+
+class RosterFeed:
+    """
+    Participant list of one session, as last seen by its Bot, for the RPCs
+    on the server's event loop.
+
+    The Bot (or the worker running it) calls update() from its own thread
+    whenever the roster changes; readers get the snapshot without touching
+    the driver. watch() streams a snapshot followed by join/leave deltas.
+    A watcher that falls more than max_pending updates behind is sent a
+    fresh snapshot instead of the deltas it missed.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_pending: int = 64):
+        self.loop = loop
+        self.max_pending = max_pending
+        self.participants: list[str] = []
+        self.version = 0
+        self.closed = False
+        self._watchers: set[asyncio.Queue] = set()
+
+    def update(self, participants: list[str]):
+        """
+        Replaces the roster, from any thread.
+        """
+        try:
+            self.loop.call_soon_threadsafe(self._update, list(participants))
+        except RuntimeError:
+            pass  # server loop already closed
+
+    def close(self):
+        """
+        Ends every watch, from any thread.
+        """
+        try:
+            self.loop.call_soon_threadsafe(self._close)
+        except RuntimeError:
+            pass
+
+    async def watch(self) -> AsyncIterator[tuple[str, list[str], int]]:
+        """
+        Yields ("snapshot", participants, version) and then ("joined", ...)
+        and ("left", ...) deltas until the session ends.
+        """
+        events = asyncio.Queue()
+        events.put_nowait(("snapshot", list(self.participants), self.version))
+        if self.closed:
+            events.put_nowait(None)
+        self._watchers.add(events)
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    return
+                yield event
+        finally:
+            self._watchers.discard(events)
+
+    def _update(self, participants: list[str]):
+        if self.closed:
+            return
+        # names are not unique in a meeting, compare them as multisets
+        old = collections.Counter(self.participants)
+        new = collections.Counter(participants)
+        joined = list((new - old).elements())
+        left = list((old - new).elements())
+        if not joined and not left:
+            return
+
+        self.participants = participants
+        self.version += 1
+        for events in self._watchers:
+            if events.qsize() >= self.max_pending:
+                # too far behind, resync instead of queueing more deltas
+                while not events.empty():
+                    events.get_nowait()
+                events.put_nowait(("snapshot", list(participants), self.version))
+                continue
+            if left:
+                events.put_nowait(("left", left, self.version))
+            if joined:
+                events.put_nowait(("joined", joined, self.version))
+
+    def _close(self):
+        self.closed = True
+        for events in self._watchers:
+            events.put_nowait(None)
@@ -1,26 +1,213 @@
+// Single-producer/single-consumer ring buffer shared by the worklet and the page.
+// ctrl[0] is the write index, ctrl[1] the read index; one slot is kept empty.
+// Returns the number of samples that did not fit.
+function ringWrite(ring, ctrl, samples) {
+  const capacity = ring.length;
+  const write = Atomics.load(ctrl, 0);
+  const read = Atomics.load(ctrl, 1);
+  const free = (read - write - 1 + capacity) % capacity;
+  const count = Math.min(samples.length, free);
+
+  const head = Math.min(count, capacity - write);
+  ring.set(samples.subarray(0, head), write);
+  if (count > head) {
+    ring.set(samples.subarray(head, count), 0);
+  }
+  Atomics.store(ctrl, 0, (write + count) % capacity);
+  return samples.length - count;
+}
+
+// Streaming resampler: windowed-sinc low-pass (anti-aliasing) followed by
+// linear interpolation at the output rate. Filter history and the fractional
+// read position carry over between chunks so chunk boundaries are seamless.
+class StreamResampler {
+  constructor(inputRate, outputRate, taps = 48) {
+    this.step = inputRate / outputRate;
+    this.taps = taps;
+    this.history = new Float32Array(taps);
+    this.position = 0;
+
+    // cutoff just below the lower Nyquist frequency, in cycles per input sample
+    const cutoff = 0.45 * Math.min(1, outputRate / inputRate);
+    const middle = (taps - 1) / 2;
+    this.kernel = new Float32Array(taps);
+    let sum = 0;
+    for (let k = 0; k < taps; k++) {
+      const x = k - middle;
+      const sinc = x === 0 ? 2 * cutoff : Math.sin(2 * Math.PI * cutoff * x) / (Math.PI * x);
+      const window = 0.42 - 0.5 * Math.cos((2 * Math.PI * k) / (taps - 1)) +
+        0.08 * Math.cos((4 * Math.PI * k) / (taps - 1));
+      this.kernel[k] = sinc * window;
+      sum += this.kernel[k];
+    }
+    for (let k = 0; k < taps; k++) this.kernel[k] /= sum;
+  }
+
+  process(input) {
+    const taps = this.taps;
+    const kernel = this.kernel;
+    const length = input.length;
+    const buffer = new Float32Array(taps + length);
+    buffer.set(this.history);
+    buffer.set(input, taps);
+
+    // filtered sample at input index n (n >= -1)
+    const filtered = (n) => {
+      let acc = 0;
+      const base = n + taps;
+      for (let k = 0; k < taps; k++) acc += kernel[k] * buffer[base - k];
+      return acc;
+    };
+
+    const output = new Float32Array(Math.ceil((length - this.position) / this.step) + 1);
+    let count = 0;
+    let t = this.position;
+    while (Math.floor(t) + 1 < length) {
+      const i = Math.floor(t);
+      const a = filtered(i);
+      const b = filtered(i + 1);
+      output[count++] = a + (b - a) * (t - i);
+      t += this.step;
+    }
+    this.position = t - length;
+    this.history.set(buffer.subarray(length));
+    return output.subarray(0, count);
+  }
+}
+
+function toInt16(samples) {
+  const out = new Int16Array(samples.length);
+  for (let i = 0; i < samples.length; i++) {
+    const s = samples[i];
+    out[i] = (s >= 1 ? 1 : s <= -1 ? -1 : s) * 32767;
+  }
+  return out;
+}
+
+// sample encodings, indexed by the encoding code in the binary frame header
+const SAMPLE_FORMATS = ["float32", "int16"];
+
+const AUDIO_CAPTURE_WORKLET = `
+${ringWrite.toString()}
+
+class AudioCaptureProcessor extends AudioWorkletProcessor {
+  constructor(options) {
+    super();
+    const { ringBuffer, ringControl, blockSize } = options.processorOptions;
+    if (ringBuffer) {
+      // shared memory: write straight into the page's ring buffer
+      this.ring = new Float32Array(ringBuffer);
+      this.ctrl = new Int32Array(ringControl);
+    } else {
+      // no SharedArrayBuffer: batch render quanta and transfer them to the page
+      this.blockSize = blockSize;
+      this.block = new Float32Array(blockSize);
+      this.filled = 0;
+    }
+    this.active = true;
+    this.silence = new Float32Array(128);
+    this.port.onmessage = (event) => {
+      if (event.data === "stop") this.active = false;
+    };
+  }
+
+  process(inputs) {
+    // an input without channels is silence, keep the timeline running
+    const input = inputs[0];
+    const samples = input && input.length > 0 ? input[0] : this.silence;
+
+    if (this.ring) {
+      const dropped = ringWrite(this.ring, this.ctrl, samples);
+      if (dropped > 0) this.port.postMessage({ dropped: dropped });
+      return this.active;
+    }
+
+    let offset = 0;
+    while (offset < samples.length) {
+      const count = Math.min(samples.length - offset, this.blockSize - this.filled);
+      this.block.set(samples.subarray(offset, offset + count), this.filled);
+      this.filled += count;
+      offset += count;
+      if (this.filled === this.blockSize) {
+        this.port.postMessage({ samples: this.block }, [this.block.buffer]);
+        this.block = new Float32Array(this.blockSize);
+        this.filled = 0;
+      }
+    }
+    return this.active;
+  }
+}
+
+registerProcessor("audio-capture-processor", AudioCaptureProcessor);
+`;
+
 window.audioCapture = {
   audioContext: null,
-  recorder: null,
   audioChunks: [],
   isCapturing: false,
+  sink: null,
+
+  // "worklet" runs capture off the main thread; "script-processor" is the
+  // legacy ScriptProcessorNode path, kept for comparison and as a fallback
+  // sampleRate: 0 keeps the AudioContext rate; format is "float32" or "int16"
+  // mode "mixed" captures one mix of all media elements as source 0,
+  // "per-source" captures every element separately as sources 1, 2, ...
+  config: {
+    engine: "worklet",
+    chunkSize: 4096,
+    ringBufferSize: 65536,
+    sampleRate: 0,
+    format: "float32",
+    maxBufferedChunks: 100,
+    mode: "mixed",
+    rescanInterval: 2000,
+  },
+  engine: null,
+  shared: false,
+  channels: new Map(), // source id -> capture channel, see _createChannel
+  trackSources: new Map(), // audio track id -> source id
+  nextSourceId: 1,
+  drainTimer: null,
+  rescanTimer: null,
+
+  configure: function (options) {
+    Object.assign(this.config, options || {});
+    this.log(`Configured: ${JSON.stringify(this.config)}`);
+    return this.config;
+  },
 
   log: function (msg) {
     console.log('[AudioCapture] ' + msg);
   },
 
+  _findMediaElements: function () {
+    return Array.from(
+      document.querySelectorAll("audio, video")
+    ).filter((el) =>
+      !el.paused &&
+      el.srcObject instanceof MediaStream &&
+      el.srcObject.getAudioTracks().length > 0
+    );
+  },
+
+  _getElementStream: function (element) {
+    const elementStream = element.srcObject ||
+      (element.captureStream && element.captureStream()) ||
+      (element.mozCaptureStream && element.mozCaptureStream());
+
+    if (elementStream instanceof MediaStream && elementStream.getAudioTracks().length > 0) {
+      return elementStream;
+    }
+    return null;
+  },
+
   startCapture: async function () {
     this.log("Starting audio capture...");
 
     // Find active media elements with audio
     const findMediaElements = async (retries = 5, delay = 2000) => {
       for (let i = 0; i < retries; i++) {
-        const mediaElements = Array.from(
-          document.querySelectorAll("audio, video")
-        ).filter((el) =>
-          !el.paused &&
-          el.srcObject instanceof MediaStream &&
-          el.srcObject.getAudioTracks().length > 0
-        );
+        const mediaElements = this._findMediaElements();
 
         if (mediaElements.length > 0) {
           this.log(`Found ${mediaElements.length} active media elements`);
@@ -37,18 +224,47 @@ window.audioCapture = {
       throw new Error("No active media elements found");
     }
 
-    // Create audio context and mix streams
     this.audioContext = new AudioContext();
+    const contextRate = this.audioContext.sampleRate;
+    const outputRate = this.config.sampleRate || contextRate;
+    this.log(`Capturing at ${contextRate} Hz, emitting ${outputRate} Hz ${this.config.format}`);
+
+    this.engine = await this._loadEngine();
+    this.log(`Using ${this.engine} capture engine`);
+
+    if (this.config.mode === "per-source") {
+      if (this._attachSources(mediaElements) === 0) {
+        throw new Error("Could not connect any audio streams");
+      }
+      // participants join and leave, pick up new media elements as they appear
+      this.rescanTimer = setInterval(
+        () => this._attachSources(this._findMediaElements()),
+        this.config.rescanInterval
+      );
+    } else {
+      this._startMixed(mediaElements);
+    }
+
+    if (this.shared) {
+      // poll the shared rings at twice the chunk rate
+      const interval = (this.config.chunkSize / contextRate) * 500;
+      this.drainTimer = setInterval(() => this._drainAll(), interval);
+    }
+
+    this.isCapturing = true;
+    this.log("Audio capture started successfully");
+    return true;
+  },
+
+  // Mix every media element into a single stream captured as source 0
+  _startMixed: function (mediaElements) {
     const destinationNode = this.audioContext.createMediaStreamDestination();
     let sourcesConnected = 0;
 
     mediaElements.forEach((element, index) => {
       try {
-        const elementStream = element.srcObject ||
-          (element.captureStream && element.captureStream()) ||
-          (element.mozCaptureStream && element.mozCaptureStream());
-
-        if (elementStream instanceof MediaStream && elementStream.getAudioTracks().length > 0) {
+        const elementStream = this._getElementStream(element);
+        if (elementStream) {
           const sourceNode = this.audioContext.createMediaStreamSource(elementStream);
           sourceNode.connect(destinationNode);
           sourcesConnected++;
@@ -66,54 +282,324 @@ window.audioCapture = {
     const combinedStream = destinationNode.stream;
     this.log(`Successfully combined ${sourcesConnected} audio streams`);
 
-    // Setup audio processing to capture chunks
-    const mediaSource = this.audioContext.createMediaStreamSource(combinedStream);
-    this.recorder = this.audioContext.createScriptProcessor(4096, 1, 1);
+    this._createChannel(0, this.audioContext.createMediaStreamSource(combinedStream));
+  },
+
+  // Capture each not yet seen audio track as its own source
+  _attachSources: function (mediaElements) {
+    let sourcesConnected = 0;
+
+    mediaElements.forEach((element) => {
+      try {
+        const elementStream = this._getElementStream(element);
+        if (!elementStream) return;
+
+        const track = elementStream.getAudioTracks()[0];
+        if (this.trackSources.has(track.id)) return;
+
+        const sourceId = this.nextSourceId++;
+        const sourceNode = this.audioContext.createMediaStreamSource(elementStream);
+        this._createChannel(sourceId, sourceNode);
+        this.trackSources.set(track.id, sourceId);
+        track.addEventListener("ended", () => {
+          this.trackSources.delete(track.id);
+          this._closeChannel(sourceId);
+        });
+        sourcesConnected++;
+        this.log(`Connected audio source ${sourceId} (track ${track.id})`);
+      } catch (error) {
+        this.log(`Could not connect element: ${error.message}`);
+      }
+    });
+
+    return sourcesConnected;
+  },
 
-    this.recorder.onaudioprocess = (event) => {
+  _loadEngine: async function () {
+    if (this.config.engine !== "worklet") {
+      return "script-processor";
+    }
+
+    const moduleUrl = URL.createObjectURL(
+      new Blob([AUDIO_CAPTURE_WORKLET], { type: "application/javascript" })
+    );
+    try {
+      await this.audioContext.audioWorklet.addModule(moduleUrl);
+    } catch (error) {
+      this.log(`AudioWorklet unavailable (${error.message}), using ScriptProcessor`);
+      return "script-processor";
+    } finally {
+      URL.revokeObjectURL(moduleUrl);
+    }
+
+    // SharedArrayBuffer needs a cross-origin isolated page
+    this.shared = typeof SharedArrayBuffer !== "undefined" && self.crossOriginIsolated;
+    return "worklet";
+  },
+
+  // A channel is one capture pipeline with its own timeline, see _emitChunk
+  _createChannel: function (sourceId, mediaSource) {
+    const contextRate = this.audioContext.sampleRate;
+    const outputRate = this.config.sampleRate || contextRate;
+
+    const output = this.audioContext.createGain();
+    output.gain.value = 0; // Silent output
+    output.connect(this.audioContext.destination);
+
+    const channel = {
+      sourceId: sourceId,
+      mediaSource: mediaSource,
+      output: output,
+      recorder: null,
+      resampler: outputRate !== contextRate
+        ? new StreamResampler(contextRate, outputRate)
+        : null,
+      seq: 0,
+      position: 0,
+      expectedInput: null,
+      ring: null,
+      ringControl: null,
+      ringPosition: 0,
+      ringGap: 0,
+    };
+
+    if (this.engine === "worklet") {
+      this._startWorklet(channel);
+    } else {
+      this._startScriptProcessor(channel);
+    }
+    this.channels.set(sourceId, channel);
+    return channel;
+  },
+
+  _closeChannel: function (sourceId) {
+    const channel = this.channels.get(sourceId);
+    if (!channel) return;
+
+    this._drainRing(channel);
+    if (channel.recorder) {
+      if (channel.recorder.port) {
+        channel.recorder.port.postMessage("stop");
+      }
+      channel.recorder.disconnect();
+    }
+    channel.mediaSource.disconnect();
+    channel.output.disconnect();
+    this.channels.delete(sourceId);
+    this.log(`Closed audio source ${sourceId}`);
+  },
+
+  _startScriptProcessor: function (channel) {
+    channel.recorder = this.audioContext.createScriptProcessor(this.config.chunkSize, 1, 1);
+
+    channel.recorder.onaudioprocess = (event) => {
       if (!this.isCapturing) return;
 
+      // playbackTime moves on even if callbacks were skipped, exposing gaps
       const inputData = event.inputBuffer.getChannelData(0);
-      const audioData = new Float32Array(inputData);
-
-      // Convert to base64 for easy transfer to Python
-      const buffer = new ArrayBuffer(audioData.length * 4);
-      const view = new Float32Array(buffer);
-      view.set(audioData);
-      const base64 = btoa(String.fromCharCode(...new Uint8Array(buffer)));
-
-      // Store audio chunk with timestamp
-      this.audioChunks.push({
-        timestamp: Date.now(),
-        data: base64,
-        sampleRate: this.audioContext.sampleRate,
-        length: audioData.length
-      });
-
-      // Limit buffer size to prevent memory issues (keep last 100 chunks ~4 seconds)
-      if (this.audioChunks.length > 100) {
-        this.audioChunks = this.audioChunks.slice(-100);
-      }
+      const inputPosition = Math.round(event.playbackTime * this.audioContext.sampleRate);
+      this._emitChunk(channel, new Float32Array(inputData), Date.now(), inputPosition);
     };
 
     // Connect the audio processing pipeline
-    mediaSource.connect(this.recorder);
-    const gainNode = this.audioContext.createGain();
-    gainNode.gain.value = 0; // Silent output
-    this.recorder.connect(gainNode);
-    gainNode.connect(this.audioContext.destination);
+    channel.mediaSource.connect(channel.recorder);
+    channel.recorder.connect(channel.output);
+  },
 
-    this.isCapturing = true;
-    this.log("Audio capture started successfully");
-    return true;
+  _startWorklet: function (channel) {
+    const Buffer = this.shared ? SharedArrayBuffer : ArrayBuffer;
+    channel.ring = new Float32Array(new Buffer(this.config.ringBufferSize * 4));
+    channel.ringControl = new Int32Array(new Buffer(8));
+
+    channel.recorder = new AudioWorkletNode(this.audioContext, "audio-capture-processor", {
+      numberOfInputs: 1,
+      numberOfOutputs: 1,
+      channelCount: 1,
+      channelCountMode: "explicit",
+      processorOptions: {
+        ringBuffer: this.shared ? channel.ring.buffer : null,
+        ringControl: this.shared ? channel.ringControl.buffer : null,
+        blockSize: this.config.chunkSize,
+      },
+    });
+    channel.recorder.port.onmessage = (event) => {
+      if (event.data.samples) {
+        channel.ringGap += ringWrite(channel.ring, channel.ringControl, event.data.samples);
+        this._drainRing(channel);
+      } else if (event.data.dropped) {
+        // the shared ring was full, these samples never reached the page
+        channel.ringGap += event.data.dropped;
+      }
+    };
+
+    channel.mediaSource.connect(channel.recorder);
+    channel.recorder.connect(channel.output);
+  },
+
+  _drainAll: function () {
+    this.channels.forEach((channel) => this._drainRing(channel));
+  },
+
+  // Read complete chunks out of a channel's ring buffer and emit them
+  _drainRing: function (channel) {
+    if (!channel.ring || !this.isCapturing) return;
+
+    const ring = channel.ring;
+    const ctrl = channel.ringControl;
+    const capacity = ring.length;
+    const chunkSize = this.config.chunkSize;
+
+    let read = Atomics.load(ctrl, 1);
+    let available = (Atomics.load(ctrl, 0) - read + capacity) % capacity;
+    while (available >= chunkSize) {
+      const chunk = new Float32Array(chunkSize);
+      const head = Math.min(chunkSize, capacity - read);
+      chunk.set(ring.subarray(read, read + head));
+      if (head < chunkSize) {
+        chunk.set(ring.subarray(0, chunkSize - head), head);
+      }
+      read = (read + chunkSize) % capacity;
+      Atomics.store(ctrl, 1, read);
+      available -= chunkSize;
+
+      // samples lost to a full ring are accounted for before the next chunk
+      channel.ringPosition += channel.ringGap;
+      channel.ringGap = 0;
+
+      // approximate capture time of the chunk from what is still buffered
+      const pendingMs = ((available + chunkSize) / this.audioContext.sampleRate) * 1000;
+      this._emitChunk(channel, chunk, Date.now() - pendingMs, channel.ringPosition);
+      channel.ringPosition += chunkSize;
+    }
+  },
+
+  // Push raw binary frames to a loopback WebSocket sink instead of buffering
+  // base64 chunks for getAudioChunks(). Resolves false if the sink is unreachable.
+  connectSink: function (url, timeoutMs = 3000) {
+    return new Promise((resolve) => {
+      let settled = false;
+      const settle = (ok) => {
+        if (!settled) {
+          settled = true;
+          resolve(ok);
+        }
+      };
+
+      let socket;
+      try {
+        socket = new WebSocket(url);
+      } catch (error) {
+        this.log(`Could not open audio sink: ${error.message}`);
+        settle(false);
+        return;
+      }
+      socket.binaryType = "arraybuffer";
+
+      socket.onopen = () => {
+        this.sink = socket;
+        this.log("Connected to audio sink");
+        settle(true);
+      };
+      socket.onerror = () => settle(false);
+      socket.onclose = () => {
+        // fall back to buffering chunks for WebDriver polling
+        if (this.sink === socket) {
+          this.sink = null;
+          this.log("Audio sink closed, falling back to polling");
+        }
+        settle(false);
+      };
+      setTimeout(() => settle(false), timeoutMs);
+    });
+  },
+
+  // inputPosition is the index of the chunk's first sample at the AudioContext
+  // rate. A jump past the expected index is a gap: the output position skips
+  // ahead by the same duration so Python can fill it with silence.
+  _emitChunk: function (channel, audioData, timestamp, inputPosition) {
+    const contextRate = this.audioContext.sampleRate;
+    const inputLength = audioData.length;
+    let sampleRate = contextRate;
+    if (channel.resampler) {
+      audioData = channel.resampler.process(audioData);
+      sampleRate = this.config.sampleRate;
+    }
+
+    if (channel.expectedInput !== null && inputPosition > channel.expectedInput) {
+      const gap = Math.round(((inputPosition - channel.expectedInput) * sampleRate) / contextRate);
+      channel.position += gap;
+    }
+    channel.expectedInput = inputPosition + inputLength;
+    const seq = channel.seq++;
+    const position = channel.position;
+    channel.position += audioData.length;
+
+    const format = this.config.format === "int16" ? "int16" : "float32";
+    if (format === "int16") {
+      audioData = toInt16(audioData);
+    }
+
+    if (this.sink && this.sink.readyState === WebSocket.OPEN) {
+      // header: timestamp (float64), position (uint64), seq (uint32),
+      // sample rate (uint32), length (uint32), encoding (uint8), 1 byte
+      // padding, source id (uint16)
+      const frame = new ArrayBuffer(32 + audioData.byteLength);
+      const header = new DataView(frame, 0, 32);
+      header.setFloat64(0, timestamp, true);
+      header.setBigUint64(8, BigInt(position), true);
+      header.setUint32(16, seq, true);
+      header.setUint32(20, sampleRate, true);
+      header.setUint32(24, audioData.length, true);
+      header.setUint8(28, SAMPLE_FORMATS.indexOf(format));
+      header.setUint16(30, channel.sourceId, true);
+      new Uint8Array(frame, 32).set(
+        new Uint8Array(audioData.buffer, audioData.byteOffset, audioData.byteLength)
+      );
+      this.sink.send(frame);
+      return;
+    }
+
+    // Convert to base64 for easy transfer to Python
+    const bytes = new Uint8Array(audioData.buffer, audioData.byteOffset, audioData.byteLength);
+    const base64 = btoa(String.fromCharCode(...bytes));
+
+    // Store audio chunk with timestamp and its place on the source's timeline
+    this.audioChunks.push({
+      timestamp: timestamp,
+      sourceId: channel.sourceId,
+      seq: seq,
+      position: position,
+      data: base64,
+      sampleRate: sampleRate,
+      format: format,
+      length: audioData.length
+    });
+
+    // Limit buffer size to prevent memory issues; dropped chunks show up in
+    // Python as a seq/position gap, where CaptureTimeline counts them
+    while (this.audioChunks.length > this.config.maxBufferedChunks) {
+      this.audioChunks.shift();
+    }
   },
 
   stopCapture: function () {
+    this._drainAll();
     this.isCapturing = false;
-    if (this.recorder) {
-      this.recorder.disconnect();
-      this.recorder = null;
+    if (this.drainTimer) {
+      clearInterval(this.drainTimer);
+      this.drainTimer = null;
+    }
+    if (this.rescanTimer) {
+      clearInterval(this.rescanTimer);
+      this.rescanTimer = null;
+    }
+    if (this.sink) {
+      const sink = this.sink;
+      this.sink = null;
+      sink.close();
     }
+    Array.from(this.channels.keys()).forEach((sourceId) => this._closeChannel(sourceId));
+    this.trackSources.clear();
     if (this.audioContext) {
       this.audioContext.close();
       this.audioContext = null;
@@ -122,6 +608,7 @@ window.audioCapture = {
   },
 
   getAudioChunks: function (clearAfterGet = true) {
+    this._drainAll();
     const chunks = [...this.audioChunks];
     if (clearAfterGet) {
       this.audioChunks = [];
@@ -0,0 +1,201 @@
+import base64
+import hashlib
+import secrets
+import socket
+import struct
+import threading
+import numpy as np
+
+from typing import Callable
+
+
+# header prepended by audio_capture.js to every binary frame:
+# capture timestamp (ms, float64), timeline position (uint64), sequence
+# number (uint32), sample rate (uint32), sample count (uint32),
+# sample encoding (uint8, index into SAMPLE_FORMATS), 1 padding byte,
+# source id (uint16)
+FRAME_HEADER = struct.Struct("<dQIIIBxH")
+
+SAMPLE_FORMATS = ("float32", "int16")
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+_OP_CONTINUATION = 0x0
+_OP_BINARY = 0x2
+_OP_CLOSE = 0x8
+_OP_PING = 0x9
+_OP_PONG = 0xA
+
+
+class AudioSink:
+    """
+    Loopback WebSocket server that receives raw binary audio frames pushed by
+    the injected capture script, bypassing WebDriver polling entirely.
+    Only one connection (the bot's own page) is served at a time.
+    """
+
+    def __init__(
+        self,
+        id: str,
+        on_frame: Callable[[bytes], None],
+        host: str = "127.0.0.1",
+    ):
+        self.id = id
+        self.on_frame = on_frame
+        self.host = host
+        self.port = None
+
+        # random path so that no other page can push into this session
+        self.token = secrets.token_urlsafe(16)
+
+        self.connected = threading.Event()
+        self.frames_received = 0
+
+        self._server = None
+        self._conn = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}/{self.token}"
+
+    def start(self) -> str:
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind((self.host, 0))
+        self._server.listen(1)
+        self.port = self._server.getsockname()[1]
+
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+        print(f"[{self.id}] Audio sink listening on {self.host}:{self.port}")
+        return self.url
+
+    def stop(self):
+        self._stopped.set()
+        self.connected.clear()
+        for sock in (self._conn, self._server):
+            if sock is None:
+                continue
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1)
+
+    def _serve(self):
+        while not self._stopped.is_set():
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+
+            self._conn = conn
+            try:
+                if self._handshake(conn):
+                    self.connected.set()
+                    self._read_frames(conn)
+            except (OSError, ConnectionError):
+                pass
+            except Exception as e:
+                print(f"[{self.id}] Audio sink error: {e}")
+            finally:
+                self.connected.clear()
+                conn.close()
+                self._conn = None
+
+    def _handshake(self, conn: socket.socket) -> bool:
+        request = b""
+        while b"\r\n\r\n" not in request:
+            data = conn.recv(4096)
+            if not data or len(request) > 16384:
+                return False
+            request += data
+
+        lines = request.split(b"\r\n\r\n", 1)[0].decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        headers = {}
+        for line in lines[1:]:
+            key, _, value = line.partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        key = headers.get("sec-websocket-key")
+        if (
+            len(parts) < 2
+            or parts[1] != f"/{self.token}"
+            or headers.get("upgrade", "").lower() != "websocket"
+            or not key
+        ):
+            conn.sendall(b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n\r\n")
+            return False
+
+        accept = base64.b64encode(
+            hashlib.sha1((key + _WS_GUID).encode()).digest()
+        ).decode()
+        conn.sendall(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+            ).encode()
+        )
+        return True
+
+    def _read_frames(self, conn: socket.socket):
+        reader = conn.makefile("rb")
+        message = bytearray()
+
+        while not self._stopped.is_set():
+            header = reader.read(2)
+            if len(header) < 2:
+                return
+
+            fin = header[0] & 0x80
+            opcode = header[0] & 0x0F
+            masked = header[1] & 0x80
+            length = header[1] & 0x7F
+            if length == 126:
+                (length,) = struct.unpack("!H", reader.read(2))
+            elif length == 127:
+                (length,) = struct.unpack("!Q", reader.read(8))
+
+            mask = reader.read(4) if masked else None
+            payload = reader.read(length)
+            if len(payload) < length:
+                return
+            if mask:
+                payload = _unmask(payload, mask)
+
+            if opcode == _OP_CLOSE:
+                self._send(conn, _OP_CLOSE, payload[:2])
+                return
+            if opcode == _OP_PING:
+                self._send(conn, _OP_PONG, payload)
+                continue
+            if opcode not in (_OP_BINARY, _OP_CONTINUATION):
+                continue
+
+            message += payload
+            if fin:
+                self.frames_received += 1
+                self.on_frame(bytes(message))
+                message.clear()
+
+    def _send(self, conn: socket.socket, opcode: int, payload: bytes):
+        # server frames are never masked; control payloads are < 126 bytes
+        conn.sendall(bytes([0x80 | opcode, len(payload)]) + payload)
+
+
+def _unmask(payload: bytes, mask: bytes) -> bytes:
+    data = np.frombuffer(payload, dtype=np.uint8).copy()
+    key = np.frombuffer(mask, dtype=np.uint8)
+
+    # xor four bytes at a time, then the remaining tail
+    words = len(data) // 4
+    data[: words * 4].view(np.uint32)[:] ^= key.view(np.uint32)[0]
+    data[words * 4 :] ^= key[: len(data) - words * 4]
+    return data.tobytes()
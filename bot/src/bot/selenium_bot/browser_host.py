@@ -0,0 +1,315 @@
+import os
+import threading
+import uuid
+
+from typing import Any, Callable
+
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    WebDriverException,
+)
+
+
+class BrowserHost:
+    """
+    One Chromium instance shared by several bot sessions, each in its own tab.
+
+    WebDriver has a single "current window" per browser, so every command from
+    a session goes through the host lock and switches to the session's tab
+    first (see TabDriver). Tabs are opened in separate browser contexts where
+    Chrome supports it, so sessions do not share cookies or storage.
+    """
+
+    def __init__(self, driver, capacity: int):
+        self.id = uuid.uuid4().hex[:8]
+        self.driver = driver
+        self.capacity = capacity
+        self.lock = threading.RLock()
+
+        # the first tab stays open on about:blank so closing the last session
+        # tab never ends the WebDriver session
+        self.home_handle = driver.current_window_handle
+        self.current_handle = self.home_handle
+        self.tabs: dict[str, "TabDriver"] = {}
+        # slots promised to sessions whose tab is still being opened
+        self.reserved = 0
+        self.alive = True
+
+    @property
+    def free_slots(self) -> int:
+        return self.capacity - len(self.tabs) - self.reserved
+
+    def open_tab(self, session_id: str) -> "TabDriver":
+        with self.lock:
+            before = set(self.driver.window_handles)
+            context_id = None
+            try:
+                context_id = self.driver.execute_cdp_cmd(
+                    "Target.createBrowserContext", {"disposeOnDetach": True}
+                )["browserContextId"]
+                self.driver.execute_cdp_cmd(
+                    "Target.createTarget",
+                    {"url": "about:blank", "browserContextId": context_id},
+                )
+            except Exception as e:
+                # no isolated contexts, fall back to a plain tab
+                print(f"[host {self.id}] Browser context unavailable ({e}), using tab")
+                context_id = None
+                self.driver.switch_to.new_window("tab")
+
+            handle = (set(self.driver.window_handles) - before).pop()
+            self.activate(handle)
+            # allow the capture script to load its AudioWorklet from a blob: URL
+            self.driver.execute_cdp_cmd("Page.setBypassCSP", {"enabled": True})
+
+            tab = TabDriver(self, session_id, handle, context_id)
+            self.tabs[handle] = tab
+            print(f"[host {self.id}] Opened tab for {session_id} ({len(self.tabs)}/{self.capacity})")
+            return tab
+
+    def close_tab(self, tab: "TabDriver"):
+        with self.lock:
+            self.tabs.pop(tab.handle, None)
+            try:
+                if tab.handle in self.driver.window_handles:
+                    self.activate(tab.handle)
+                    self.driver.close()
+                if tab.context_id:
+                    self.driver.switch_to.window(self.home_handle)
+                    self.driver.execute_cdp_cmd(
+                        "Target.disposeBrowserContext",
+                        {"browserContextId": tab.context_id},
+                    )
+            except WebDriverException as e:
+                self._check_alive(e)
+                print(f"[host {self.id}] Error closing tab of {tab.session_id}: {e}")
+            finally:
+                self.current_handle = None
+            print(f"[host {self.id}] Closed tab for {tab.session_id}")
+
+    def activate(self, handle: str):
+        if self.current_handle != handle:
+            self.driver.switch_to.window(handle)
+            self.current_handle = handle
+
+    def quit(self):
+        with self.lock:
+            self.alive = False
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"[host {self.id}] Error quitting browser: {e}")
+
+    def browser_pid(self) -> int | None:
+        return getattr(self.driver, "browser_pid", None)
+
+    def _check_alive(self, error: Exception):
+        # a crashed tab only breaks its own session, a dead browser breaks all
+        if isinstance(error, InvalidSessionIdException) or "not reachable" in str(
+            error
+        ):
+            self.alive = False
+
+
+class TabDriver:
+    """
+    WebDriver stand-in bound to one tab of a BrowserHost. Attribute access is
+    forwarded to the shared driver after switching to this tab, and returned
+    elements are wrapped so that later calls on them switch back as well.
+    """
+
+    def __init__(self, host: BrowserHost, session_id: str, handle: str, context_id):
+        self._host = host
+        self.session_id = session_id
+        self.handle = handle
+        self.context_id = context_id
+        self.closed = False
+
+    def __getattr__(self, name: str):
+        return self._host_call(getattr, self._host.driver, name)
+
+    def get(self, url: str):
+        # navigate without waiting for the load under the host lock, callers
+        # wait for the elements they need anyway
+        self.execute_script("window.location.href = arguments[0];", url)
+
+    def quit(self):
+        if not self.closed:
+            self.closed = True
+            self._host.close_tab(self)
+
+    def _host_call(self, func: Callable, *args, **kwargs):
+        if self.closed:
+            raise NoSuchWindowException(f"Tab of {self.session_id} is closed")
+
+        with self._host.lock:
+            try:
+                self._host.activate(self.handle)
+                result = func(*args, **kwargs)
+            except WebDriverException as e:
+                self._host._check_alive(e)
+                raise
+
+        if callable(result) and not isinstance(result, (WebElement, type)):
+            return lambda *a, **kw: self._host_call(result, *a, **kw)
+        return self._wrap(result)
+
+    def _wrap(self, result: Any):
+        if isinstance(result, WebElement):
+            return _TabElement(self, result)
+        if isinstance(result, list) and result and isinstance(result[0], WebElement):
+            return [_TabElement(self, element) for element in result]
+        return result
+
+
+class _TabElement:
+    def __init__(self, tab: TabDriver, element: WebElement):
+        self._tab = tab
+        self._element = element
+
+    def __getattr__(self, name: str):
+        return self._tab._host_call(getattr, self._element, name)
+
+
+class _Launch:
+    """
+    A shared browser still starting up, with the slots already promised on it.
+    """
+
+    def __init__(self, capacity: int):
+        self.free_slots = capacity
+        self.done = threading.Event()
+        self.host: BrowserHost | None = None
+        self.error: Exception | None = None
+
+
+class BrowserHostManager:
+    """
+    Places bot sessions into shared browsers, sessions_per_browser at a time.
+    Exposes acquire() like DriverPool so a Bot can take its driver from
+    either. Browsers that died are dropped and replaced on the next acquire.
+
+    The manager lock only guards the bookkeeping: slots are reserved under it,
+    while browsers are launched and tabs opened outside of it, so a slow
+    launch holds up neither sessions placed on other browsers nor the reaper.
+    """
+
+    def __init__(self, factory: Callable[[], Any], sessions_per_browser: int = 4):
+        self.factory = factory
+        self.sessions_per_browser = sessions_per_browser
+        self.hosts: list[BrowserHost] = []
+        self._launches: list[_Launch] = []
+        self._lock = threading.Lock()
+
+    def acquire(self, session_id: str | None = None) -> TabDriver:
+        session_id = session_id or uuid.uuid4().hex[:8]
+        launch, launching = None, False
+        with self._lock:
+            dead = [h for h in self.hosts if not h.alive]
+            for host in dead:
+                self.hosts.remove(host)
+
+            host = next((h for h in self.hosts if h.free_slots > 0), None)
+            if host is not None:
+                host.reserved += 1
+            else:
+                # share a browser that is already starting before launching one
+                launch = next((p for p in self._launches if p.free_slots > 0), None)
+                if launch is None:
+                    launch, launching = _Launch(self.sessions_per_browser), True
+                    self._launches.append(launch)
+                launch.free_slots -= 1
+
+        for dead_host in dead:
+            dead_host.quit()
+        if launching:
+            host = self._launch(launch)
+        elif launch is not None:
+            launch.done.wait()
+            if launch.error is not None:
+                raise launch.error
+            host = launch.host
+
+        try:
+            return host.open_tab(session_id)
+        finally:
+            with self._lock:
+                host.reserved -= 1
+
+    def _launch(self, launch: _Launch) -> BrowserHost:
+        try:
+            host = BrowserHost(self.factory(), self.sessions_per_browser)
+        except Exception as e:
+            launch.error = e
+            raise
+        else:
+            print(f"[host {host.id}] Launched shared browser")
+            launch.host = host
+            return host
+        finally:
+            with self._lock:
+                self._launches.remove(launch)
+                if launch.host is not None:
+                    launch.host.reserved = self.sessions_per_browser - launch.free_slots
+                    self.hosts.append(launch.host)
+            launch.done.set()
+
+    def release_idle(self):
+        """
+        Quits shared browsers that no longer have any open or opening session.
+        """
+        with self._lock:
+            idle = [
+                h for h in self.hosts if not h.alive or not (h.tabs or h.reserved)
+            ]
+            for host in idle:
+                self.hosts.remove(host)
+        for host in idle:
+            host.quit()
+
+    def stop(self):
+        with self._lock:
+            hosts, self.hosts = self.hosts, []
+        for host in hosts:
+            host.quit()
+
+    def memory_report(self) -> dict:
+        """
+        Resident memory of every shared browser and per session on it.
+        """
+        report = {}
+        with self._lock:
+            for host in self.hosts:
+                pid = host.browser_pid()
+                rss = process_tree_rss(pid) if pid else 0
+                sessions = len(host.tabs)
+                report[host.id] = {
+                    "sessions": sessions,
+                    "rss_bytes": rss,
+                    "rss_per_session": rss // sessions if sessions else rss,
+                }
+        return report
+
+
+def process_tree_rss(pid: int) -> int:
+    """
+    Sum of VmRSS over a process and all of its descendants (Linux only).
+    """
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            continue
+    return total
@@ -0,0 +1,161 @@
+import collections
+import threading
+import time
+
+from typing import Any, Callable
+
+
+class DriverPool:
+    """
+    Keeps a number of launched, idle Chrome drivers parked on a blank page so
+    that a new Bot does not pay for a full browser launch when joining.
+
+    Drivers are handed out once and never returned: the Bot quits its driver
+    when it leaves, and a background thread launches replacements. Idle
+    drivers are health-checked periodically and recycled after max_idle.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = 2,
+        max_idle: float = 600.0,
+        health_check_interval: float = 30.0,
+    ):
+        self.factory = factory
+        self.size = size
+        self.max_idle = max_idle  # seconds
+        self.health_check_interval = health_check_interval  # seconds
+
+        self._idle = collections.deque()  # (driver, idle since)
+        self._launching = 0
+        self._cond = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread = None
+
+        self.stats = {
+            "launched": 0,
+            "launch_failures": 0,
+            "acquired_warm": 0,
+            "acquired_cold": 0,
+            "recycled": 0,
+            "unhealthy": 0,
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self._maintain, daemon=True)
+        self._thread.start()
+        print(f"Driver pool started with {self.size} drivers.")
+
+    def stop(self):
+        self._stopped.set()
+        with self._cond:
+            self._cond.notify_all()
+            idle = [driver for driver, _ in self._idle]
+            self._idle.clear()
+        for driver in idle:
+            self._quit(driver)
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def idle_count(self) -> int:
+        with self._cond:
+            return len(self._idle)
+
+    def acquire(self):
+        """
+        Returns a ready driver, launching one on the spot if none is idle.
+        """
+        while True:
+            with self._cond:
+                if not self._idle:
+                    break
+                driver, _ = self._idle.popleft()
+                self._cond.notify_all()  # wake the maintainer to replenish
+
+            if self._is_healthy(driver):
+                self.stats["acquired_warm"] += 1
+                return driver
+            self.stats["unhealthy"] += 1
+            self._quit(driver)
+
+        self.stats["acquired_cold"] += 1
+        driver = self.factory()
+        self.stats["launched"] += 1
+        return driver
+
+    def _maintain(self):
+        last_check = time.monotonic()
+        while not self._stopped.is_set():
+            with self._cond:
+                missing = self.size - len(self._idle) - self._launching
+                if missing > 0:
+                    self._launching += 1
+
+            if missing > 0:
+                self._launch()
+                continue
+
+            if time.monotonic() - last_check >= self.health_check_interval:
+                self._check_idle()
+                last_check = time.monotonic()
+                continue
+
+            with self._cond:
+                self._cond.wait(timeout=self.health_check_interval)
+
+    def _launch(self):
+        try:
+            driver = self.factory()
+            driver.get("about:blank")
+        except Exception as e:
+            self.stats["launch_failures"] += 1
+            print(f"Driver pool failed to launch a driver: {e}")
+            with self._cond:
+                self._launching -= 1
+            # back off instead of spinning on a broken browser install
+            self._stopped.wait(timeout=5)
+            return
+
+        self.stats["launched"] += 1
+        with self._cond:
+            self._launching -= 1
+            if self._stopped.is_set():
+                stopped = True
+            else:
+                stopped = False
+                self._idle.append((driver, time.monotonic()))
+        if stopped:
+            self._quit(driver)
+
+    def _check_idle(self):
+        with self._cond:
+            idle = list(self._idle)
+
+        now = time.monotonic()
+        for entry in idle:
+            driver, since = entry
+            # long-lived browsers bloat, replace them
+            expired = now - since > self.max_idle
+            if not expired and self._is_healthy(driver):
+                continue
+
+            with self._cond:
+                if entry not in self._idle:
+                    continue  # handed out in the meantime
+                self._idle.remove(entry)
+
+            self.stats["recycled" if expired else "unhealthy"] += 1
+            self._quit(driver)
+
+    def _is_healthy(self, driver) -> bool:
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Driver pool failed to quit a driver: {e}")
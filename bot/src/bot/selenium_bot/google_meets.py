@@ -1,7 +1,24 @@
 from bot.config import (
     BROWSER_EXECUTABLE,
     DRIVER_EXECUTABLE,
+    AUDIO_TRANSPORT,
+    CAPTURE_ENGINE,
+    CAPTURE_CHUNK_SIZE,
+    CAPTURE_RING_BUFFER_SIZE,
+    CAPTURE_SAMPLE_RATE,
+    CAPTURE_FORMAT,
+    CAPTURE_MODE,
+    CAPTURE_POLL_INTERVAL_MIN,
+    CAPTURE_POLL_INTERVAL_MAX,
+    JOIN_ADMITTED_TIMEOUT,
 )
+from bot.selenium_bot.audio_sink import AudioSink, FRAME_HEADER, SAMPLE_FORMATS
+from bot.selenium_bot.driver_pool import DriverPool
+from bot.selenium_bot.browser_host import BrowserHostManager, TabDriver
+from bot.selenium_bot.join_flow import JoinFlow, join_latency
+from bot.audio.timeline import CaptureTimeline
+from bot.audio.channel import AudioChannel
+from bot.audio.spool import AudioSpool
 
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
@@ -11,11 +28,37 @@ from selenium.common.exceptions import TimeoutException
 
 import time
 import os
-import queue
+import collections
 import threading
 import numpy as np
 import base64
 import traceback
+from typing import Callable
+
+
+def create_driver():
+    options = uc.ChromeOptions()
+    options.add_argument("--disable-web-security")
+    options.add_argument("--allow-running-insecure-content")
+    options.add_argument("--autoplay-policy=no-user-gesture-required")
+    options.add_argument("--mute-audio")
+    # keep capture timers running in background tabs (see browser_host.py)
+    options.add_argument("--disable-background-timer-throttling")
+    options.add_argument("--disable-renderer-backgrounding")
+    options.add_argument("--disable-backgrounding-occluded-windows")
+
+    options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+
+    driver = uc.Chrome(
+        options=options,
+        browser_executable_path=BROWSER_EXECUTABLE,
+        driver_executable_path=DRIVER_EXECUTABLE,
+        headless=False,  # Google Meets blocks headless browsers
+    )
+    # allow the capture script to load its AudioWorklet from a blob: URL
+    driver.execute_cdp_cmd("Page.setBypassCSP", {"enabled": True})
+
+    return driver
 
 
 class Bot:
@@ -24,116 +67,185 @@ class Bot:
         id: str,
         name: str,
         meeting_link: str,
-        audio_queue: queue.Queue,
+        audio_queue: AudioChannel,
         pending: threading.Event,
         joined: threading.Event,
         running: threading.Event,
+        driver_pool: DriverPool | BrowserHostManager | None = None,
+        spool: AudioSpool | None = None,
+        on_roster: Callable[[list[str]], None] | None = None,
     ):
         self.meeting_link = meeting_link
         self.id = id
         self.bot_name = name
 
+        # duration of each join phase in seconds
+        self.timings: dict[str, float] = {}
+
+        self.driver_pool = driver_pool
+        start = time.monotonic()
         self.driver = self._setup_driver()
-        self.timeout = 60  # seconds
+        self.timings["driver_setup"] = time.monotonic() - start
+        # seconds to be admitted, the same bound the server puts on the join
+        self.timeout = JOIN_ADMITTED_TIMEOUT
+        self.join_flow = None
 
         self.audio_capture_started = False
         self.audio_queue = audio_queue
+        self.audio_sink = None
+        self.spool = spool  # optional copy of the audio on disk, for replay
+        self.timelines: dict[int, CaptureTimeline] = {}  # per audio source
+        self._timeline_lock = threading.Lock()
+
+        # WebDriver polling adapts to the backlog, see _next_poll_interval
+        self.poll_interval = CAPTURE_POLL_INTERVAL_MAX
+        self.poll_stats = {
+            "polls": 0,
+            "chunks": 0,
+            "samples": 0,
+            "decode_seconds": 0.0,
+            "max_chunks": 0,
+        }
+        self._recent_polls = collections.deque(maxlen=100)  # (chunks, decode s)
+
+        # participant names kept up to date by roster_tracker.js, refreshed
+        # from the capture loop; roster_version is None until it is injected
+        # or when it is unavailable, the loop then queries the DOM instead
+        self.roster: list[str] = []
+        self.roster_version = None
+        self.roster_refresh_interval = 1.0  # seconds
+        self._roster_refreshed = 0.0
+        self.on_roster = on_roster  # called with the new roster when it changes
 
         self.pending = pending
         self.joined = joined
         self.running = running
 
+    # take a pre-warmed driver from the pool, or a tab in a shared browser
     def _setup_driver(self):
-        options = uc.ChromeOptions()
-        options.add_argument("--disable-web-security")
-        options.add_argument("--allow-running-insecure-content")
-        options.add_argument("--autoplay-policy=no-user-gesture-required")
-        options.add_argument("--mute-audio")
-
-        options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
-
-        driver = uc.Chrome(
-            options=options,
-            browser_executable_path=BROWSER_EXECUTABLE,
-            driver_executable_path=DRIVER_EXECUTABLE,
-            headless=False,  # Google Meets blocks headless browsers
-        )
-
-        return driver
+        if self.driver_pool is not None:
+            return self.driver_pool.acquire()
+        return create_driver()
 
     def join_meeting(self):
         self.running.set()
         self.pending.clear()
         self.joined.clear()
 
-        self.driver.get(self.meeting_link)
-
         print(f"[{self.id}] Joining meeting {self.meeting_link} as {self.bot_name}...")
 
+        self.join_flow = JoinFlow(
+            self.driver,
+            self.bot_name,
+            on_pending=self._on_join_requested,
+            admission_timeout=self.timeout,
+        )
         try:
-            try:
-                # disable microphone and camera
-                disable_dev_button = WebDriverWait(self.driver, 15).until(
-                    EC.element_to_be_clickable(
-                        (By.CSS_SELECTOR, "button[jsname='IbE0S']")
-                    )
-                )
-                disable_dev_button.click()
-            except TimeoutException:
-                pass
-
-            time.sleep(0.5)
-
-            # enter bot name
-            name_box = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "input[jsname='YPqjbf']")
-                )
-            )
-            name_box.send_keys(self.bot_name)
-            time.sleep(0.5)
-
-            # request to join
-            join_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(
-                    (By.XPATH, "//span[contains(text(), 'Ask to join')]")
-                )
-            )
-            join_button.click()
-            self.pending.set()  # waiting to join
-
+            self.join_flow.run(self.meeting_link)
         except TimeoutException as e:
+            if self.pending.is_set():
+                raise TimeoutException(
+                    f"Timed out waiting for the meeting to start: {e}."
+                )
             raise TimeoutException(f"Failed to join meeting: {e}.")
         except Exception as e:
             raise Exception(f"An error occurred while trying to join the meeting: {e}")
+        finally:
+            self.timings.update(self.join_flow.steps)
 
+        join_latency.record(self.timings)
+        self.pending.clear()
+        self.joined.set()
+        print(f"[{self.id}] Successfully joined the meeting!")
+        print(f"[{self.id}] Join timings: {self._format_timings()}")
+
+    def _on_join_requested(self):
+        self.pending.set()  # waiting to join
         print(f"[{self.id}] Requested to join meeting...")
 
-        try:
-            # check if entered meeting
-            WebDriverWait(self.driver, self.timeout).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//button[@aria-label='Leave call']")
-                )
-            )
+    # timestamped join transitions so far, for the JoinMeeting status stream
+    def get_join_steps(self) -> list[tuple[str, float, float]]:
+        if self.join_flow is None:
+            return []
+        return [
+            (state.value, reached_at, duration)
+            for state, reached_at, duration in list(self.join_flow.transitions)
+        ]
+
+    # Chrome and chromedriver processes of this session, none for a tab of a
+    # shared browser
+    def get_process_ids(self) -> list[int]:
+        if self.driver is None or isinstance(self.driver, TabDriver):
+            return []
+        pids = []
+        for get in (
+            lambda: self.driver.browser_pid,
+            lambda: self.driver.service.process.pid,
+        ):
+            try:
+                pid = get()
+            except AttributeError:
+                continue
+            if isinstance(pid, int):
+                pids.append(pid)
+        return pids
 
-            self.pending.clear()
-            self.joined.set()
-            print(f"[{self.id}] Successfully joined the meeting!")
-        except TimeoutException as e:
-            raise TimeoutException(f"Timed out waiting for the meeting to start: {e}.")
+    def _format_timings(self) -> str:
+        return ", ".join(f"{k}={v * 1000:.0f}ms" for k, v in self.timings.items())
 
     def get_participants(self) -> list[str]:
+        # cached snapshot, never touches the driver
+        return list(self.roster)
+
+    # one DOM query without waiting, when the roster tracker is unavailable
+    def _query_roster(self) -> list[str]:
+        participantElems = self.driver.find_elements(
+            By.XPATH, "//div[@jsname='giiMnc']//span[@class='notranslate']"
+        )
+        return [elem.text.strip() for elem in participantElems if elem.text]
+
+    def _set_roster(self, participants: list[str]):
+        if participants == self.roster:
+            return
+        self.roster = participants
+        if self.on_roster is not None:
+            self.on_roster(list(participants))
+
+    # watch the participant panel from inside the page
+    def _start_roster_tracker(self):
+        script_path = os.path.join(os.path.dirname(__file__), "roster_tracker.js")
+        script = open(script_path, "r").read()
+
         try:
-            participantElems = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located(
-                    (By.XPATH, "//div[@jsname='giiMnc']//span[@class='notranslate']")
-                )
-            )
+            self.driver.execute_script(script + "\nreturn window.rosterTracker.start();")
+            self.roster_version = -1
+            self._refresh_roster()
+        except Exception as e:
+            # get_participants keeps querying the DOM directly
+            print(f"[{self.id}] Roster tracker unavailable: {e}")
+            self.roster_version = None
+
+    # one round trip, the list itself is only transferred when it changed
+    def _refresh_roster(self):
+        self._roster_refreshed = time.monotonic()
+        snapshot = self.driver.execute_script(
+            "return window.rosterTracker.snapshot(arguments[0]);", self.roster_version
+        )
+        if snapshot and "participants" in snapshot:
+            self.roster_version = snapshot["version"]
+            self._set_roster(snapshot["participants"])
 
-            return [elem.text.strip() for elem in participantElems if elem.text]
+    def _refresh_roster_if_due(self):
+        if time.monotonic() - self._roster_refreshed < self.roster_refresh_interval:
+            return
+        try:
+            if self.roster_version is None:
+                self._roster_refreshed = time.monotonic()
+                self._set_roster(self._query_roster())
+            else:
+                self._refresh_roster()
         except Exception as e:
-            raise Exception(f"Error retrieving participants: {e}")
+            print(f"[{self.id}] Error refreshing roster: {e}")
 
     # inject script into browser
     def _inject_audio_capture_script(self):
@@ -142,6 +254,23 @@ class Bot:
 
         self.driver.execute_script(script)
 
+    # pass capture settings to the injected script
+    def _configure_audio_capture(self):
+        options = {
+            "engine": CAPTURE_ENGINE,
+            "chunkSize": CAPTURE_CHUNK_SIZE,
+            "ringBufferSize": CAPTURE_RING_BUFFER_SIZE,
+            "sampleRate": CAPTURE_SAMPLE_RATE,
+            "format": CAPTURE_FORMAT,
+            "mode": CAPTURE_MODE,
+        }
+        try:
+            self.driver.execute_script(
+                "return window.audioCapture.configure(arguments[0]);", options
+            )
+        except Exception as e:
+            raise Exception(f"Error configuring audio capture: {e}")
+
     # execute injected script
     def _start_audio_capture(self):
         try:
@@ -159,6 +288,59 @@ class Bot:
             self.audio_capture_started = False
             raise Exception(f"Error starting audio capture: {e}")
 
+    # open a loopback sink for the capture script to push binary frames into
+    def _start_audio_sink(self):
+        sink = AudioSink(self.id, self._on_audio_frame)
+        url = sink.start()
+        try:
+            connected = self.driver.execute_script(
+                "return window.audioCapture.connectSink(arguments[0]);", url
+            )
+        except Exception as e:
+            print(f"[{self.id}] Error connecting audio sink: {e}")
+            connected = False
+
+        if not connected:
+            print(f"[{self.id}] Audio sink unavailable, falling back to polling")
+            sink.stop()
+            return
+
+        sink.connected.wait(timeout=1)
+        self.audio_sink = sink
+        print(f"[{self.id}] Audio sink connected")
+
+    def _stop_audio_sink(self):
+        if self.audio_sink is not None:
+            self.audio_sink.stop()
+            self.audio_sink = None
+
+    # called on the sink thread for every binary frame
+    def _on_audio_frame(self, frame: bytes):
+        self._enqueue_audio(self._decode_audio_frame(frame))
+
+    # align a decoded chunk on the capture timeline and queue it, with silence
+    # in front of it if audio was lost since the previous chunk
+    def _enqueue_audio(self, decoded: dict):
+        with self._timeline_lock:
+            source_id = decoded.get("source_id", 0)
+            timeline = self.timelines.get(source_id)
+            if timeline is None:
+                timeline = self.timelines[source_id] = CaptureTimeline()
+
+            for chunk in timeline.push(decoded):
+                self.audio_queue.put(chunk)
+                if self.spool is not None:
+                    self.spool.append(chunk)
+
+    # drop/gap counters for this session, summed over all audio sources
+    def get_capture_stats(self) -> dict:
+        with self._timeline_lock:
+            stats = {"sources": len(self.timelines)}
+            for timeline in self.timelines.values():
+                for key, value in timeline.stats().items():
+                    stats[key] = stats.get(key, 0) + value
+            return stats
+
     def _get_audio_chunks(self):
         try:
             chunks = self.driver.execute_script(
@@ -177,22 +359,92 @@ class Bot:
 
     def _decode_audio_chunk(self, chunk):
         try:
+            sample_format = chunk.get("format", "float32")
+            if sample_format not in SAMPLE_FORMATS:
+                raise ValueError(f"unsupported sample format {sample_format}")
+
             # Decode base64 to bytes
             audio_bytes = base64.b64decode(chunk["data"])
-            # Convert bytes back to float32 array
-            audio_array = np.frombuffer(audio_bytes, dtype=np.float32)
+            # Convert bytes back to a float32 or int16 array
+            audio_array = np.frombuffer(audio_bytes, dtype=sample_format)
             return {
                 "timestamp": chunk["timestamp"],
+                "source_id": chunk.get("sourceId", 0),
+                "seq": chunk.get("seq"),
+                "position": chunk.get("position"),
                 "audio_data": audio_array,
                 "sample_rate": chunk["sampleRate"],
+                "format": sample_format,
                 "length": chunk["length"],
             }
         except Exception as e:
             raise Exception(f"Error decoding audio chunk: {e}")
 
+    # poll again sooner while chunks pile up in the page, back off when idle
+    def _next_poll_interval(self, chunk_count: int) -> float:
+        if chunk_count > 1:
+            self.poll_interval /= chunk_count
+        elif chunk_count == 0:
+            self.poll_interval *= 1.5
+        self.poll_interval = min(
+            max(self.poll_interval, CAPTURE_POLL_INTERVAL_MIN),
+            CAPTURE_POLL_INTERVAL_MAX,
+        )
+        return self.poll_interval
+
+    def _record_poll(self, chunk_count: int, samples: int, decode_seconds: float):
+        stats = self.poll_stats
+        stats["polls"] += 1
+        stats["chunks"] += chunk_count
+        stats["samples"] += samples
+        stats["decode_seconds"] += decode_seconds
+        stats["max_chunks"] = max(stats["max_chunks"], chunk_count)
+        self._recent_polls.append((chunk_count, decode_seconds))
+
+    # chunks per poll and decode time, totals and over the last 100 polls
+    def get_poll_stats(self) -> dict:
+        stats = dict(self.poll_stats)
+        stats["interval"] = self.poll_interval
+        recent = list(self._recent_polls)
+        if recent:
+            counts, decode = zip(*recent)
+            stats["recent_chunks_per_poll"] = sum(counts) / len(recent)
+            stats["recent_decode_ms"] = sum(decode) * 1000 / len(recent)
+            stats["recent_max_decode_ms"] = max(decode) * 1000
+        return stats
+
+    def _decode_audio_frame(self, frame: bytes):
+        try:
+            timestamp, position, seq, sample_rate, length, encoding, source_id = (
+                FRAME_HEADER.unpack_from(frame)
+            )
+            sample_format = SAMPLE_FORMATS[encoding]
+            audio_array = np.frombuffer(
+                frame, dtype=sample_format, count=length, offset=FRAME_HEADER.size
+            )
+            return {
+                "timestamp": timestamp,
+                "source_id": source_id,
+                "seq": seq,
+                "position": position,
+                "audio_data": audio_array,
+                "sample_rate": sample_rate,
+                "format": sample_format,
+                "length": length,
+            }
+        except Exception as e:
+            raise Exception(f"Error decoding audio frame: {e}")
+
     def _cleanup(self):
         if self.audio_capture_started:
             self._stop_audio_capture()
+        self._stop_audio_sink()
+        print(f"[{self.id}] Capture stats: {self.get_capture_stats()}")
+        if self.poll_stats["polls"]:
+            print(f"[{self.id}] Poll stats: {self.get_poll_stats()}")
+        if self.spool is not None:
+            print(f"[{self.id}] Spool stats: {self.spool.stats()}")
+            self.spool.close()
 
         try:
             try:
@@ -214,10 +466,11 @@ class Bot:
             leave_button.click()
             self.joined.clear()
             print(f"[{self.id}] Successfully left the meeting.")
-
-            self.driver.quit()
         except TimeoutException:
             raise TimeoutException("Failed to leave the meeting: Timeout occurred.")
+        finally:
+            # also when leaving failed, a shared browser has no pids to kill
+            self.driver.quit()
 
     def execute(self):
         # retrieves audio in real-time via Web Audio API
@@ -225,19 +478,36 @@ class Bot:
             print(f"[{self.id}] Starting bot {self.bot_name}...")
             self.join_meeting()
             print(f"[{self.id}] Bot {self.bot_name} has joined the meeting.")
+            self._start_roster_tracker()
             print(f"[{self.id}] Starting audio capture script...")
             self._inject_audio_capture_script()
+            self._configure_audio_capture()
+            if AUDIO_TRANSPORT == "websocket":
+                self._start_audio_sink()
             self._start_audio_capture()
 
             while self.running.is_set():
+                self._refresh_roster_if_due()
+
+                if self.audio_sink is not None and self.audio_sink.connected.is_set():
+                    # frames are pushed straight into the queue by the sink
+                    time.sleep(0.1)
+                    continue
+
                 chunks = self._get_audio_chunks()
                 if chunks:
-                    for chunk in chunks:
-                        decoded = self._decode_audio_chunk(chunk)
-                        audio_data = decoded["audio_data"]
-                        self.audio_queue.put_nowait(audio_data)
+                    start = time.perf_counter()
+                    decoded = [self._decode_audio_chunk(chunk) for chunk in chunks]
+                    decode_seconds = time.perf_counter() - start
+                    for block in decoded:
+                        self._enqueue_audio(block)
+                    self._record_poll(
+                        len(chunks), sum(d["length"] for d in decoded), decode_seconds
+                    )
+                else:
+                    self._record_poll(0, 0, 0.0)
 
-                time.sleep(0.1)
+                time.sleep(self._next_poll_interval(len(chunks)))
 
         except Exception as e:
             traceback.print_exc()
@@ -0,0 +1,199 @@
+import collections
+import enum
+import threading
+import time
+
+import numpy as np
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from bot.livekit_streamer.latency import LatencyHistogram
+
+
+# upper bounds in ms of the join step buckets
+JOIN_STEP_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000)
+
+
+class JoinState(enum.Enum):
+    PAGE_LOAD = "page_load"
+    DEVICE_PROMPT = "device_prompt"
+    NAME_ENTRY = "name_entry"
+    ASK_TO_JOIN = "ask_to_join"
+    ADMITTED = "admitted"
+
+
+# what identifies each screen of the Meet pre-join flow
+SCREENS = {
+    JoinState.DEVICE_PROMPT: EC.element_to_be_clickable(
+        (By.CSS_SELECTOR, "button[jsname='IbE0S']")
+    ),
+    JoinState.NAME_ENTRY: EC.element_to_be_clickable(
+        (By.CSS_SELECTOR, "input[jsname='YPqjbf']")
+    ),
+    JoinState.ASK_TO_JOIN: EC.element_to_be_clickable(
+        (By.XPATH, "//span[contains(text(), 'Ask to join')]")
+    ),
+    JoinState.ADMITTED: EC.presence_of_element_located(
+        (By.XPATH, "//button[@aria-label='Leave call']")
+    ),
+}
+
+
+class JoinFlow:
+    """
+    Drives the Meet join flow as a state machine.
+
+    From each state it waits for whichever of the screens that may come next
+    shows up first, handles it and moves on, so optional screens (the device
+    prompt) cost nothing when they are absent and no step waits longer than
+    the page needs. Every transition is timestamped; steps holds the time
+    spent reaching each state.
+    """
+
+    poll_frequency = 0.1  # seconds
+
+    def __init__(
+        self,
+        driver,
+        name: str,
+        on_pending=None,
+        step_timeout: float = 15.0,
+        admission_timeout: float = 60.0,
+    ):
+        self.driver = driver
+        self.name = name
+        self.on_pending = on_pending
+        self.step_timeout = step_timeout  # seconds, per pre-join screen
+        self.admission_timeout = admission_timeout  # seconds
+
+        self.state = None
+        self.visited: set[JoinState] = set()
+        # (state, reached at in ms since epoch, seconds it took to get there)
+        self.transitions: list[tuple[JoinState, float, float]] = []
+        self._entered = None
+
+    @property
+    def steps(self) -> dict[str, float]:
+        return {state.value: duration for state, _, duration in self.transitions}
+
+    def run(self, meeting_link: str):
+        self._entered = time.monotonic()
+        self.driver.get(meeting_link)
+        self._transition(JoinState.PAGE_LOAD)
+
+        while self.state != JoinState.ADMITTED:
+            candidates = self._next_states()
+            timeout = (
+                self.admission_timeout
+                if candidates == [JoinState.ADMITTED]
+                else self.step_timeout
+            )
+            try:
+                state, element = WebDriverWait(
+                    self.driver, timeout, poll_frequency=self.poll_frequency
+                ).until(_first_of(candidates))
+            except TimeoutException:
+                waiting = ", ".join(s.value for s in candidates)
+                raise TimeoutException(
+                    f"Stuck in {self.state.value}, waited {timeout}s for {waiting}"
+                )
+
+            self._handle(state, element)
+            self._transition(state)
+
+    def _next_states(self) -> list[JoinState]:
+        if JoinState.ASK_TO_JOIN in self.visited:
+            return [JoinState.ADMITTED]
+
+        # the device prompt comes first since it overlays the other screens
+        states = [
+            s
+            for s in (JoinState.DEVICE_PROMPT, JoinState.NAME_ENTRY)
+            if s not in self.visited
+        ]
+        if JoinState.NAME_ENTRY in self.visited:
+            states.append(JoinState.ASK_TO_JOIN)
+        return states
+
+    def _handle(self, state: JoinState, element):
+        if state == JoinState.DEVICE_PROMPT:
+            # disable microphone and camera
+            element.click()
+        elif state == JoinState.NAME_ENTRY:
+            element.send_keys(self.name)
+        elif state == JoinState.ASK_TO_JOIN:
+            element.click()
+            if self.on_pending:
+                self.on_pending()
+
+    def _transition(self, state: JoinState):
+        now = time.monotonic()
+        self.transitions.append((state, time.time() * 1000, now - self._entered))
+        self._entered = now
+        self.state = state
+        self.visited.add(state)
+
+
+def _first_of(states: list[JoinState]):
+    # like EC.any_of, but also tells which condition matched
+    def condition(driver):
+        for state in states:
+            try:
+                result = SCREENS[state](driver)
+            except WebDriverException:
+                continue
+            if result:
+                return state, result
+        return False
+
+    return condition
+
+
+class JoinLatency:
+    """
+    Per-step join durations of the most recent sessions on this server.
+    """
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._samples: dict[str, collections.deque] = {}
+        # every join since the start, for the metrics
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, steps: dict[str, float]):
+        with self._lock:
+            for step, duration in steps.items():
+                samples = self._samples.setdefault(
+                    step, collections.deque(maxlen=self.window)
+                )
+                samples.append(duration)
+                histogram = self.histograms.get(step)
+                if histogram is None:
+                    histogram = self.histograms[step] = LatencyHistogram(
+                        JOIN_STEP_BUCKETS_MS
+                    )
+                histogram.record(duration * 1000)
+
+    def percentiles(self) -> dict[str, dict]:
+        with self._lock:
+            samples = {step: list(values) for step, values in self._samples.items()}
+
+        report = {}
+        for step, values in samples.items():
+            p50, p99 = np.percentile(values, [50, 99])
+            report[step] = {"count": len(values), "p50": p50, "p99": p99}
+        return report
+
+    def summary(self) -> str:
+        return ", ".join(
+            f"{step} p50={p['p50'] * 1000:.0f}ms p99={p['p99'] * 1000:.0f}ms"
+            for step, p in self.percentiles().items()
+        )
+
+
+# shared by all bots in this process
+join_latency = JoinLatency()
@@ -0,0 +1,125 @@
+// Keeps the participant list in the page up to date from DOM mutations, so
+// the bot can read it with a single cheap call instead of querying the DOM
+// over WebDriver every time.
+window.rosterTracker = {
+  config: {
+    // same elements as the XPath used by Bot.get_participants
+    panel: "div[jsname='giiMnc']",
+    name: "span[class='notranslate']",
+    // a burst of mutations is rescanned once, this long after it started
+    debounceMs: 200,
+  },
+  participants: [],
+  version: 0,
+  observer: null,
+  target: null,
+  panels: 0,
+  timer: null,
+  stats: { mutations: 0, scans: 0 },
+
+  log: function (msg) {
+    console.log('[RosterTracker] ' + msg);
+  },
+
+  start: function (options) {
+    Object.assign(this.config, options || {});
+    if (this.observer) {
+      return this.version;
+    }
+
+    this.observer = new MutationObserver((records) => {
+      this.stats.mutations += records.length;
+      this._schedule();
+    });
+    this._attach();
+
+    this._scan();
+    this.log(`Tracking roster, ${this.participants.length} participants`);
+    return this.version;
+  },
+
+  stop: function () {
+    if (this.observer) {
+      this.observer.disconnect();
+      this.observer = null;
+      this.target = null;
+      this.panels = 0;
+    }
+    clearTimeout(this.timer);
+    this.timer = null;
+  },
+
+  isActive: function () {
+    return this.observer !== null;
+  },
+
+  // Returns {version, participants}, or only {version} if the roster has not
+  // changed since knownVersion.
+  snapshot: function (knownVersion) {
+    if (this.target && (!this.target.isConnected ||
+        document.querySelectorAll(this.config.panel).length !== this.panels)) {
+      // a panel was removed or added outside the observed node, nothing
+      // notifies the observer of either
+      this._attach();
+      this._scan();
+    }
+    if (knownVersion === this.version) {
+      return { version: this.version };
+    }
+    return { version: this.version, participants: this.participants.slice() };
+  },
+
+  // Observes only the participant panels once they are in the page, through
+  // their closest common ancestor (the panel itself when there is one). Until
+  // then (or after Meet replaced them) the body is watched for added nodes
+  // only, to notice the panels appearing.
+  _attach: function () {
+    const panels = document.querySelectorAll(this.config.panel);
+    let target = panels.length ? panels[0] : document.body;
+    for (const panel of panels) {
+      while (!target.contains(panel)) target = target.parentNode;
+    }
+    this.panels = panels.length;
+    if (target === this.target) return;
+
+    this.observer.disconnect();
+    this.observer.observe(target, {
+      childList: true,
+      subtree: true,
+      characterData: panels.length > 0,
+    });
+    this.target = target;
+  },
+
+  // Meet mutates the page constantly, coalesce bursts into one scan
+  _schedule: function () {
+    if (this.timer) return;
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      if (!this.observer) return;
+      // panels may have been added or removed under the observed node
+      this._attach();
+      this._scan();
+    }, this.config.debounceMs);
+  },
+
+  _scan: function () {
+    this.stats.scans += 1;
+    const names = [];
+    const root = this.target !== document.body ? this.target : document;
+    // selectors match against the whole page, so names of the target panel
+    // itself are found as well
+    const selector = this.config.panel + " " + this.config.name;
+    for (const el of root.querySelectorAll(selector)) {
+      const name = (el.textContent || "").trim();
+      if (name) names.push(name);
+    }
+
+    const changed = names.length !== this.participants.length ||
+      names.some((name, i) => name !== this.participants[i]);
+    if (changed) {
+      this.participants = names;
+      this.version += 1;
+    }
+  },
+};
@@ -2,21 +2,75 @@ import threading
 import asyncio
 import grpc
 from grpc import aio
-import queue
 
 from typing import Dict, Any
 from concurrent import futures
+from contextlib import aclosing
 
 from bot.models import Session
+from bot.config import (
+    DRIVER_POOL_SIZE,
+    DRIVER_MAX_IDLE,
+    DRIVER_HEALTH_CHECK_INTERVAL,
+    BROWSER_MODE,
+    SESSIONS_PER_BROWSER,
+    CHANNEL_CAPACITY,
+    CHANNEL_OVERFLOW,
+    MAX_SAMPLES,
+    SPOOL_ENABLED,
+    LIVEKIT_LOOPS,
+    WORKER_PROCESSES,
+    SESSIONS_PER_WORKER,
+    MAX_SESSIONS,
+    MAX_JOINING,
+    MIN_FREE_MEMORY,
+    MAX_LOAD,
+    JOIN_QUEUE_TIMEOUT,
+    JOIN_QUEUE_POLL,
+    JOIN_PENDING_TIMEOUT,
+    JOIN_ADMITTED_TIMEOUT,
+    TEARDOWN_TIMEOUT,
+    KILL_TIMEOUT,
+    REAP_INTERVAL,
+    METRICS_HOST,
+    METRICS_PORT,
+)
 
 from .pb import bot_pb2
 from .pb import bot_pb2_grpc
 
-from bot.selenium_bot.google_meets import Bot
+from bot.selenium_bot.google_meets import Bot, create_driver
+from bot.selenium_bot.driver_pool import DriverPool
+from bot.selenium_bot.browser_host import BrowserHostManager
+from bot.selenium_bot.join_flow import join_latency
 from bot.livekit_streamer.lk_streamer import LiveKitStreamer
+from bot.livekit_streamer.streamer_host import StreamerHost
+from bot.audio.channel import AudioChannel
+from bot.audio.spool import create_session_spool
+from bot.workers import SessionWorkerPool
+from bot.admission import AdmissionController, AdmissionTimeout
+from bot.session_state import SessionState, SessionPhase, run_bot
+from bot.reaper import SessionReaper
+from bot.roster import RosterFeed
+from bot.session_events import SessionEventHub
+from bot.metrics import (
+    MetricsRegistry,
+    RpcMetricsInterceptor,
+    session_samples,
+    start_metrics_server,
+)
 
 
 _active_sessions: Dict[str, Session] = {}
+_joining_ids: set[str] = set()  # bot ids with a JoinMeeting in flight
+_driver_pool: DriverPool | None = None
+_browser_hosts: BrowserHostManager | None = None
+_streamer_host: StreamerHost | None = None
+_worker_pool: SessionWorkerPool | None = None
+_admission: AdmissionController | None = None
+_reaper = SessionReaper(TEARDOWN_TIMEOUT, KILL_TIMEOUT)
+_teardowns: set[asyncio.Task] = set()  # of failed joins, see _teardown_later
+_session_events = SessionEventHub()
 
 
 class MeetingBotServicer(bot_pb2_grpc.BotServiceServicer):
@@ -30,86 +84,82 @@ class MeetingBotServicer(bot_pb2_grpc.BotServiceServicer):
         meeting_link = request.url
         bot_name = request.name
 
-        if bot_id in _active_sessions:
+        if bot_id in _active_sessions or bot_id in _joining_ids:
             print(
                 f"[{meepo_id} | {bot_id}] JoinMeeting request for already active bot."
             )
             context.set_code(grpc.StatusCode.ALREADY_EXISTS)
-            context.set_details(f"Bot session with ID {bot_id} is already active.")
+            context.set_details(
+                f"Bot session with ID {bot_id} is already active or joining."
+            )
             yield bot_pb2.JoinMeetingResponse(
                 state=bot_pb2.JoinMeetingResponse.FAILED,
-                message=f"Bot {bot_id} is already active.",
+                message=f"Bot {bot_id} is already active or joining.",
                 bot_id=bot_id,
             )
             return
 
-        audio_queue = queue.Queue()
-        selenium_running = threading.Event()
-        pending = threading.Event()
-        joined = threading.Event()
-        livekit_running = threading.Event()
-
-        # send a RECEIVED response.
-        yield bot_pb2.JoinMeetingResponse(
-            state=bot_pb2.JoinMeetingResponse.RECEIVED,
-            message=f"Received request for meepo {meepo_id}, bot {bot_id}",
-            bot_id=bot_id,
-        )
-
+        # reserved from here on (no await since the check), a concurrent join
+        # with the same id is turned away even before this one is admitted
+        _joining_ids.add(bot_id)
+        responses = self._join_meeting(request, context)
         try:
-            print(f"[{meepo_id} | {bot_id}] Starting bot and LiveKit streamer...")
-
-            bot_instance = Bot(
-                bot_id,
-                bot_name,
-                meeting_link,
-                audio_queue,
-                pending,
-                joined,
-                selenium_running,
-            )
-            lks = LiveKitStreamer(bot_id, bot_name, audio_queue, livekit_running)
-
-            selenium_thread = threading.Thread(target=bot_instance.execute)
-            selenium_thread.daemon = True
-            selenium_thread.start()
-
-            livekit_thread = threading.Thread(target=lks.execute)
-            livekit_thread.daemon = True
-            livekit_thread.start()
-
-            # pending
-            await asyncio.get_running_loop().run_in_executor(None, pending.wait)
-            yield bot_pb2.JoinMeetingResponse(
-                state=bot_pb2.JoinMeetingResponse.PENDING,
-                message=f"Bot {bot_id} (meepo {meepo_id}) is pending.",
-                bot_id=bot_id,
-            )
-
-            # joined
-            await asyncio.get_running_loop().run_in_executor(None, joined.wait)
-            yield bot_pb2.JoinMeetingResponse(
-                state=bot_pb2.JoinMeetingResponse.JOINED,
-                message=f"Bot {bot_id} (meepo {meepo_id}) has joined the meeting.",
-                bot_id=bot_id,
-            )
+            # closed with this stream, so the join cleans up right away
+            async with aclosing(responses):
+                async for response in responses:
+                    state = bot_pb2.JoinMeetingResponse.State.Name(response.state)
+                    _session_events.publish(
+                        bot_id, meepo_id, state.lower(), response.message
+                    )
+                    yield response
+        finally:
+            _joining_ids.discard(bot_id)
+            if bot_id not in _active_sessions:
+                # ended without joining, also when the caller went away
+                _session_events.publish(bot_id, meepo_id, "failed", "join ended")
+
+    async def _join_meeting(self, request, context):
+        # JoinMeeting once the bot id is known to be free
+        meepo_id = request.meepo_id
+        bot_id = request.bot_id
+        meeting_link = request.url
+        bot_name = request.name
 
-            _active_sessions[bot_id] = {
-                "bot": bot_instance,
-                "livekit_streamer": lks,
-                "selenium_evt": selenium_running,
-                "livekit_evt": livekit_running,
-            }
+        if _admission is not None:
+            try:
+                async for position in _admission.wait_for_slot(bot_id):
+                    yield bot_pb2.JoinMeetingResponse(
+                        state=bot_pb2.JoinMeetingResponse.RECEIVED,
+                        message=f"Bot {bot_id} is waiting for capacity, "
+                        f"{position} joins ahead.",
+                        bot_id=bot_id,
+                    )
+            except AdmissionTimeout as e:
+                print(f"[{meepo_id} | {bot_id}] JoinMeeting rejected: {e}")
+                context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+                context.set_details(f"No capacity for bot {bot_id}: {e}")
+                yield bot_pb2.JoinMeetingResponse(
+                    state=bot_pb2.JoinMeetingResponse.FAILED,
+                    message=f"No capacity for bot {bot_id}: {e}",
+                    bot_id=bot_id,
+                )
+                return
 
-        except Exception as e:
-            print(f"[{meepo_id} | {bot_id}] An error occurred: {e}")
-            livekit_running.clear()
-            selenium_running.clear()
-            yield bot_pb2.JoinMeetingResponse(
-                state=bot_pb2.JoinMeetingResponse.FAILED,
-                message=f"An error occurred: {e}",
-                bot_id=bot_id,
+        if _worker_pool is not None:
+            responses = _join_in_worker(meepo_id, bot_id, bot_name, meeting_link)
+        else:
+            responses = _join_in_server(
+                meepo_id, bot_id, bot_name, meeting_link, context
             )
+        try:
+            async with aclosing(responses):
+                async for response in responses:
+                    yield response
+        finally:
+            if _admission is not None and bot_id not in _active_sessions:
+                # admitted but never joined: it failed, timed out or its
+                # caller went away, which raises no Exception
+                _admission.release(bot_id)
 
     async def GetMeetingDetails(self, request, context):
         """
@@ -130,8 +180,12 @@ class MeetingBotServicer(bot_pb2_grpc.BotServiceServicer):
             )
             return bot_pb2.MeetingDetailsResponse()
 
+        # the snapshot kept by the session, no driver calls from the loop
+        roster = bot_session.get("roster")
         bot_instance = bot_session.get("bot")
-        if bot_instance:
+        if roster is not None:
+            participants = roster.participants
+        elif bot_instance:
             participants = bot_instance.get_participants()
         else:
             participants = []
@@ -145,6 +199,35 @@ class MeetingBotServicer(bot_pb2_grpc.BotServiceServicer):
             ],
         )
 
+    async def WatchParticipants(self, request, context):
+        """
+        Implements the WatchParticipants RPC.
+        Streams the participants as a snapshot followed by join/leave
+        deltas until the bot leaves the meeting.
+        """
+        bot_id = request.bot_id
+        meepo_id = request.meepo_id
+
+        print(f"[{meepo_id} | {bot_id}] Received WatchParticipants request.")
+
+        bot_session = _active_sessions.get(bot_id, None)
+        roster = bot_session.get("roster") if bot_session else None
+
+        if roster is None:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(
+                f"Bot session with ID {bot_id} (for meepo {meepo_id}) not found."
+            )
+            return
+
+        async for kind, participants, version in roster.watch():
+            yield bot_pb2.ParticipantEvent(
+                kind=_PARTICIPANT_EVENT_KINDS[kind],
+                participants=[bot_pb2.Participant(name=p) for p in participants],
+                version=version,
+            )
+        print(f"[{meepo_id} | {bot_id}] WatchParticipants stream ended.")
+
     async def LeaveMeeting(self, request, context):
         bot_id = request.bot_id
         meepo_id = request.meepo_id
@@ -157,24 +240,25 @@ class MeetingBotServicer(bot_pb2_grpc.BotServiceServicer):
             return bot_pb2.LeaveMeetingResponse(
                 state=bot_pb2.LeaveMeetingResponse.FAILED,
                 message=f"Bot session with ID {bot_id} (for meepo {meepo_id}) not found.",
+                bot_id=bot_id,
             )
 
-        selenium_evt = bot_session.get("selenium_evt")
-        livekit_evt = bot_session.get("livekit_evt")
-
         try:
-            if selenium_evt:
-                selenium_evt.clear()
-            if livekit_evt:
-                livekit_evt.clear()
-
-            if bot_id in _active_sessions:
+            # removed first so the periodic sweep does not reap it as well
+            if _active_sessions.get(bot_id) is bot_session:
                 del _active_sessions[bot_id]
-                print(f"[{meepo_id} | {bot_id}] Session cleaned up.")
+            if "worker" in bot_session:
+                _worker_pool.leave(bot_id)
+                bot_session["roster"].close()
+            else:
+                await _reaper.teardown(bot_id, bot_session, _streamer_host)
+            _session_ended(bot_id, "left the meeting")
+            print(f"[{meepo_id} | {bot_id}] Session cleaned up.")
 
             return bot_pb2.LeaveMeetingResponse(
                 state=bot_pb2.LeaveMeetingResponse.DONE,
                 message=f"Bot {bot_id} successfully left.",
+                bot_id=bot_id,
             )
         except Exception as e:
             print(
@@ -183,19 +267,475 @@ class MeetingBotServicer(bot_pb2_grpc.BotServiceServicer):
             return bot_pb2.LeaveMeetingResponse(
                 state=bot_pb2.LeaveMeetingResponse.FAILED,
                 message=f"An error occurred while leaving the meeting: {e}",
+                bot_id=bot_id,
+            )
+
+    async def BatchJoin(self, request, context):
+        """
+        Implements the BatchJoin RPC.
+        Runs a JoinMeeting for each bot concurrently and streams all of
+        their responses as they come.
+        """
+        print(f"Received BatchJoin request for {len(request.joins)} bots.")
+        responses = asyncio.Queue()
+
+        async def join(join_request):
+            try:
+                async for response in self.JoinMeeting(
+                    join_request, _BatchItemContext()
+                ):
+                    responses.put_nowait(response)
+            except Exception as e:
+                responses.put_nowait(
+                    bot_pb2.JoinMeetingResponse(
+                        state=bot_pb2.JoinMeetingResponse.FAILED,
+                        message=f"An error occurred: {e}",
+                        bot_id=join_request.bot_id,
+                    )
+                )
+            finally:
+                responses.put_nowait(None)
+
+        tasks = [asyncio.create_task(join(r)) for r in request.joins]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                response = await responses.get()
+                if response is None:
+                    remaining -= 1
+                else:
+                    yield response
+        finally:
+            # the caller went away, abandon the joins still running and
+            # let them release and tear down what they started
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def BatchLeave(self, request, context):
+        """
+        Implements the BatchLeave RPC.
+        Runs a LeaveMeeting for each bot concurrently.
+        """
+        print(f"Received BatchLeave request for {len(request.leaves)} bots.")
+        results = await asyncio.gather(
+            *(self.LeaveMeeting(r, _BatchItemContext()) for r in request.leaves)
+        )
+        return bot_pb2.BatchLeaveResponse(results=results)
+
+    async def WatchSessions(self, request, context):
+        """
+        Implements the WatchSessions RPC.
+        Streams the state of every session on this server, then each of
+        their transitions.
+        """
+        print("Received WatchSessions request.")
+        async for event, snapshot in _session_events.watch():
+            yield bot_pb2.SessionEvent(
+                bot_id=event["bot_id"],
+                meepo_id=event["meepo_id"],
+                state=bot_pb2.SessionEvent.State.Value(event["state"].upper()),
+                message=event["message"],
+                at=event["at"],
+                snapshot=snapshot,
             )
 
 
+_PARTICIPANT_EVENT_KINDS = {
+    "snapshot": bot_pb2.ParticipantEvent.SNAPSHOT,
+    "joined": bot_pb2.ParticipantEvent.JOINED,
+    "left": bot_pb2.ParticipantEvent.LEFT,
+}
+
+
+async def _construct(factory, *args, **kwargs):
+    """
+    Builds an object that blocks (e.g. on a browser launch) in a thread. If
+    the caller goes away meanwhile, the driver of what it built is quit.
+    """
+    building = asyncio.ensure_future(asyncio.to_thread(factory, *args, **kwargs))
+    try:
+        return await asyncio.shield(building)
+    except asyncio.CancelledError:
+        building.add_done_callback(_quit_abandoned)
+        raise
+
+
+def _quit_abandoned(building: asyncio.Future):
+    if building.cancelled() or building.exception() is not None:
+        return
+    driver = getattr(building.result(), "driver", None)
+    if driver is not None:
+        threading.Thread(target=driver.quit, daemon=True).start()
+
+
+def _teardown_later(bot_id: str, session: dict | None):
+    """
+    Tears down what a failed join started without holding up its response.
+    """
+    if session is None:
+        return
+    task = asyncio.get_running_loop().create_task(
+        _reaper.teardown(bot_id, session, _streamer_host)
+    )
+    _teardowns.add(task)
+    task.add_done_callback(_teardowns.discard)
+
+
+async def _reap_sessions():
+    """
+    Periodically removes sessions that ended without LeaveMeeting.
+    """
+    while True:
+        await asyncio.sleep(REAP_INTERVAL)
+        try:
+            if _worker_pool is not None:
+                for bot_id, session in list(_active_sessions.items()):
+                    # the pool forgets sessions whose worker reported them stopped
+                    if "worker" in session and bot_id not in _worker_pool.sessions:
+                        del _active_sessions[bot_id]
+                        session["roster"].close()
+                        _session_ended(bot_id)
+            await _reaper.reap(_active_sessions, _streamer_host, _session_ended)
+            if _browser_hosts is not None:
+                # shared browsers whose last session just closed its tab
+                await asyncio.to_thread(_browser_hosts.release_idle)
+        except Exception as e:
+            print(f"Session reaper failed: {e}")
+
+
+def _session_ended(bot_id: str, message: str = "session ended"):
+    if _admission is not None:
+        _admission.release(bot_id)
+    _session_events.publish(bot_id, "", "stopped", message)
+
+
+def _server_samples():
+    # metrics of this server and of its sessions, as last sent by the worker
+    # processes for those running there
+    yield "meepo_sessions_active", {}, len(_active_sessions)
+    if _admission is not None:
+        headroom = _admission.headroom()
+        yield "meepo_sessions_joining", {}, headroom["joining"]
+        yield "meepo_sessions_waiting", {}, headroom["waiting"]
+        yield "meepo_joins_admitted_total", {}, _admission.stats["admitted"]
+        yield "meepo_joins_rejected_total", {}, _admission.stats["rejected"]
+    for step, histogram in list(join_latency.histograms.items()):
+        yield "meepo_join_step_duration_seconds", {"step": step}, histogram
+    yield "meepo_sessions_torn_down_total", {}, _reaper.stats["sessions"]
+    yield "meepo_processes_killed_total", {}, _reaper.stats["processes_killed"]
+    if _worker_pool is not None:
+        workers = _worker_pool.worker_stats()
+        yield "meepo_worker_processes_alive", {}, workers["alive"]
+        yield "meepo_worker_restarts_total", {}, workers["worker_restarts"]
+        yield from _worker_pool.session_samples()
+    for bot_id, session in list(_active_sessions.items()):
+        yield from session_samples(bot_id, session)
+
+
+class _BatchItemContext:
+    # context of one join or leave in a batch; status codes only apply to
+    # a whole RPC, its responses carry the outcome instead
+    def set_code(self, code):
+        self.code = code
+
+    def set_details(self, details):
+        self.details = details
+
+
+def _raise_if_ended(state: SessionState, phase: SessionPhase):
+    # a session that got there and then stopped still reports the phase
+    if state.reached(phase):
+        return
+    if state.phase == SessionPhase.FAILED:
+        raise RuntimeError(state.error)
+    if state.phase == SessionPhase.STOPPED:
+        raise RuntimeError("bot stopped before joining the meeting")
+
+
+async def _join_in_server(
+    meepo_id: str, bot_id: str, bot_name: str, meeting_link: str, context
+):
+    """
+    JoinMeeting for a session run by this process: starts the Bot and its
+    LiveKit streamer and streams their progress.
+    """
+    audio_queue = AudioChannel(
+        CHANNEL_CAPACITY, CHANNEL_OVERFLOW, MAX_SAMPLES or None
+    )
+    spool = None
+    state = SessionState(asyncio.get_running_loop())
+    roster = RosterFeed(asyncio.get_running_loop())
+    selenium_running = threading.Event()
+    livekit_running = threading.Event()
+
+    bot_instance = None
+    session = None
+    try:
+        # send a RECEIVED response.
+        yield bot_pb2.JoinMeetingResponse(
+            state=bot_pb2.JoinMeetingResponse.RECEIVED,
+            message=f"Received request for meepo {meepo_id}, bot {bot_id}",
+            bot_id=bot_id,
+        )
+
+        print(f"[{meepo_id} | {bot_id}] Starting bot and LiveKit streamer...")
+        spool = create_session_spool(bot_id) if SPOOL_ENABLED else None
+
+        # takes a driver from the pool, which may launch a browser
+        bot_instance = await _construct(
+            Bot,
+            bot_id,
+            bot_name,
+            meeting_link,
+            audio_queue,
+            state.pending,
+            state.joined,
+            selenium_running,
+            driver_pool=_browser_hosts or _driver_pool,
+            spool=spool,
+            on_roster=roster.update,
+        )
+        lks = LiveKitStreamer(bot_id, bot_name, audio_queue, livekit_running)
+
+        selenium_thread = threading.Thread(
+            target=run_bot, args=(bot_instance, state)
+        )
+        selenium_thread.daemon = True
+        selenium_thread.start()
+
+        if _streamer_host is not None:
+            livekit = _streamer_host.start_streamer(lks)
+        else:
+            livekit = threading.Thread(target=lks.execute)
+            livekit.daemon = True
+            livekit.start()
+
+        # everything the session owns, for its teardown
+        session = {
+            "bot": bot_instance,
+            "livekit_streamer": lks,
+            "selenium_evt": selenium_running,
+            "livekit_evt": livekit_running,
+            "spool": spool,
+            "state": state,
+            "roster": roster,
+            "selenium_thread": selenium_thread,
+            "livekit": livekit,
+            "audio_queue": audio_queue,
+        }
+
+        # pending, also passed through when admitted without asking
+        await state.wait_for(SessionPhase.PENDING, JOIN_PENDING_TIMEOUT)
+        _raise_if_ended(state, SessionPhase.PENDING)
+        yield bot_pb2.JoinMeetingResponse(
+            state=bot_pb2.JoinMeetingResponse.PENDING,
+            message=f"Bot {bot_id} (meepo {meepo_id}) is pending.",
+            bot_id=bot_id,
+            steps=_join_steps(bot_instance.get_join_steps()),
+        )
+
+        # joined, registered before the caller can go away
+        await state.wait_for(SessionPhase.JOINED, JOIN_ADMITTED_TIMEOUT)
+        _raise_if_ended(state, SessionPhase.JOINED)
+        if _admission is not None:
+            _admission.joined(bot_id)
+        _active_sessions[bot_id] = session
+
+        print(f"[{meepo_id} | {bot_id}] Join latency: {join_latency.summary()}")
+        yield bot_pb2.JoinMeetingResponse(
+            state=bot_pb2.JoinMeetingResponse.JOINED,
+            message=f"Bot {bot_id} (meepo {meepo_id}) has joined the meeting.",
+            bot_id=bot_id,
+            steps=_join_steps(bot_instance.get_join_steps()),
+        )
+
+    except TimeoutError:
+        print(f"[{meepo_id} | {bot_id}] Timed out in phase {state.phase.value}.")
+        context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+        context.set_details(f"Bot {bot_id} timed out while {state.phase.value}.")
+        yield bot_pb2.JoinMeetingResponse(
+            state=bot_pb2.JoinMeetingResponse.FAILED,
+            message=f"Bot {bot_id} timed out while {state.phase.value}.",
+            bot_id=bot_id,
+        )
+    except Exception as e:
+        print(f"[{meepo_id} | {bot_id}] An error occurred: {e}")
+        yield bot_pb2.JoinMeetingResponse(
+            state=bot_pb2.JoinMeetingResponse.FAILED,
+            message=f"An error occurred: {e}",
+            bot_id=bot_id,
+        )
+    finally:
+        if bot_id not in _active_sessions:
+            # failed, timed out or cancelled by the caller before joining
+            livekit_running.clear()
+            selenium_running.clear()
+            if spool is not None and bot_instance is None:
+                # a running bot closes its spool when it stops
+                spool.close()
+            _teardown_later(bot_id, session)
+
+
+async def _join_in_worker(meepo_id: str, bot_id: str, bot_name: str, meeting_link: str):
+    """
+    JoinMeeting for a session run by a worker process, same responses as
+    for a session run in the server.
+    """
+    yield bot_pb2.JoinMeetingResponse(
+        state=bot_pb2.JoinMeetingResponse.RECEIVED,
+        message=f"Received request for meepo {meepo_id}, bot {bot_id}",
+        bot_id=bot_id,
+    )
+
+    # roster changes reach it before the session is registered
+    roster = RosterFeed(asyncio.get_running_loop())
+    try:
+        print(f"[{meepo_id} | {bot_id}] Starting bot in a session worker...")
+        updates = _worker_pool.join(
+            bot_id,
+            bot_name,
+            meeting_link,
+            timeouts=(JOIN_PENDING_TIMEOUT, JOIN_ADMITTED_TIMEOUT),
+            on_roster=roster.update,
+        )
+        async with aclosing(updates):
+            async for state, payload in updates:
+                if state == "failed":
+                    raise RuntimeError(payload["message"])
+
+                if state == "pending":
+                    yield bot_pb2.JoinMeetingResponse(
+                        state=bot_pb2.JoinMeetingResponse.PENDING,
+                        message=f"Bot {bot_id} (meepo {meepo_id}) is pending.",
+                        bot_id=bot_id,
+                        steps=_join_steps(payload["steps"]),
+                    )
+                elif state == "joined":
+                    # the worker's join latency does not reach this process
+                    join_latency.record(payload["timings"])
+                    # registered before the caller can go away
+                    if _admission is not None:
+                        _admission.joined(bot_id)
+                    _active_sessions[bot_id] = {
+                        "worker": _worker_pool.sessions.get(bot_id, -1),
+                        "roster": roster,
+                    }
+                    print(
+                        f"[{meepo_id} | {bot_id}] Join latency: "
+                        f"{join_latency.summary()}"
+                    )
+                    yield bot_pb2.JoinMeetingResponse(
+                        state=bot_pb2.JoinMeetingResponse.JOINED,
+                        message=f"Bot {bot_id} (meepo {meepo_id}) "
+                        "has joined the meeting.",
+                        bot_id=bot_id,
+                        steps=_join_steps(payload["steps"]),
+                    )
+
+    except Exception as e:
+        print(f"[{meepo_id} | {bot_id}] An error occurred: {e}")
+        yield bot_pb2.JoinMeetingResponse(
+            state=bot_pb2.JoinMeetingResponse.FAILED,
+            message=f"An error occurred: {e}",
+            bot_id=bot_id,
+        )
+    finally:
+        if bot_id not in _active_sessions:
+            # failed, timed out or cancelled by the caller before joining
+            _worker_pool.leave(bot_id)
+            roster.close()
+
+
+def _join_steps(join_steps: list[tuple[str, float, float]]) -> list:
+    """
+    Join steps of a bot with the latency percentiles of each step.
+    """
+    percentiles = join_latency.percentiles()
+    steps = []
+    for name, completed_at, duration in join_steps:
+        step = percentiles.get(name, {})
+        steps.append(
+            bot_pb2.JoinStep(
+                name=name,
+                completed_at=completed_at,
+                duration_ms=duration * 1000,
+                p50_ms=step.get("p50", 0) * 1000,
+                p99_ms=step.get("p99", 0) * 1000,
+            )
+        )
+    return steps
+
+
 async def serve():
     """
     Main function to start the gRPC server.
     """
-    server = aio.server(futures.ThreadPoolExecutor(max_workers=10))
+    global _driver_pool, _browser_hosts, _streamer_host, _worker_pool, _admission
+    if MAX_SESSIONS > 0:
+        _admission = AdmissionController(
+            MAX_SESSIONS,
+            max_joining=MAX_JOINING,
+            min_free_memory=MIN_FREE_MEMORY,
+            max_load=MAX_LOAD,
+            queue_timeout=JOIN_QUEUE_TIMEOUT,
+            poll_interval=JOIN_QUEUE_POLL,
+        )
+    if WORKER_PROCESSES > 0:
+        # sessions, their browsers and LiveKit loops all live in the workers
+        _worker_pool = SessionWorkerPool(WORKER_PROCESSES, SESSIONS_PER_WORKER)
+        _worker_pool.start()
+    if DRIVER_POOL_SIZE > 0 and _worker_pool is None:
+        _driver_pool = DriverPool(
+            create_driver,
+            size=DRIVER_POOL_SIZE,
+            max_idle=DRIVER_MAX_IDLE,
+            health_check_interval=DRIVER_HEALTH_CHECK_INTERVAL,
+        )
+        _driver_pool.start()
+    if BROWSER_MODE == "multi-tab" and _worker_pool is None:
+        # shared browsers are launched from the pool when there is one
+        factory = _driver_pool.acquire if _driver_pool is not None else create_driver
+        _browser_hosts = BrowserHostManager(factory, SESSIONS_PER_BROWSER)
+    if LIVEKIT_LOOPS > 0 and _worker_pool is None:
+        _streamer_host = StreamerHost(LIVEKIT_LOOPS)
+        _streamer_host.start()
+
+    reaper_task = asyncio.create_task(_reap_sessions())
+
+    interceptors, metrics_server = [], None
+    if METRICS_PORT > 0:
+        # long-lived watch streams would only skew the RPC latencies
+        rpc_metrics = RpcMetricsInterceptor(
+            exclude=("WatchParticipants", "WatchSessions")
+        )
+        interceptors.append(rpc_metrics)
+        metrics = MetricsRegistry()
+        metrics.register("server", _server_samples)
+        metrics.register("rpc", rpc_metrics.samples)
+        metrics_server = start_metrics_server(METRICS_HOST, METRICS_PORT, metrics)
+
+    server = aio.server(
+        futures.ThreadPoolExecutor(max_workers=10), interceptors=interceptors
+    )
     bot_pb2_grpc.add_BotServiceServicer_to_server(MeetingBotServicer(), server)
     server.add_insecure_port("[::]:50051")
     await server.start()
     print("Meeting Bot gRPC server started on port 50051.")
-    await server.wait_for_termination()
+    try:
+        await server.wait_for_termination()
+    finally:
+        reaper_task.cancel()
+        if metrics_server is not None:
+            metrics_server.shutdown()
+        if _worker_pool is not None:
+            _worker_pool.stop()
+        if _streamer_host is not None:
+            _streamer_host.stop()
+        if _browser_hosts is not None:
+            _browser_hosts.stop()
+        if _driver_pool is not None:
+            _driver_pool.stop()
 
 
 if __name__ == "__main__":
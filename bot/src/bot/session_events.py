@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+from typing import AsyncIterator
+
+
+class SessionEventHub:
+    """
+    State transitions of every session on this node, for WatchSessions.
+
+    The RPC handlers publish() on the server's event loop as sessions move
+    along ("received", "pending", "joined", then "failed" or "stopped");
+    the hub keeps the latest event of each live session. watch() yields
+    those as a snapshot and then every transition as it happens. A watcher
+    that falls more than max_pending events behind gets a fresh snapshot
+    instead of the events it missed.
+
+    Runs on the server's event loop; not thread-safe.
+    """
+
+    def __init__(self, max_pending: int = 256):
+        self.max_pending = max_pending
+        self.sessions: dict[str, dict] = {}  # bot id -> latest event
+        self._watchers: set[asyncio.Queue] = set()
+        self.stats = {"published": 0, "resyncs": 0}
+
+    def publish(self, bot_id: str, meepo_id: str, state: str, message: str = ""):
+        previous = self.sessions.get(bot_id)
+        if previous is not None:
+            if (previous["state"], previous["message"]) == (state, message):
+                return  # e.g. repeated "waiting for capacity" updates
+            meepo_id = meepo_id or previous["meepo_id"]
+        elif state in ("failed", "stopped"):
+            return  # not live, nothing to report
+
+        event = {
+            "bot_id": bot_id,
+            "meepo_id": meepo_id,
+            "state": state,
+            "message": message,
+            "at": time.time() * 1000,  # ms since epoch
+        }
+        if state in ("failed", "stopped"):
+            self.sessions.pop(bot_id, None)
+        else:
+            self.sessions[bot_id] = event
+        self.stats["published"] += 1
+
+        for events in self._watchers:
+            if events.qsize() >= self.max_pending:
+                self.stats["resyncs"] += 1
+                while not events.empty():
+                    events.get_nowait()
+                self._put_snapshot(events)
+            else:
+                events.put_nowait((event, False))
+
+    async def watch(self) -> AsyncIterator[tuple[dict, bool]]:
+        """
+        Yields (event, snapshot) pairs; snapshot is True for the current
+        state of each session sent first and after falling behind.
+        """
+        events = asyncio.Queue()
+        self._put_snapshot(events)
+        self._watchers.add(events)
+        try:
+            while True:
+                yield await events.get()
+        finally:
+            self._watchers.discard(events)
+
+    def _put_snapshot(self, events: asyncio.Queue):
+        for event in list(self.sessions.values()):
+            events.put_nowait((event, True))
@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import time
+
+from enum import Enum
+
+
+class SessionPhase(Enum):
+    STARTING = "starting"
+    PENDING = "pending"  # asked to join, waiting for the host
+    JOINED = "joined"
+    FAILED = "failed"
+    STOPPED = "stopped"
+
+
+# phases only move forward, FAILED and STOPPED are final
+_ORDER = {
+    SessionPhase.STARTING: 0,
+    SessionPhase.PENDING: 1,
+    SessionPhase.JOINED: 2,
+    SessionPhase.FAILED: 3,
+    SessionPhase.STOPPED: 3,
+}
+
+
+class SessionState:
+    """
+    Phase of one session, updated from the Bot's threads and awaited by
+    JoinMeeting on the server's event loop.
+
+    Updates are handed to the loop with call_soon_threadsafe, so a waiting
+    RPC needs no thread of its own and wakes as soon as the phase changes,
+    including when the Bot fails. `pending` and `joined` are events for the
+    Bot that report to the state when they are set.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.phase = SessionPhase.STARTING
+        self.error = None
+        self.transitions: list[tuple[SessionPhase, float]] = [
+            (SessionPhase.STARTING, time.monotonic())
+        ]
+        self._changed = asyncio.Event()
+
+        self.pending = _PhaseEvent(self, SessionPhase.PENDING)
+        self.joined = _PhaseEvent(self, SessionPhase.JOINED)
+
+    @property
+    def done(self) -> bool:
+        return self.phase in (SessionPhase.FAILED, SessionPhase.STOPPED)
+
+    def update(self, phase: SessionPhase, error: str | None = None):
+        """
+        Moves the session to a phase, from any thread.
+        """
+        try:
+            self.loop.call_soon_threadsafe(self._update, phase, error)
+        except RuntimeError:
+            pass  # server loop already closed
+
+    def fail(self, error: str):
+        self.update(SessionPhase.FAILED, error)
+
+    def _update(self, phase: SessionPhase, error: str | None):
+        if self.done or _ORDER[phase] <= _ORDER[self.phase]:
+            return
+        self.phase = phase
+        self.error = error
+        self.transitions.append((phase, time.monotonic()))
+        # wake every waiter, later waits use a fresh event
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def reached(self, phase: SessionPhase) -> bool:
+        """
+        Whether the session got to `phase` or past it before it ended.
+        """
+        return any(
+            _ORDER[phase] <= _ORDER[p] < _ORDER[SessionPhase.FAILED]
+            for p, _ in self.transitions
+        )
+
+    async def wait_for(self, phase: SessionPhase, timeout: float) -> SessionPhase:
+        """
+        Waits until the session reached `phase` (or a later one) or ended.
+        Raises TimeoutError after timeout seconds.
+        """
+        async with asyncio.timeout(timeout):
+            while not self.done and _ORDER[self.phase] < _ORDER[phase]:
+                await self._changed.wait()
+        return self.phase
+
+
+class _PhaseEvent(threading.Event):
+    # a threading.Event for the Bot that also moves the session state along
+    def __init__(self, state: SessionState, phase: SessionPhase):
+        super().__init__()
+        self._state = state
+        self._phase = phase
+
+    def set(self):
+        super().set()
+        self._state.update(self._phase)
+
+
+def run_bot(bot_instance, state: SessionState):
+    """
+    Thread target running a Bot, reports when it failed or stopped.
+    """
+    try:
+        bot_instance.execute()
+    except Exception as e:
+        state.fail(str(e))
+    finally:
+        state.update(SessionPhase.STOPPED)
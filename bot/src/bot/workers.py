@@ -0,0 +1,396 @@
+import asyncio
+import multiprocessing
+import queue
+import threading
+import time
+import traceback
+
+from typing import AsyncIterator, Callable
+
+from bot.config import (
+    CHANNEL_CAPACITY,
+    CHANNEL_OVERFLOW,
+    MAX_SAMPLES,
+    SPOOL_ENABLED,
+    TEARDOWN_TIMEOUT,
+    KILL_TIMEOUT,
+)
+from bot.selenium_bot.google_meets import Bot
+from bot.livekit_streamer.lk_streamer import LiveKitStreamer
+from bot.livekit_streamer.streamer_host import StreamerHost
+from bot.audio.channel import AudioChannel
+from bot.audio.spool import create_session_spool
+from bot.metrics import session_samples
+from bot.reaper import SessionReaper
+
+# seconds between the pipeline metrics a session sends to the server
+SAMPLES_INTERVAL = 5.0
+
+
+class SessionWorkerPool:
+    """
+    Runs sessions in separate worker processes instead of as threads of the
+    gRPC server, so they do not share one GIL and a crashing or hanging
+    session only takes its own worker's shard down.
+
+    Each of the `processes` workers runs up to sessions_per_worker sessions
+    (Bot, LiveKitStreamer and their threads) and is sent commands over its
+    own queue. Workers report session state back on one shared event queue,
+    which a dispatcher thread in the server routes to the waiting RPCs,
+    along with each session's latest pipeline metrics. A worker that dies
+    fails its sessions and is replaced.
+
+    Workers are started with "spawn": forking a process that runs gRPC and
+    other threads is not safe.
+    """
+
+    def __init__(self, processes: int, sessions_per_worker: int):
+        self.size = processes
+        self.sessions_per_worker = sessions_per_worker
+        self._context = multiprocessing.get_context("spawn")
+        self._events = self._context.Queue()
+        self._workers: list = [None] * processes  # (process, command queue)
+
+        self.sessions: dict[str, int] = {}  # bot id -> worker index
+        self._listeners: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._dispatcher = None
+        self._rosters: dict[str, Callable[[list[str]], None]] = {}
+        self._samples: dict[str, list[tuple]] = {}  # bot id -> latest metrics
+
+        self.stats = {"started": 0, "failed": 0, "worker_restarts": 0}
+
+    def start(self):
+        for index in range(self.size):
+            self._spawn(index)
+        self._dispatcher = threading.Thread(
+            target=self._dispatch, name="session-worker-events", daemon=True
+        )
+        self._dispatcher.start()
+        print(
+            f"Session worker pool started with {self.size} processes, "
+            f"{self.sessions_per_worker} sessions each."
+        )
+
+    def stop(self, timeout: float = 10.0):
+        self._stopped.set()
+        for process, commands in self._workers:
+            commands.put(None)
+        for process, _ in self._workers:
+            process.join(timeout)
+            if process.is_alive():
+                process.kill()
+        if self._dispatcher is not None:
+            self._dispatcher.join(timeout)
+
+    async def join(
+        self,
+        bot_id: str,
+        bot_name: str,
+        meeting_link: str,
+        timeouts: tuple[float, float] | None = None,
+        on_roster: Callable[[list[str]], None] | None = None,
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """
+        Starts a session on the least loaded worker and yields its state
+        changes ("pending", "joined", "failed") as (state, payload) until it
+        has joined or failed. timeouts bound the wait for the first change
+        and for each one after it; TimeoutError is raised when one expires.
+        on_roster is called from the dispatcher thread with the session's
+        participants whenever they change, until it stops.
+        """
+        with self._lock:
+            index = self._pick_worker()
+            if index is None:
+                raise RuntimeError("no session worker has a free slot")
+            self.sessions[bot_id] = index
+            events = self._listen(bot_id)
+            if on_roster is not None:
+                self._rosters[bot_id] = on_roster
+        self._workers[index][1].put(("join", bot_id, bot_name, meeting_link))
+
+        try:
+            first = True
+            while True:
+                timeout = None if timeouts is None else timeouts[0 if first else 1]
+                first = False
+                try:
+                    state, payload = await asyncio.wait_for(events.get(), timeout)
+                except TimeoutError:
+                    raise TimeoutError(
+                        f"session did not report back within {timeout:.0f}s"
+                    )
+                yield state, payload
+                if state == "joined":
+                    self.stats["started"] += 1
+                    return
+                if state == "failed":
+                    self.stats["failed"] += 1
+                    with self._lock:
+                        if self.sessions.get(bot_id) == index:
+                            del self.sessions[bot_id]
+                            self._rosters.pop(bot_id, None)
+                            self._samples.pop(bot_id, None)
+                    return
+        finally:
+            with self._lock:
+                self._listeners.pop(bot_id, None)
+
+    def leave(self, bot_id: str) -> bool:
+        """
+        Asks the session's worker to stop it; False if it is not running.
+        """
+        with self._lock:
+            index = self.sessions.pop(bot_id, None)
+            self._rosters.pop(bot_id, None)
+            self._samples.pop(bot_id, None)
+        if index is None:
+            return False
+        self._workers[index][1].put(("leave", bot_id))
+        return True
+
+    def worker_stats(self) -> dict:
+        with self._lock:
+            per_worker = [0] * self.size
+            for index in self.sessions.values():
+                per_worker[index] += 1
+        return {
+            "workers": self.size,
+            "alive": sum(1 for p, _ in self._workers if p.is_alive()),
+            "sessions": sum(per_worker),
+            "per_worker": per_worker,
+            **self.stats,
+        }
+
+    def session_samples(self) -> list[tuple]:
+        """
+        Latest pipeline metrics the running sessions sent, see
+        bot.metrics.session_samples; up to SAMPLES_INTERVAL old.
+        """
+        with self._lock:
+            return [sample for samples in self._samples.values() for sample in samples]
+
+    def _listen(self, key: str) -> asyncio.Queue:
+        # called with the lock held
+        events = asyncio.Queue()
+        self._listeners[key] = (asyncio.get_running_loop(), events)
+        return events
+
+    def _pick_worker(self) -> int | None:
+        # called with the lock held
+        load = [0] * self.size
+        for index in self.sessions.values():
+            load[index] += 1
+        index = min(range(self.size), key=load.__getitem__)
+        if load[index] >= self.sessions_per_worker:
+            return None
+        return index
+
+    def _spawn(self, index: int):
+        commands = self._context.Queue()
+        process = self._context.Process(
+            target=run_worker,
+            args=(index, commands, self._events),
+            name=f"session-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        self._workers[index] = (process, commands)
+
+    def _dispatch(self):
+        next_check = time.monotonic()
+        while not self._stopped.is_set():
+            try:
+                key, state, payload = self._events.get(timeout=0.5)
+            except queue.Empty:
+                state = None
+
+            if state == "stopped":
+                # ended on its own (meeting over, bot crashed), payload is the
+                # worker index so a newer session under the same id survives
+                with self._lock:
+                    if self.sessions.get(key) == payload:
+                        del self.sessions[key]
+                        self._rosters.pop(key, None)
+                        self._samples.pop(key, None)
+            elif state == "roster":
+                on_roster = self._rosters.get(key)
+                if on_roster is not None:
+                    on_roster(payload)
+            elif state == "samples":
+                with self._lock:
+                    if key in self.sessions:
+                        self._samples[key] = payload
+            elif state is not None:
+                self._deliver(key, state, payload)
+
+            if time.monotonic() >= next_check:
+                self._check_workers()
+                next_check = time.monotonic() + 0.5
+
+    def _deliver(self, key: str, state: str, payload):
+        with self._lock:
+            listener = self._listeners.get(key)
+        if listener is not None:
+            loop, events = listener
+            try:
+                loop.call_soon_threadsafe(events.put_nowait, (state, payload))
+            except RuntimeError:
+                pass  # the RPC's loop is gone
+
+    def _check_workers(self):
+        for index, (process, _) in enumerate(self._workers):
+            if process.is_alive() or self._stopped.is_set():
+                continue
+            print(
+                f"Session worker {index} exited with code {process.exitcode}, "
+                f"restarting it."
+            )
+            with self._lock:
+                lost = [b for b, i in self.sessions.items() if i == index]
+                for bot_id in lost:
+                    del self.sessions[bot_id]
+                    self._rosters.pop(bot_id, None)
+                    self._samples.pop(bot_id, None)
+            self.stats["worker_restarts"] += 1
+            self._spawn(index)
+            for bot_id in lost:
+                self._deliver(bot_id, "failed", {"message": "session worker exited"})
+
+
+def run_worker(index: int, commands, events):
+    """
+    Entry point of a worker process: runs sessions as commands arrive until
+    it is sent None.
+    """
+    streamer_host = StreamerHost(1)
+    streamer_host.start()
+    reaper = SessionReaper(TEARDOWN_TIMEOUT, KILL_TIMEOUT)
+    sessions: dict[str, dict] = {}
+
+    try:
+        while True:
+            command = commands.get()
+            if command is None:
+                break
+            kind, bot_id, *args = command
+            if kind == "join":
+                thread = threading.Thread(
+                    target=_run_session,
+                    args=(index, bot_id, *args, sessions, streamer_host, reaper, events),
+                    name=f"session-{bot_id}",
+                    daemon=True,
+                )
+                thread.start()
+            elif kind == "leave":
+                # the session's thread tears it down once the bot lets go
+                session = sessions.get(bot_id)
+                if session is not None:
+                    session["selenium_evt"].clear()
+    finally:
+        for session in list(sessions.values()):
+            session["selenium_evt"].clear()
+            session["livekit_evt"].clear()
+        streamer_host.stop()
+        print(f"Session worker {index} stopped.")
+
+
+def _run_session(
+    index: int,
+    bot_id: str,
+    bot_name: str,
+    meeting_link: str,
+    sessions: dict,
+    streamer_host: StreamerHost,
+    reaper: SessionReaper,
+    events,
+):
+    # the worker side of JoinMeeting: start the bot and its streamer, report
+    # pending/joined, tear the session down and finally report it stopped
+    audio_queue = AudioChannel(CHANNEL_CAPACITY, CHANNEL_OVERFLOW, MAX_SAMPLES or None)
+    spool = None
+    selenium_running = threading.Event()
+    pending = threading.Event()
+    joined = threading.Event()
+    livekit_running = threading.Event()
+
+    bot_instance = None
+    failures = []  # what made the bot stop, if it failed
+    try:
+        spool = create_session_spool(bot_id) if SPOOL_ENABLED else None
+        bot_instance = Bot(
+            bot_id,
+            bot_name,
+            meeting_link,
+            audio_queue,
+            pending,
+            joined,
+            selenium_running,
+            spool=spool,
+            on_roster=lambda names: events.put((bot_id, "roster", names)),
+        )
+        lks = LiveKitStreamer(bot_id, bot_name, audio_queue, livekit_running)
+        selenium_thread = threading.Thread(
+            target=_run_bot, args=(bot_instance, failures), daemon=True
+        )
+        selenium_thread.start()
+        livekit = streamer_host.start_streamer(lks)
+        sessions[bot_id] = {
+            "bot": bot_instance,
+            "livekit_streamer": lks,
+            "selenium_evt": selenium_running,
+            "livekit_evt": livekit_running,
+            "spool": spool,
+            "selenium_thread": selenium_thread,
+            "livekit": livekit,
+            "audio_queue": audio_queue,
+        }
+
+        for state, event in (("pending", pending), ("joined", joined)):
+            while not event.wait(0.5):
+                if not selenium_thread.is_alive():
+                    if failures:
+                        raise failures[0]
+                    raise RuntimeError("bot stopped before joining")
+            events.put(
+                (
+                    bot_id,
+                    state,
+                    {
+                        "steps": bot_instance.get_join_steps(),
+                        "timings": dict(bot_instance.timings),
+                    },
+                )
+            )
+
+        # until the meeting ends or the session is asked to leave
+        next_samples = time.monotonic() + SAMPLES_INTERVAL
+        while selenium_thread.is_alive() and selenium_running.is_set():
+            selenium_thread.join(0.5)
+            if time.monotonic() >= next_samples:
+                samples = list(session_samples(bot_id, sessions[bot_id]))
+                events.put((bot_id, "samples", samples))
+                next_samples = time.monotonic() + SAMPLES_INTERVAL
+    except Exception as e:
+        traceback.print_exc()
+        selenium_running.clear()
+        livekit_running.clear()
+        if spool is not None and bot_instance is None:
+            spool.close()
+        events.put((bot_id, "failed", {"message": str(e)}))
+    finally:
+        session = sessions.pop(bot_id, None)
+        if session is not None:
+            asyncio.run(reaper.teardown(bot_id, session, streamer_host))
+        else:
+            streamer_host.stop_streamer(bot_id)
+        events.put((bot_id, "stopped", index))
+
+
+def _run_bot(bot_instance: Bot, failures: list):
+    # thread target, keeps the bot's error to report it to the server
+    try:
+        bot_instance.execute()
+    except Exception as e:
+        failures.append(e)
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from bot.admission import AdmissionController, AdmissionTimeout
+
+
+@pytest.fixture(autouse=True)
+def idle_host():
+    with patch("bot.admission._available_memory_mb", return_value=4096.0), patch(
+        "bot.admission._load_per_cpu", return_value=0.1
+    ):
+        yield
+
+
+async def _admit(controller, bot_id, positions=None):
+    async for position in controller.wait_for_slot(bot_id):
+        if positions is not None:
+            positions.append(position)
+
+
+@pytest.mark.asyncio
+async def test_admits_up_to_capacity_then_queues_fifo():
+    controller = AdmissionController(max_sessions=1, poll_interval=0.01)
+    await _admit(controller, "bot-1")
+    assert controller.sessions == {"bot-1"}
+
+    positions_2, positions_3 = [], []
+    second = asyncio.create_task(_admit(controller, "bot-2", positions_2))
+    third = asyncio.create_task(_admit(controller, "bot-3", positions_3))
+    await asyncio.sleep(0.05)
+    assert not second.done() and not third.done()
+    assert positions_2[0] == 0 and positions_3[0] == 1
+
+    controller.release("bot-1")
+    await asyncio.wait_for(second, 1)
+    assert not third.done()
+    assert controller.sessions == {"bot-2"}
+
+    controller.release("bot-2")
+    await asyncio.wait_for(third, 1)
+    assert controller.stats["admitted"] == 3
+    assert controller.stats["queued"] == 2
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrent_joins():
+    controller = AdmissionController(max_sessions=10, max_joining=1, poll_interval=0.01)
+    await _admit(controller, "bot-1")
+
+    second = asyncio.create_task(_admit(controller, "bot-2"))
+    await asyncio.sleep(0.03)
+    assert not second.done()
+
+    controller.joined("bot-1")
+    await asyncio.wait_for(second, 1)
+    assert controller.joining == {"bot-2"}
+
+
+@pytest.mark.asyncio
+async def test_rejects_after_queue_timeout():
+    controller = AdmissionController(max_sessions=1, queue_timeout=0.05, poll_interval=0.01)
+    await _admit(controller, "bot-1")
+
+    with pytest.raises(AdmissionTimeout):
+        await _admit(controller, "bot-2")
+
+    assert controller.stats["rejected"] == 1
+    assert controller.headroom()["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_waits_for_memory_headroom():
+    controller = AdmissionController(max_sessions=10, poll_interval=0.01)
+    with patch("bot.admission._available_memory_mb", return_value=100.0):
+        waiting = asyncio.create_task(_admit(controller, "bot-1"))
+        await asyncio.sleep(0.03)
+        assert not waiting.done()
+
+    # re-checked on the next poll
+    await asyncio.wait_for(waiting, 1)
+    assert controller.sessions == {"bot-1"}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    controller = AdmissionController(max_sessions=1, poll_interval=0.01)
+    await _admit(controller, "bot-1")
+
+    waiting = asyncio.create_task(_admit(controller, "bot-2"))
+    await asyncio.sleep(0.03)
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+
+    assert controller.headroom()["waiting"] == 0
+    controller.release("bot-1")
+    assert controller.sessions == set()
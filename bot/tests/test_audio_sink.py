@@ -0,0 +1,96 @@
+import pytest
+import base64
+import os
+import socket
+import struct
+import threading
+import numpy as np
+
+from bot.selenium_bot.audio_sink import AudioSink, FRAME_HEADER
+
+
+def _connect(sink: AudioSink, path: str | None = None) -> tuple[socket.socket, bytes]:
+    client = socket.create_connection((sink.host, sink.port), timeout=2)
+    key = base64.b64encode(os.urandom(16)).decode()
+    client.sendall(
+        (
+            f"GET {path or '/' + sink.token} HTTP/1.1\r\n"
+            f"Host: {sink.host}:{sink.port}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n\r\n"
+        ).encode()
+    )
+    response = b""
+    while b"\r\n\r\n" not in response:
+        data = client.recv(4096)
+        if not data:
+            break
+        response += data
+    return client, response
+
+
+def _masked_frame(payload: bytes, opcode: int = 0x2) -> bytes:
+    mask = os.urandom(4)
+    masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    length = len(payload)
+    if length < 126:
+        header = bytes([0x80 | opcode, 0x80 | length])
+    elif length < 65536:
+        header = bytes([0x80 | opcode, 0x80 | 126]) + struct.pack("!H", length)
+    else:
+        header = bytes([0x80 | opcode, 0x80 | 127]) + struct.pack("!Q", length)
+    return header + mask + masked
+
+
+@pytest.fixture
+def received():
+    return []
+
+
+@pytest.fixture
+def sink(received):
+    done = threading.Event()
+
+    def on_frame(frame):
+        received.append(frame)
+        done.set()
+
+    instance = AudioSink("test-sink", on_frame)
+    instance.start()
+    instance.done = done
+    yield instance
+    instance.stop()
+
+
+def test_receives_binary_frames(sink, received):
+    client, response = _connect(sink)
+    assert response.startswith(b"HTTP/1.1 101")
+
+    samples = np.linspace(-1, 1, 4096, dtype=np.float32)
+    frame = FRAME_HEADER.pack(123.5, 0, 0, 48000, len(samples), 0, 0) + samples.tobytes()
+    client.sendall(_masked_frame(frame))
+
+    assert sink.done.wait(timeout=2)
+    assert received == [frame]
+    assert sink.frames_received == 1
+    assert sink.connected.is_set()
+    client.close()
+
+
+def test_rejects_wrong_path(sink, received):
+    client, response = _connect(sink, path="/not-the-token")
+    assert response.startswith(b"HTTP/1.1 403")
+    assert not sink.connected.is_set()
+    client.close()
+
+
+def test_close_frame_disconnects(sink):
+    client, _ = _connect(sink)
+    assert sink.connected.wait(timeout=2)
+
+    client.sendall(_masked_frame(struct.pack("!H", 1000), opcode=0x8))
+    reply = client.recv(16)
+    assert reply[0] & 0x0F == 0x8
+    client.close()
@@ -0,0 +1,276 @@
+import os
+import threading
+import pytest
+from unittest.mock import MagicMock
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import InvalidSessionIdException
+
+from bot.selenium_bot.browser_host import (
+    BrowserHost,
+    BrowserHostManager,
+    TabDriver,
+    process_tree_rss,
+)
+
+
+class FakeDriver:
+    """Minimal shared driver that tracks tabs and the current window."""
+
+    def __init__(self):
+        self.window_handles = ["home"]
+        self.current_window_handle = "home"
+        self.calls = []
+        self.switch_to = MagicMock()
+        self.switch_to.window.side_effect = self._switch
+        self.switch_to.new_window.side_effect = lambda kind: self._new_tab()
+        self.cdp_fails = False
+        self._next = 0
+
+    def _switch(self, handle):
+        self.current_window_handle = handle
+
+    def _new_tab(self):
+        self._next += 1
+        self.window_handles.append(f"tab{self._next}")
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.calls.append((self.current_window_handle, cmd, params))
+        if cmd == "Target.createBrowserContext":
+            if self.cdp_fails:
+                raise Exception("not supported")
+            return {"browserContextId": f"ctx{self._next + 1}"}
+        if cmd == "Target.createTarget":
+            self._new_tab()
+            return {"targetId": self.window_handles[-1]}
+        return {}
+
+    def execute_script(self, script, *args):
+        self.calls.append((self.current_window_handle, script, args))
+        return self.current_window_handle
+
+    def find_element(self, by, value):
+        element = MagicMock(spec=WebElement)
+        element.click.side_effect = lambda: self.calls.append(
+            (self.current_window_handle, "click", ())
+        )
+        return element
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+    def quit(self):
+        self.calls.append((None, "quit", ()))
+
+
+@pytest.fixture
+def driver():
+    return FakeDriver()
+
+
+@pytest.fixture
+def host(driver):
+    return BrowserHost(driver, capacity=2)
+
+
+def test_open_tab_creates_isolated_context(host, driver):
+    tab = host.open_tab("bot-1")
+
+    assert isinstance(tab, TabDriver)
+    assert tab.handle == "tab1"
+    assert tab.context_id == "ctx1"
+    assert ("tab1", "Page.setBypassCSP", {"enabled": True}) in driver.calls
+    assert host.free_slots == 1
+
+
+def test_open_tab_falls_back_to_plain_tab(host, driver):
+    driver.cdp_fails = True
+
+    tab = host.open_tab("bot-1")
+
+    assert tab.handle == "tab1"
+    assert tab.context_id is None
+    driver.switch_to.new_window.assert_called_once_with("tab")
+
+
+def test_commands_run_in_their_own_tab(host, driver):
+    first = host.open_tab("bot-1")
+    second = host.open_tab("bot-2")
+
+    assert first.execute_script("return 1;") == "tab1"
+    assert second.execute_script("return 1;") == "tab2"
+    assert first.execute_script("return 1;") == "tab1"
+
+
+def test_elements_switch_back_to_their_tab(host, driver):
+    first = host.open_tab("bot-1")
+    second = host.open_tab("bot-2")
+
+    button = first.find_element("css selector", "button")
+    second.execute_script("return 1;")
+    button.click()
+
+    assert driver.calls[-1] == ("tab1", "click", ())
+
+
+def test_get_navigates_without_blocking(host, driver):
+    tab = host.open_tab("bot-1")
+
+    tab.get("https://meet.example/abc")
+
+    assert driver.calls[-1] == (
+        "tab1",
+        "window.location.href = arguments[0];",
+        ("https://meet.example/abc",),
+    )
+
+
+def test_quit_closes_only_own_tab(host, driver):
+    first = host.open_tab("bot-1")
+    second = host.open_tab("bot-2")
+
+    first.quit()
+
+    assert driver.window_handles == ["home", "tab2"]
+    assert ("home", "Target.disposeBrowserContext", {"browserContextId": "ctx1"}) in (
+        driver.calls
+    )
+    assert second.execute_script("return 1;") == "tab2"
+    assert host.free_slots == 1
+    with pytest.raises(Exception):
+        first.execute_script("return 1;")
+
+
+def test_dead_browser_marks_host(host, driver):
+    tab = host.open_tab("bot-1")
+    driver.execute_script = MagicMock(side_effect=InvalidSessionIdException("gone"))
+
+    with pytest.raises(InvalidSessionIdException):
+        tab.execute_script("return 1;")
+    assert host.alive is False
+
+
+def test_manager_fills_browsers_to_capacity():
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    manager = BrowserHostManager(factory, sessions_per_browser=2)
+    tabs = [manager.acquire(f"bot-{i}") for i in range(3)]
+
+    assert len(drivers) == 2
+    assert len(manager.hosts) == 2
+    assert [t._host for t in tabs[:2]] == [manager.hosts[0]] * 2
+
+    # a dead browser is dropped, the next session goes to a live one
+    manager.hosts[0].alive = False
+    tab = manager.acquire("bot-3")
+    assert manager.hosts == [tab._host]
+    assert len(drivers) == 2
+    assert (None, "quit", ()) in drivers[0].calls
+
+
+def test_manager_release_idle():
+    manager = BrowserHostManager(FakeDriver, sessions_per_browser=2)
+    tab = manager.acquire("bot-1")
+
+    tab.quit()
+    manager.release_idle()
+
+    assert manager.hosts == []
+
+
+def test_manager_launches_outside_its_lock():
+    launching = threading.Event()
+    launched = threading.Event()
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        if len(drivers) == 2:
+            launching.set()
+            launched.wait(1)  # a cold browser start
+        return drivers[-1]
+
+    manager = BrowserHostManager(factory, sessions_per_browser=1)
+    first = manager.acquire("bot-0")
+    acquired = []
+    threads = [
+        threading.Thread(target=lambda i=i: acquired.append(manager.acquire(f"bot-{i}")))
+        for i in (1, 2)
+    ]
+    threads[0].start()
+    assert launching.wait(1)
+
+    # placing a session on the first browser, once it is free again, and
+    # reaping idle browsers do not wait for the launch
+    first.quit()
+    threads[1].start()
+    threads[1].join(1)
+    assert [t.session_id for t in acquired] == ["bot-2"]
+    manager.release_idle()
+
+    launched.set()
+    threads[0].join(1)
+    assert sorted(t.session_id for t in acquired) == ["bot-1", "bot-2"]
+    assert len(drivers) == 2
+
+
+def test_manager_shares_a_browser_being_launched():
+    launched = threading.Event()
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        launched.wait(1)
+        return drivers[-1]
+
+    manager = BrowserHostManager(factory, sessions_per_browser=2)
+    acquired = []
+    threads = [
+        threading.Thread(target=lambda i=i: acquired.append(manager.acquire(f"bot-{i}")))
+        for i in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    launched.set()
+    for thread in threads:
+        thread.join(1)
+
+    assert len(drivers) == 1
+    assert len(acquired) == 2
+    assert acquired[0]._host is acquired[1]._host
+    assert manager.hosts[0].free_slots == 0
+
+
+def test_manager_failed_launch_reaches_waiting_sessions():
+    launched = threading.Event()
+
+    def factory():
+        launched.wait(1)
+        raise RuntimeError("chrome not found")
+
+    manager = BrowserHostManager(factory, sessions_per_browser=2)
+    errors = []
+
+    def acquire(session_id):
+        try:
+            manager.acquire(session_id)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=acquire, args=(f"bot-{i}",)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    launched.set()
+    for thread in threads:
+        thread.join(1)
+
+    assert [str(e) for e in errors] == ["chrome not found"] * 2
+    assert manager.hosts == []
+
+
+def test_process_tree_rss_of_self():
+    assert process_tree_rss(os.getpid()) > 0
+    assert process_tree_rss(2**22 + 12345) == 0
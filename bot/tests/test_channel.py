@@ -0,0 +1,117 @@
+import asyncio
+import queue
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from bot.audio.channel import AudioChannel
+from bot.audio.chunk import AudioChunk
+
+
+@pytest.mark.asyncio
+async def test_put_from_thread_wakes_consumer():
+    channel = AudioChannel()
+    threading.Timer(0.05, channel.put, args=("block",)).start()
+
+    start = time.monotonic()
+    item = await asyncio.wait_for(channel.get(), timeout=2)
+
+    assert item == "block"
+    assert time.monotonic() - start < 1
+    assert channel.stats["wakeups"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_iteration_ends_when_closed():
+    channel = AudioChannel()
+
+    def produce():
+        for i in range(3):
+            channel.put(i)
+        channel.close()
+
+    threading.Thread(target=produce).start()
+    items = [item async for item in channel]
+
+    assert items == [0, 1, 2]
+    assert channel.put(3) is False
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_without_items():
+    channel = AudioChannel()
+
+    assert await channel.wait(timeout=0.01) is False
+    channel.put(1)
+    assert await channel.wait(timeout=0.01) is True
+
+
+def test_drop_oldest():
+    channel = AudioChannel(capacity=2, overflow="drop-oldest")
+
+    for i in range(4):
+        assert channel.put(i)
+
+    assert [channel.get_nowait(), channel.get_nowait()] == [2, 3]
+    assert channel.stats["dropped_oldest"] == 2
+
+
+def test_drop_newest():
+    channel = AudioChannel(capacity=2, overflow="drop-newest")
+
+    results = [channel.put(i) for i in range(4)]
+
+    assert results == [True, True, False, False]
+    assert [channel.get_nowait(), channel.get_nowait()] == [0, 1]
+    with pytest.raises(queue.Empty):
+        channel.get_nowait()
+    assert channel.stats["dropped_newest"] == 2
+
+
+def test_block_waits_for_space():
+    channel = AudioChannel(capacity=1, overflow="block")
+    channel.put(0)
+
+    assert channel.put(1, timeout=0.01) is False
+
+    threading.Timer(0.05, channel.get_nowait).start()
+    assert channel.put(2, timeout=2) is True
+    assert channel.get_nowait() == 2
+    assert channel.stats["blocked_seconds"] > 0
+
+
+def test_close_releases_blocked_producer():
+    channel = AudioChannel(capacity=1, overflow="block")
+    channel.put(0)
+    threading.Timer(0.05, channel.close).start()
+
+    assert channel.put(1) is False
+
+
+def test_unknown_overflow_policy():
+    with pytest.raises(ValueError):
+        AudioChannel(overflow="drop-all")
+
+
+def test_max_samples_drops_oldest_blocks():
+    channel = AudioChannel(capacity=64, overflow="drop-oldest", max_samples=1000)
+
+    for i in range(4):
+        assert channel.put(AudioChunk(np.zeros(400, dtype=np.int16), 16000, i))
+
+    assert channel.samples == 800
+    assert [channel.get_nowait().timestamp for _ in range(2)] == [2, 3]
+    assert channel.stats["dropped_oldest"] == 2
+    assert channel.stats["dropped_samples"] == 800
+    assert channel.samples == 0
+
+
+def test_max_samples_drop_newest_and_oversized_block():
+    channel = AudioChannel(capacity=64, overflow="drop-newest", max_samples=1000)
+
+    # a block larger than the limit still goes into an empty channel
+    assert channel.put(AudioChunk(np.zeros(1500, dtype=np.int16), 16000, 0))
+    assert not channel.put(AudioChunk(np.zeros(10, dtype=np.int16), 16000, 1))
+    assert channel.stats["dropped_samples"] == 10
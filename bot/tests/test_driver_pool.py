@@ -0,0 +1,101 @@
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from bot.selenium_bot.driver_pool import DriverPool
+
+
+def _healthy_driver():
+    driver = MagicMock()
+    driver.execute_script.return_value = 1
+    return driver
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def factory():
+    return MagicMock(side_effect=lambda: _healthy_driver())
+
+
+@pytest.fixture
+def pool(factory):
+    instance = DriverPool(factory, size=2, max_idle=60, health_check_interval=0.05)
+    yield instance
+    instance.stop()
+
+
+def test_prewarms_to_size(pool, factory):
+    pool.start()
+
+    assert _wait_for(lambda: pool.idle_count() == 2)
+    assert factory.call_count == 2
+    driver, _ = pool._idle[0]
+    driver.get.assert_called_once_with("about:blank")
+
+
+def test_acquire_is_warm_and_replenishes(pool, factory):
+    pool.start()
+    assert _wait_for(lambda: pool.idle_count() == 2)
+
+    driver = pool.acquire()
+
+    assert driver.execute_script.return_value == 1
+    assert pool.stats["acquired_warm"] == 1
+    assert _wait_for(lambda: pool.idle_count() == 2)
+    assert factory.call_count == 3
+
+
+def test_acquire_launches_when_empty(factory):
+    pool = DriverPool(factory, size=0)
+
+    driver = pool.acquire()
+
+    assert driver is not None
+    assert pool.stats["acquired_cold"] == 1
+    factory.assert_called_once()
+
+
+def test_acquire_skips_unhealthy_driver(factory):
+    pool = DriverPool(factory, size=0)
+    broken = MagicMock()
+    broken.execute_script.side_effect = Exception("tab crashed")
+    pool._idle.append((broken, time.monotonic()))
+
+    driver = pool.acquire()
+
+    assert driver is not broken
+    broken.quit.assert_called_once()
+    assert pool.stats["unhealthy"] == 1
+    assert pool.stats["acquired_cold"] == 1
+
+
+def test_recycles_expired_idle_drivers(factory):
+    pool = DriverPool(factory, size=1, max_idle=0.05, health_check_interval=0.05)
+    pool.start()
+    assert _wait_for(lambda: pool.idle_count() == 1)
+    first, _ = pool._idle[0]
+
+    assert _wait_for(lambda: pool.stats["recycled"] >= 1)
+    first.quit.assert_called_once()
+    assert _wait_for(lambda: pool.idle_count() == 1)
+    pool.stop()
+
+
+def test_stop_quits_idle_drivers(pool):
+    pool.start()
+    assert _wait_for(lambda: pool.idle_count() == 2)
+    idle = [driver for driver, _ in pool._idle]
+
+    pool.stop()
+
+    assert pool.idle_count() == 0
+    for driver in idle:
+        driver.quit.assert_called_once()
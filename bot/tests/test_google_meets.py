@@ -4,8 +4,11 @@ import threading
 import numpy as np
 import base64
 from unittest.mock import MagicMock, patch, mock_open, ANY
+from selenium.common.exceptions import TimeoutException
 
 from bot.selenium_bot.google_meets import Bot
+from bot.config import JOIN_ADMITTED_TIMEOUT
+from bot.selenium_bot.audio_sink import FRAME_HEADER
 
 
 @pytest.fixture
@@ -61,7 +64,7 @@ def test_init(
     assert bot_instance.bot_name == "TestBotName"
     assert bot_instance.meeting_link == "http://fake.meeting.link"
     assert bot_instance.driver is mock_driver  # Check mock driver was injected
-    assert bot_instance.timeout == 60
+    assert bot_instance.timeout == JOIN_ADMITTED_TIMEOUT
     assert not bot_instance.audio_capture_started
     assert bot_instance.audio_queue is mock_queue
     assert bot_instance.pending is mock_pending
@@ -96,23 +99,123 @@ def test_setup_driver(
     assert call_kwargs.get("headless") is False
 
 
-def test_get_participants(bot_instance, mock_driver):
-    """Tests get_participants extracts text from mocked elements."""
+def test_setup_driver_uses_pool(mock_queue, mock_pending, mock_joined, mock_running):
+    pool = MagicMock()
+
+    bot = Bot(
+        "id",
+        "name",
+        "link",
+        mock_queue,
+        mock_pending,
+        mock_joined,
+        mock_running,
+        driver_pool=pool,
+    )
+
+    pool.acquire.assert_called_once()
+    assert bot.driver is pool.acquire.return_value
+    assert "driver_setup" in bot.timings
+
+
+def test_get_process_ids(bot_instance, mock_driver):
+    mock_driver.browser_pid = 101
+    mock_driver.service.process.pid = 100
+
+    assert bot_instance.get_process_ids() == [101, 100]
+
+    bot_instance.driver = None
+    assert bot_instance.get_process_ids() == []
+
+
+@patch("bot.selenium_bot.google_meets.JoinFlow")
+def test_join_meeting_records_steps(MockFlow, bot_instance, mock_joined):
+    flow = MockFlow.return_value
+    flow.steps = {"page_load": 0.5, "admitted": 2.0}
+    flow.transitions = []
+
+    bot_instance.join_meeting()
+
+    flow.run.assert_called_once_with("http://fake.meeting.link")
+    assert MockFlow.call_args.kwargs["admission_timeout"] == JOIN_ADMITTED_TIMEOUT
+    assert mock_joined.is_set()
+    assert bot_instance.timings["admitted"] == 2.0
+    assert bot_instance.get_join_steps() == []
+
+
+def test_get_participants_never_touches_the_driver(bot_instance, mock_driver):
+    bot_instance.roster = ["Alice"]
+
+    assert bot_instance.get_participants() == ["Alice"]
+    mock_driver.find_elements.assert_not_called()
+    mock_driver.execute_script.assert_not_called()
+
+
+def test_roster_without_tracker_queries_the_dom(bot_instance, mock_driver):
+    """Tests the capture loop keeps the roster fresh from mocked elements."""
     mock_element1 = MagicMock()
     mock_element1.text = " Alice "
     mock_element2 = MagicMock()
     mock_element2.text = "Bob"
     mock_element3 = MagicMock()
     mock_element3.text = ""
+    mock_driver.find_elements.return_value = [
+        mock_element1,
+        mock_element2,
+        mock_element3,
+    ]
+    changes = []
+    bot_instance.on_roster = changes.append
+
+    bot_instance._refresh_roster_if_due()
+    bot_instance._refresh_roster_if_due()  # rate limited
+
+    mock_driver.find_elements.assert_called_once()
+    assert bot_instance.get_participants() == ["Alice", "Bob"]
+    assert changes == [["Alice", "Bob"]]
+
+
+@patch("builtins.open", new_callable=mock_open, read_data="mock_roster_script")
+def test_start_roster_tracker(mock_file_open, bot_instance, mock_driver):
+    mock_driver.execute_script.side_effect = [
+        0,
+        {"version": 1, "participants": ["Alice", "Bob"]},
+    ]
 
-    mock_wait = MagicMock()
-    mock_wait.until.return_value = [mock_element1, mock_element2, mock_element3]
+    bot_instance._start_roster_tracker()
 
-    with patch("bot.selenium_bot.google_meets.WebDriverWait", return_value=mock_wait):
-        participants = bot_instance.get_participants()
+    assert mock_driver.execute_script.call_args_list[0].args[0].startswith(
+        "mock_roster_script"
+    )
+    assert bot_instance.roster_version == 1
+    assert bot_instance.get_participants() == ["Alice", "Bob"]
+
+
+def test_roster_cached_between_changes(bot_instance, mock_driver):
+    bot_instance.roster = ["Alice"]
+    bot_instance.roster_version = 3
+
+    # unchanged roster only returns the version
+    mock_driver.execute_script.return_value = {"version": 3}
+    bot_instance._refresh_roster()
+    mock_driver.execute_script.assert_called_once_with(ANY, 3)
+    assert bot_instance.get_participants() == ["Alice"]
+
+    mock_driver.execute_script.return_value = {"version": 4, "participants": ["Bob"]}
+    bot_instance._refresh_roster()
+    assert bot_instance.roster_version == 4
 
-        mock_wait.until.assert_called_once()
-        assert participants == ["Alice", "Bob"]
+    assert bot_instance.get_participants() == ["Bob"]
+
+
+def test_roster_refresh_is_rate_limited(bot_instance, mock_driver):
+    bot_instance.roster_version = 1
+    mock_driver.execute_script.return_value = {"version": 1}
+
+    bot_instance._refresh_roster_if_due()
+    bot_instance._refresh_roster_if_due()
+
+    mock_driver.execute_script.assert_called_once()
 
 
 @patch("builtins.open", new_callable=mock_open, read_data="mock_js_script_content")
@@ -192,3 +295,203 @@ def test_decode_audio_chunk(bot_instance):
     assert decoded["length"] == 3
     np.testing.assert_array_almost_equal(decoded["audio_data"], fake_audio)
     assert decoded["audio_data"].dtype == np.float32
+
+
+def test_decode_audio_frame(bot_instance):
+    fake_audio = np.array([0.1, -0.2, 0.3], dtype=np.float32)
+    frame = FRAME_HEADER.pack(12345.0, 96000, 7, 48000, len(fake_audio), 0, 3) + fake_audio.tobytes()
+
+    decoded = bot_instance._decode_audio_frame(frame)
+
+    assert decoded["timestamp"] == 12345.0
+    assert decoded["position"] == 96000
+    assert decoded["seq"] == 7
+    assert decoded["source_id"] == 3
+    assert decoded["sample_rate"] == 48000
+    assert decoded["length"] == 3
+    np.testing.assert_array_almost_equal(decoded["audio_data"], fake_audio)
+
+
+def test_on_audio_frame_enqueues(bot_instance, mock_queue):
+    fake_audio = np.array([0.5, 0.25], dtype=np.float32)
+    frame = FRAME_HEADER.pack(1.0, 0, 0, 48000, len(fake_audio), 0, 0) + fake_audio.tobytes()
+
+    bot_instance._on_audio_frame(frame)
+
+    chunk = mock_queue.get_nowait()
+    assert chunk.timestamp == 1.0
+    assert chunk.sample_rate == 48000
+    np.testing.assert_array_equal(chunk.data, fake_audio)
+
+
+def test_enqueue_audio_fills_gaps(bot_instance, mock_queue):
+    def decoded(seq, position):
+        return {
+            "timestamp": position / 16,
+            "seq": seq,
+            "position": position,
+            "audio_data": np.ones(160, dtype=np.int16),
+            "sample_rate": 16000,
+        }
+
+    bot_instance._enqueue_audio(decoded(0, 0))
+    bot_instance._enqueue_audio(decoded(2, 480))  # chunk 1 was dropped
+
+    sizes = [len(mock_queue.get_nowait().data) for _ in range(3)]
+    assert sizes == [160, 320, 160]
+    stats = bot_instance.get_capture_stats()
+    assert stats["chunks_dropped"] == 1
+    assert stats["gaps"] == 1
+    assert stats["silence_samples"] == 320
+
+
+def test_enqueue_audio_tracks_sources_separately(bot_instance, mock_queue):
+    def decoded(source_id, seq, position):
+        return {
+            "timestamp": 0.0,
+            "source_id": source_id,
+            "seq": seq,
+            "position": position,
+            "audio_data": np.ones(160, dtype=np.int16),
+            "sample_rate": 16000,
+        }
+
+    bot_instance._enqueue_audio(decoded(1, 0, 0))
+    bot_instance._enqueue_audio(decoded(2, 0, 0))
+    bot_instance._enqueue_audio(decoded(1, 1, 160))
+
+    chunks = [mock_queue.get_nowait() for _ in range(3)]
+    assert [c.source_id for c in chunks] == [1, 2, 1]
+    assert mock_queue.empty()  # no silence inserted across sources
+    stats = bot_instance.get_capture_stats()
+    assert stats["sources"] == 2
+    assert stats["gaps"] == 0
+
+
+def test_enqueue_audio_spools_chunks(bot_instance, mock_queue):
+    bot_instance.spool = MagicMock()
+
+    bot_instance._enqueue_audio(
+        {
+            "timestamp": 0.0,
+            "seq": 0,
+            "position": 0,
+            "audio_data": np.ones(160, dtype=np.int16),
+            "sample_rate": 16000,
+        }
+    )
+
+    chunk = mock_queue.get_nowait()
+    bot_instance.spool.append.assert_called_once_with(chunk)
+
+
+@patch("bot.selenium_bot.google_meets.AudioSink")
+def test_start_audio_sink_falls_back_to_polling(MockSink, bot_instance, mock_driver):
+    MockSink.return_value.start.return_value = "ws://127.0.0.1:1/token"
+    mock_driver.execute_script.return_value = False  # page could not connect
+
+    bot_instance._start_audio_sink()
+
+    mock_driver.execute_script.assert_called_once_with(
+        "return window.audioCapture.connectSink(arguments[0]);",
+        "ws://127.0.0.1:1/token",
+    )
+    MockSink.return_value.stop.assert_called_once()
+    assert bot_instance.audio_sink is None
+
+
+@patch("bot.selenium_bot.google_meets.AudioSink")
+def test_start_audio_sink_connected(MockSink, bot_instance, mock_driver):
+    mock_driver.execute_script.return_value = True
+
+    bot_instance._start_audio_sink()
+
+    assert bot_instance.audio_sink is MockSink.return_value
+    MockSink.return_value.stop.assert_not_called()
+
+
+@patch("bot.selenium_bot.google_meets.CAPTURE_ENGINE", "script-processor")
+@patch("bot.selenium_bot.google_meets.CAPTURE_CHUNK_SIZE", 2048)
+@patch("bot.selenium_bot.google_meets.CAPTURE_RING_BUFFER_SIZE", 32768)
+@patch("bot.selenium_bot.google_meets.CAPTURE_SAMPLE_RATE", 16000)
+@patch("bot.selenium_bot.google_meets.CAPTURE_FORMAT", "int16")
+@patch("bot.selenium_bot.google_meets.CAPTURE_MODE", "per-source")
+def test_configure_audio_capture(bot_instance, mock_driver):
+    bot_instance._configure_audio_capture()
+
+    mock_driver.execute_script.assert_called_once_with(
+        "return window.audioCapture.configure(arguments[0]);",
+        {
+            "engine": "script-processor",
+            "chunkSize": 2048,
+            "ringBufferSize": 32768,
+            "sampleRate": 16000,
+            "format": "int16",
+            "mode": "per-source",
+        },
+    )
+
+
+def test_decode_audio_chunk_int16(bot_instance):
+    fake_audio = np.array([1000, -2000, 32767], dtype=np.int16)
+    mock_chunk = {
+        "data": base64.b64encode(fake_audio.tobytes()).decode("utf-8"),
+        "timestamp": 12345,
+        "sampleRate": 16000,
+        "format": "int16",
+        "length": len(fake_audio),
+    }
+
+    decoded = bot_instance._decode_audio_chunk(mock_chunk)
+
+    assert decoded["sample_rate"] == 16000
+    assert decoded["format"] == "int16"
+    assert decoded["audio_data"].dtype == np.int16
+    np.testing.assert_array_equal(decoded["audio_data"], fake_audio)
+
+
+def test_decode_audio_frame_int16(bot_instance):
+    fake_audio = np.array([1, -1, 300], dtype=np.int16)
+    frame = FRAME_HEADER.pack(1.0, 0, 0, 16000, len(fake_audio), 1, 0) + fake_audio.tobytes()
+
+    decoded = bot_instance._decode_audio_frame(frame)
+
+    assert decoded["format"] == "int16"
+    np.testing.assert_array_equal(decoded["audio_data"], fake_audio)
+
+
+def test_poll_interval_adapts_to_backlog(bot_instance):
+    with patch("bot.selenium_bot.google_meets.CAPTURE_POLL_INTERVAL_MIN", 0.02), patch(
+        "bot.selenium_bot.google_meets.CAPTURE_POLL_INTERVAL_MAX", 0.25
+    ):
+        bot_instance.poll_interval = 0.2
+        assert bot_instance._next_poll_interval(4) == pytest.approx(0.05)
+        assert bot_instance._next_poll_interval(10) == 0.02
+        assert bot_instance._next_poll_interval(1) == 0.02
+        assert bot_instance._next_poll_interval(0) == pytest.approx(0.03)
+        for _ in range(10):
+            bot_instance._next_poll_interval(0)
+        assert bot_instance.poll_interval == 0.25
+
+
+def test_poll_stats(bot_instance):
+    bot_instance._record_poll(3, 12288, 0.002)
+    bot_instance._record_poll(1, 4096, 0.0)
+
+    stats = bot_instance.get_poll_stats()
+
+    assert stats["polls"] == 2
+    assert stats["chunks"] == 4
+    assert stats["max_chunks"] == 3
+    assert stats["recent_chunks_per_poll"] == 2
+    assert stats["recent_max_decode_ms"] == pytest.approx(2)
+
+
+@patch("bot.selenium_bot.google_meets.WebDriverWait")
+def test_cleanup_quits_driver_when_leaving_fails(MockWait, bot_instance, mock_driver):
+    MockWait.return_value.until.side_effect = TimeoutException()
+
+    with pytest.raises(TimeoutException):
+        bot_instance._cleanup()
+
+    mock_driver.quit.assert_called_once()
@@ -0,0 +1,118 @@
+import numpy as np
+
+from bot.livekit_streamer.jitter_buffer import JitterBuffer
+
+
+def _frames(count, value=0, captured_at=0.0):
+    return [(np.full(160, value, dtype=np.int16), captured_at) for _ in range(count)]
+
+
+def test_buffers_to_target_before_release():
+    buffer = JitterBuffer(0.01, min_delay=0.03, max_delay=0.5)
+
+    buffer.push(_frames(2), arrival=0.0)
+    assert buffer.target_depth == 3
+    assert buffer.pop() is None
+
+    buffer.push(_frames(1), arrival=0.01)
+    assert [buffer.pop() is not None for _ in range(3)] == [True] * 3
+    assert buffer.frames_sent == 3
+
+
+def test_underrun_rebuffers():
+    buffer = JitterBuffer(0.01, min_delay=0.01, max_delay=0.5)
+    buffer.push(_frames(1), arrival=0.0)
+
+    assert buffer.pop() is not None
+    assert buffer.pop() is None
+    assert buffer.underruns == 1
+    assert buffer.buffering
+
+    # further empty ticks while buffering are not counted again
+    assert buffer.pop() is None
+    assert buffer.underruns == 1
+
+
+def test_suppressed_frames_are_not_underruns():
+    buffer = JitterBuffer(0.01, min_delay=0.01, max_delay=0.5)
+    # a block of 4 frames the voice gate kept 1 of
+    buffer.push(_frames(1) + [None] * 3, arrival=0.0)
+
+    assert buffer.pop() is not None
+    assert [buffer.pop() for _ in range(3)] == [None] * 3
+    assert buffer.underruns == 0
+    assert buffer.suppressed_ticks == 3
+    assert not buffer.buffering
+
+    # past the suppressed audio an empty tick is an underrun again
+    assert buffer.pop() is None
+    assert buffer.underruns == 1
+
+
+def test_silence_then_speech_keeps_underruns():
+    buffer = JitterBuffer(0.01, min_delay=0.01, max_delay=0.5)
+    # silence the voice gate left out, then speech that runs dry
+    buffer.push([None] * 3, arrival=0.0)
+    buffer.push(_frames(2, value=1), arrival=0.05)
+
+    sent = [buffer.pop() for _ in range(5)]
+
+    # the silence is spent in its place, not after the speech
+    assert [frame is None for frame in sent] == [True] * 3 + [False] * 2
+    assert buffer.suppressed_ticks == 3
+    assert buffer.pop() is None
+    assert buffer.underruns == 1
+
+
+def test_pre_roll_ticks_are_not_underruns():
+    buffer = JitterBuffer(0.01, min_delay=0.01, max_delay=0.5)
+    buffer.push(_frames(1), arrival=0.0)
+    assert buffer.pop() is not None
+
+    # the gate holds the next 3 frames back as pre-roll
+    buffer.push([], arrival=0.03, media_frames=3, held=3)
+    assert [buffer.pop() for _ in range(3)] == [None] * 3
+    assert buffer.underruns == 0
+
+    # then sends them ahead of speech, they are played rather than skipped
+    buffer.push(_frames(3, value=1) + _frames(1, value=2), arrival=0.04, media_frames=1)
+    assert buffer.suppressed_ticks == 0
+    assert [buffer.pop()[0][0] for _ in range(4)] == [1, 1, 1, 2]
+
+    # held frames left out for good were paid for while held
+    buffer.push([], arrival=0.07, media_frames=2, held=2)
+    assert [buffer.pop() for _ in range(2)] == [None] * 2
+    buffer.push([None, None] + _frames(1, value=3), arrival=0.08, media_frames=1)
+    assert buffer.suppressed_ticks == 2
+    assert buffer.pop()[0][0] == 3
+    assert buffer.underruns == 0
+
+
+def test_overrun_drops_oldest_frames():
+    buffer = JitterBuffer(0.01, min_delay=0.01, max_delay=0.05)
+
+    buffer.push([(np.full(160, i, dtype=np.int16), 0.0) for i in range(8)], arrival=0.0)
+
+    assert buffer.overruns == 1
+    assert buffer.depth == buffer.target_depth == 5
+    assert buffer.frames_dropped == 3
+    assert buffer.pop()[0][0] == 3
+
+
+def test_target_follows_block_size_and_jitter():
+    steady = JitterBuffer(0.01, min_delay=0.01, max_delay=1.0)
+    jittery = JitterBuffer(0.01, min_delay=0.01, max_delay=1.0)
+
+    rng = np.random.default_rng(0)
+    for i in range(1, 50):
+        # 100 ms blocks, on time vs. up to 40 ms late
+        steady.push(_frames(10), arrival=i * 0.1)
+        jittery.push(_frames(10), arrival=i * 0.1 + rng.uniform(0, 0.04))
+        for _ in range(10):
+            steady.pop()
+            jittery.pop()
+
+    assert steady.target_depth == 10
+    assert steady.jitter < 1e-9
+    assert jittery.jitter > 0.005
+    assert jittery.target_depth > steady.target_depth
@@ -0,0 +1,102 @@
+import pytest
+from unittest.mock import MagicMock
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from bot.selenium_bot.join_flow import JoinFlow, JoinLatency, JoinState
+
+
+class FakeMeet:
+    """Driver whose pre-join screens appear as the flow interacts with them."""
+
+    DEVICE = "button[jsname='IbE0S']"
+    NAME = "input[jsname='YPqjbf']"
+    JOIN = "//span[contains(text(), 'Ask to join')]"
+    LEAVE = "//button[@aria-label='Leave call']"
+
+    def __init__(self, device_prompt=True, admit=True):
+        self.visible = {self.NAME}
+        if device_prompt:
+            self.visible.add(self.DEVICE)
+        self.admit = admit
+        self.elements = {}
+        self.typed = []
+
+    def get(self, url):
+        self.url = url
+
+    def find_element(self, by, value):
+        if value not in self.visible:
+            raise NoSuchElementException(value)
+        if value not in self.elements:
+            element = MagicMock()
+            element.is_displayed.return_value = True
+            element.is_enabled.return_value = True
+            element.click.side_effect = lambda v=value: self._click(v)
+            element.send_keys.side_effect = lambda keys: self._type(keys)
+            self.elements[value] = element
+        return self.elements[value]
+
+    def _click(self, value):
+        self.visible.discard(value)
+        if value == self.JOIN and self.admit:
+            self.visible.add(self.LEAVE)
+
+    def _type(self, keys):
+        self.typed.append(keys)
+        self.visible.add(self.JOIN)
+
+
+def test_join_with_device_prompt():
+    driver = FakeMeet()
+    on_pending = MagicMock()
+    flow = JoinFlow(driver, "Meepo", on_pending=on_pending)
+
+    flow.run("https://meet.example/abc")
+
+    assert [t[0] for t in flow.transitions] == [
+        JoinState.PAGE_LOAD,
+        JoinState.DEVICE_PROMPT,
+        JoinState.NAME_ENTRY,
+        JoinState.ASK_TO_JOIN,
+        JoinState.ADMITTED,
+    ]
+    assert driver.url == "https://meet.example/abc"
+    assert driver.typed == ["Meepo"]
+    on_pending.assert_called_once()
+    assert set(flow.steps) == {s.value for s in JoinState}
+
+
+def test_join_skips_missing_device_prompt():
+    driver = FakeMeet(device_prompt=False)
+    flow = JoinFlow(driver, "Meepo", step_timeout=5)
+
+    flow.run("https://meet.example/abc")
+
+    assert JoinState.DEVICE_PROMPT not in flow.visited
+    assert flow.state == JoinState.ADMITTED
+    # nothing waited for the absent prompt
+    assert sum(flow.steps.values()) < 1
+
+
+def test_join_times_out_in_current_state():
+    flow = JoinFlow(FakeMeet(admit=False), "Meepo", admission_timeout=0.2)
+
+    with pytest.raises(TimeoutException, match="Stuck in ask_to_join"):
+        flow.run("https://meet.example/abc")
+    assert flow.state == JoinState.ASK_TO_JOIN
+
+
+def test_join_latency_percentiles():
+    latency = JoinLatency(window=3)
+    for duration in (1.0, 2.0, 3.0, 4.0):
+        latency.record({"admitted": duration})
+
+    report = latency.percentiles()["admitted"]
+
+    assert report["count"] == 3
+    assert report["p50"] == 3.0
+    assert 3.9 < report["p99"] <= 4.0
+    assert "admitted p50=3000ms" in latency.summary()
+    # the histogram keeps every join, not only the window
+    assert latency.histograms["admitted"].count == 4
+    assert latency.histograms["admitted"].total == 10000.0
@@ -0,0 +1,23 @@
+from bot.livekit_streamer.latency import LatencyHistogram
+
+
+def test_records_into_buckets():
+    histogram = LatencyHistogram((10, 100, 1000))
+
+    for latency in (5, 50, 60, 70, 500, 2500):
+        histogram.record(latency)
+
+    assert histogram.counts == [1, 3, 1, 1]
+    assert histogram.buckets() == {"10": 1, "100": 4, "1000": 5, "+Inf": 6}
+    summary = histogram.summary()
+    assert summary["count"] == 6
+    assert summary["max_ms"] == 2500
+    assert summary["p50_ms"] == 100
+    assert summary["p99_ms"] == 2500
+
+
+def test_empty_summary():
+    summary = LatencyHistogram().summary()
+
+    assert summary["count"] == 0
+    assert summary["p99_ms"] == 0.0
@@ -1,17 +1,20 @@
 import pytest
-import queue
 import threading
 import numpy as np
+import asyncio
+import time
 from unittest.mock import MagicMock, patch, AsyncMock
 from livekit import rtc, api
 from livekit.rtc import AudioFrame
 
 from bot.livekit_streamer.lk_streamer import LiveKitStreamer
+from bot.audio.chunk import AudioChunk
+from bot.audio.channel import AudioChannel
 
 
 @pytest.fixture
 def mock_queue():
-    return queue.Queue()
+    return AudioChannel()
 
 
 @pytest.fixture
@@ -93,7 +96,7 @@ async def test_stream_audio(streamer, mock_queue, mock_event):
     fake_audio_data = np.linspace(
         -0.5, 0.5, streamer.samples_per_frame + 50, dtype=np.float32
     )
-    mock_queue.put(fake_audio_data)
+    mock_queue.put(AudioChunk(fake_audio_data, streamer.sample_rate, 0.0))
 
     mock_event.set()
 
@@ -126,3 +129,228 @@ async def test_stream_audio(streamer, mock_queue, mock_event):
     assert mock_queue.empty()
 
     assert not mock_event.is_set()
+
+
+@pytest.mark.asyncio
+async def test_stream_audio_int16_passthrough(streamer, mock_queue, mock_event):
+    streamer.audio_source = MagicMock(spec=rtc.AudioSource)
+    streamer.audio_source.capture_frame = AsyncMock()
+
+    fake_audio_data = np.arange(streamer.samples_per_frame, dtype=np.int16)
+    mock_queue.put(AudioChunk(fake_audio_data, streamer.sample_rate, 0.0))
+    mock_event.set()
+
+    async def sleep_and_clear_event(*args, **kwargs):
+        mock_event.clear()
+
+    with patch(
+        "bot.livekit_streamer.lk_streamer.asyncio.sleep",
+        AsyncMock(side_effect=sleep_and_clear_event),
+    ):
+        await streamer._stream_audio()
+
+    captured_frame = streamer.audio_source.capture_frame.call_args_list[0].args[0]
+    np.testing.assert_array_equal(
+        np.frombuffer(captured_frame.data, dtype=np.int16), fake_audio_data
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_audio_publishes_track_per_source(streamer, mock_queue, mock_event):
+    streamer.capture_mode = "per-source"
+    streamer.room = MagicMock()
+    streamer.room.local_participant.publish_track = AsyncMock()
+
+    frame = np.zeros(streamer.samples_per_frame, dtype=np.int16)
+    mock_queue.put(AudioChunk(frame, streamer.sample_rate, 0.0, source_id=1))
+    mock_queue.put(AudioChunk(frame, streamer.sample_rate, 0.0, source_id=2))
+    mock_queue.put(AudioChunk(frame, streamer.sample_rate, 10.0, source_id=1))
+    mock_event.set()
+
+    async def sleep_and_clear_event(*args, **kwargs):
+        # one frame per source is released per tick, run until all are sent
+        if mock_queue.empty() and not any(
+            b.depth for b in streamer.jitter_buffers.values()
+        ):
+            mock_event.clear()
+
+    with patch(
+        "bot.livekit_streamer.lk_streamer.rtc.AudioSource"
+    ) as MockAudioSource, patch(
+        "bot.livekit_streamer.lk_streamer.rtc.LocalAudioTrack.create_audio_track"
+    ) as mock_create_track, patch(
+        "bot.livekit_streamer.lk_streamer.asyncio.sleep",
+        AsyncMock(side_effect=sleep_and_clear_event),
+    ):
+        MockAudioSource.return_value.capture_frame = AsyncMock()
+        await streamer._stream_audio()
+
+    assert streamer.room.local_participant.publish_track.await_count == 2
+    track_names = [c.args[0] for c in mock_create_track.call_args_list]
+    assert track_names == ["meeting_audio_1", "meeting_audio_2"]
+    assert set(streamer.audio_sources) == {1, 2}
+    assert MockAudioSource.return_value.capture_frame.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_audio_paces_frames(streamer, mock_queue, mock_event):
+    streamer.audio_source = MagicMock(spec=rtc.AudioSource)
+    sent_at = []
+    streamer.audio_source.capture_frame = AsyncMock(
+        side_effect=lambda frame: sent_at.append(time.monotonic())
+    )
+    streamer.jitter_min = 0.02
+
+    frames = 5
+    data = np.zeros(streamer.samples_per_frame * frames, dtype=np.int16)
+    mock_queue.put(AudioChunk(data, streamer.sample_rate, 0.0))
+    mock_event.set()
+
+    async def stop_when_drained():
+        while len(sent_at) < frames:
+            await asyncio.sleep(0.005)
+        mock_event.clear()
+        mock_queue.close()
+
+    stopper = asyncio.create_task(stop_when_drained())
+    await streamer._stream_audio()
+    await stopper
+
+    # one frame per tick instead of a burst
+    gaps = np.diff(sent_at)
+    assert np.all(gaps > streamer.frame_duration * 0.5)
+
+    stats = streamer.get_stream_stats()
+    assert stats["sources"][0]["frames_sent"] == frames
+    assert stats["ticks"] >= frames
+    assert stats["pacing_error_ms"] < 20
+
+
+@pytest.mark.asyncio
+async def test_wait_until_resyncs_after_stall(streamer):
+    now = time.monotonic()
+
+    deadline = await streamer._wait_until(now - 1.0)
+
+    assert deadline >= now
+    assert streamer.pacing_stats["late_ticks"] == 1
+    assert streamer.pacing.counts[-1] == 1  # a second late, above every bucket
+
+
+def test_to_frames_carries_remainder_over(streamer):
+    spf = streamer.samples_per_frame
+    first = np.arange(spf + 50, dtype=np.int16)
+    second = np.arange(spf + 50, 3 * spf + 100, dtype=np.int16)
+
+    frames = np.concatenate(
+        (streamer._to_frames(0, first), streamer._to_frames(0, second))
+    )
+
+    assert frames.shape == (3, spf)
+    samples = frames.ravel()
+    # continuous, no zeros padded in between blocks
+    np.testing.assert_array_equal(samples, np.arange(3 * spf, dtype=np.int16))
+    np.testing.assert_array_equal(
+        streamer.remainders[0], np.arange(3 * spf, 3 * spf + 100, dtype=np.int16)
+    )
+
+
+def test_to_frames_converts_float_once(streamer):
+    spf = streamer.samples_per_frame
+    data = np.linspace(-1.5, 1.5, 2 * spf, dtype=np.float32)
+
+    frames = streamer._to_frames(1, data)
+
+    assert frames.dtype == np.int16
+    assert frames.shape == (2, spf)
+    # rows are views of one buffer
+    assert frames[0].base is frames[1].base
+    expected = (np.clip(data, -1.0, 1.0) * 32767).astype(np.int16)
+    np.testing.assert_array_equal(frames.ravel(), expected)
+    assert len(streamer.remainders[1]) == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_audio_waits_while_idle(streamer, mock_queue, mock_event):
+    streamer.audio_source = MagicMock(spec=rtc.AudioSource)
+    streamer.audio_source.capture_frame = AsyncMock()
+    mock_event.set()
+
+    task = asyncio.create_task(streamer._stream_audio())
+    await asyncio.sleep(0.1)
+
+    # no ticks without audio
+    assert streamer.pacing_stats["ticks"] == 0
+
+    data = np.zeros(streamer.samples_per_frame, dtype=np.int16)
+    threading.Thread(
+        target=mock_queue.put, args=(AudioChunk(data, streamer.sample_rate, 0.0),)
+    ).start()
+    await asyncio.sleep(0.1)
+    mock_event.clear()
+    mock_queue.close()
+    await asyncio.wait_for(task, timeout=1)
+
+    streamer.audio_source.capture_frame.assert_awaited_once()
+
+
+def test_receive_audio_gates_silence(streamer, mock_queue):
+    streamer.vad_enabled = True
+    spf = streamer.samples_per_frame
+    silence = np.zeros(spf * 50, dtype=np.int16)
+    t = np.arange(spf * 10) / streamer.sample_rate
+    tone = (np.sin(2 * np.pi * 220 * t) * 10000).astype(np.int16)
+
+    mock_queue.put(AudioChunk(silence, streamer.sample_rate, 0.0))
+    streamer._receive_audio()
+    buffer = streamer.jitter_buffers[0]
+    # the silence is left out, its ticks stay in place
+    assert buffer.frames_received == 0
+    assert buffer.depth > 0
+
+    mock_queue.put(AudioChunk(tone, streamer.sample_rate, 0.0))
+    streamer._receive_audio()
+    assert buffer.frames_received > 10
+
+    vad = streamer.get_stream_stats()["vad"]
+    assert vad["speech_ratio"] == 10 / 60
+    assert vad["suppressed_frames"] > 0
+
+
+def test_receive_audio_resamples_to_publish_rate(streamer, mock_queue):
+    spf = streamer.samples_per_frame
+    # one second captured at 48 kHz
+    data = np.zeros(48000, dtype=np.int16)
+
+    mock_queue.put(AudioChunk(data, 48000, 0.0))
+    streamer._receive_audio()
+
+    assert streamer.resamplers[0].input_rate == 48000
+    assert streamer.jitter_buffers[0].frames_received == streamer.sample_rate // spf
+
+
+@pytest.mark.asyncio
+async def test_stream_audio_records_capture_latency(streamer, mock_queue, mock_event):
+    streamer.audio_source = MagicMock(spec=rtc.AudioSource)
+    streamer.audio_source.capture_frame = AsyncMock()
+
+    # captured 200 ms ago, two frames
+    data = np.zeros(streamer.samples_per_frame * 2, dtype=np.int16)
+    mock_queue.put(AudioChunk(data, streamer.sample_rate, time.time() * 1000 - 200))
+    mock_event.set()
+
+    async def sleep_and_clear_event(*args, **kwargs):
+        if not any(b.depth for b in streamer.jitter_buffers.values()):
+            mock_event.clear()
+
+    with patch(
+        "bot.livekit_streamer.lk_streamer.asyncio.sleep",
+        AsyncMock(side_effect=sleep_and_clear_event),
+    ):
+        await streamer._stream_audio()
+
+    latency = streamer.get_stream_stats()["latency"]
+    assert latency["count"] == 2
+    # ends of the frames: 180 and 160 ms before publishing, plus a bit
+    assert 150 < latency["mean_ms"] < 250
+    assert latency["buckets"]["200"] == 2
@@ -0,0 +1,149 @@
+import asyncio
+import urllib.error
+import urllib.request
+
+import grpc
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from bot.audio.channel import AudioChannel
+from bot.livekit_streamer.latency import LatencyHistogram
+from bot.metrics import (
+    MetricsRegistry,
+    RpcMetricsInterceptor,
+    session_samples,
+    start_metrics_server,
+)
+
+
+def test_render_counters_and_histograms():
+    histogram = LatencyHistogram((10, 100))
+    for latency_ms in (5, 50, 500):
+        histogram.record(latency_ms)
+    registry = MetricsRegistry(
+        {
+            "frames_total": ("counter", "Frames."),
+            "latency_seconds": ("histogram", "Latency."),
+        }
+    )
+    registry.register(
+        "test",
+        lambda: [
+            ("frames_total", {"bot_id": 'a"b'}, 3),
+            ("frames_total", {"bot_id": "c"}, 4),
+            ("latency_seconds", {}, histogram),
+        ],
+    )
+
+    assert registry.render().splitlines() == [
+        "# HELP frames_total Frames.",
+        "# TYPE frames_total counter",
+        'frames_total{bot_id="a\\"b"} 3',
+        'frames_total{bot_id="c"} 4',
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.01"} 1',
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="+Inf"} 3',
+        "latency_seconds_sum 0.555",
+        "latency_seconds_count 3",
+    ]
+
+
+def test_failing_collector_is_skipped():
+    registry = MetricsRegistry()
+    registry.register("broken", lambda: 1 / 0)
+    registry.register("ok", lambda: [("meepo_sessions_active", {}, 2)])
+
+    assert "meepo_sessions_active 2" in registry.render()
+
+
+def test_session_samples():
+    audio_queue = AudioChannel(4, "drop-oldest")
+    for n in range(6):
+        audio_queue.put(n)
+    buffer = SimpleNamespace(depth=2, frames_sent=10, frames_dropped=1, underruns=3)
+    bot_instance = MagicMock()
+    bot_instance.poll_stats = {"polls": 7, "chunks": 5, "decode_seconds": 0.25}
+    bot_instance.get_capture_stats.return_value = {"chunks_received": 5}
+    streamer = SimpleNamespace(
+        jitter_buffers={0: buffer, 1: buffer},
+        pacing=LatencyHistogram(),
+        pacing_stats={"late_ticks": 1},
+        latency=LatencyHistogram(),
+    )
+
+    session = {
+        "bot": bot_instance,
+        "audio_queue": audio_queue,
+        "livekit_streamer": streamer,
+    }
+
+    samples = {name: value for name, _, value in session_samples("bot-1", session)}
+
+    assert samples["meepo_capture_polls_total"] == 7
+    assert samples["meepo_capture_decode_seconds_total"] == 0.25
+    assert samples["meepo_capture_chunks_dropped_total"] == 0
+    assert samples["meepo_queue_depth"] == 4
+    assert samples["meepo_queue_dropped_total"] == 2
+    assert samples["meepo_frames_published_total"] == 20
+    assert samples["meepo_jitter_buffer_depth"] == 4
+    assert samples["meepo_publish_latency_seconds"] is streamer.latency
+    assert list(session_samples("bot-2", {"worker": 0})) == []
+
+
+@pytest.mark.asyncio
+async def test_interceptor_times_rpcs():
+    async def unary(request, context):
+        return request
+
+    async def stream(request, context):
+        yield request
+        await asyncio.sleep(0.01)
+        yield request
+
+    interceptor = RpcMetricsInterceptor(exclude=("Watch",))
+    handlers = {
+        "/BotService/Leave": grpc.unary_unary_rpc_method_handler(unary),
+        "/BotService/Join": grpc.unary_stream_rpc_method_handler(stream),
+        "/BotService/Watch": grpc.unary_stream_rpc_method_handler(stream),
+    }
+
+    async def intercept(method):
+        async def continuation(details):
+            return handlers[details.method]
+
+        return await interceptor.intercept_service(
+            continuation, SimpleNamespace(method=method)
+        )
+
+    leave = await intercept("/BotService/Leave")
+    assert await leave.unary_unary("req", None) == "req"
+    join = await intercept("/BotService/Join")
+    assert [r async for r in join.unary_stream("req", None)] == ["req", "req"]
+    watch = await intercept("/BotService/Watch")
+    assert watch is handlers["/BotService/Watch"]
+
+    assert interceptor.latency["Leave"].count == 1
+    assert interceptor.latency["Join"].total >= 10
+    assert "Watch" not in interceptor.latency
+    assert {labels["method"] for _, labels, _ in interceptor.samples()} == {
+        "Leave",
+        "Join",
+    }
+
+
+def test_metrics_endpoint():
+    registry = MetricsRegistry()
+    registry.register("test", lambda: [("meepo_sessions_active", {}, 1)])
+    server = start_metrics_server("127.0.0.1", 0, registry)
+    base = f"http://127.0.0.1:{server.server_port}"
+    try:
+        with urllib.request.urlopen(f"{base}/metrics", timeout=2) as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert "meepo_sessions_active 1" in response.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{base}/other", timeout=2)
+    finally:
+        server.shutdown()
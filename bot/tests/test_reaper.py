@@ -0,0 +1,100 @@
+import asyncio
+import subprocess
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+from bot.reaper import SessionReaper
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def _session(pids=(), stuck=None):
+    running = threading.Event()
+    running.set()
+
+    def execute():
+        # a bot that leaves when asked, unless it is stuck
+        while running.is_set() or (stuck is not None and stuck.is_set()):
+            time.sleep(0.01)
+
+    thread = threading.Thread(target=execute, daemon=True)
+    thread.start()
+    bot = MagicMock()
+    bot.get_process_ids.return_value = list(pids)
+    return {
+        "bot": bot,
+        "selenium_evt": running,
+        "livekit_evt": threading.Event(),
+        "selenium_thread": thread,
+        "audio_queue": MagicMock(),
+        "spool": MagicMock(),
+    }
+
+
+async def test_teardown_stops_the_session():
+    session = _session()
+    streamer_host = MagicMock()
+
+    report = await SessionReaper(timeout=2).teardown("bot-1", session, streamer_host)
+
+    assert report["stopped"]
+    assert not session["selenium_thread"].is_alive()
+    streamer_host.stop_streamer.assert_called_once_with("bot-1")
+    session["audio_queue"].close.assert_called_once()
+    session["spool"].close.assert_called_once()
+    # no processes of its own, like a tab of a shared browser
+    session["bot"].driver.quit.assert_called_once()
+
+
+async def test_teardown_is_bounded_for_stuck_sessions():
+    stuck = threading.Event()
+    stuck.set()
+    session = _session(stuck=stuck)
+    reaper = SessionReaper(timeout=0.2)
+
+    report = await reaper.teardown("bot-1", session)
+
+    assert not report["stopped"]
+    assert report["seconds"] < 1
+    assert reaper.stats["timeouts"] == 1
+    session["spool"].close.assert_called_once()
+    stuck.clear()
+
+
+async def test_teardown_kills_leftover_processes():
+    stubborn = subprocess.Popen(
+        ["sh", "-c", "trap '' TERM; while true; do sleep 0.05; done"]
+    )
+    polite = subprocess.Popen(["sleep", "30"])
+    await asyncio.sleep(0.1)  # let the shell install its trap
+    session = _session(pids=[polite.pid, stubborn.pid])
+    reaper = SessionReaper(timeout=1, kill_timeout=0.3)
+
+    report = await reaper.teardown("bot-1", session)
+
+    assert report["processes"] == 2
+    assert report["processes_terminated"] == 1
+    assert report["processes_killed"] == 1
+    assert polite.poll() is not None
+    assert stubborn.wait(1) is not None
+    session["bot"].driver.quit.assert_not_called()
+
+
+async def test_reap_removes_ended_sessions():
+    ended = _session()
+    ended["selenium_evt"].clear()
+    ended["selenium_thread"].join(1)
+    running = _session()
+    sessions = {"bot-1": ended, "bot-2": running}
+    reaped = []
+
+    reports = await SessionReaper(timeout=1).reap(sessions, on_reaped=reaped.append)
+
+    assert len(reports) == 1
+    assert sessions == {"bot-2": running}
+    assert reaped == ["bot-1"]
+    running["selenium_evt"].clear()
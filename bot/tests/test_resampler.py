@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from bot.audio.resampler import Resampler
+
+
+def _tone(freq, rate, seconds=1.0, level=0.5):
+    t = np.arange(int(rate * seconds)) / rate
+    return (np.sin(2 * np.pi * freq * t) * level).astype(np.float32)
+
+
+def _peak_hz(samples, rate):
+    spectrum = np.abs(np.fft.rfft(samples * np.hanning(len(samples))))
+    return np.argmax(spectrum) * rate / len(samples)
+
+
+@pytest.mark.parametrize("input_rate,output_rate", [(48000, 16000), (44100, 16000), (16000, 48000)])
+def test_resamples_tone(input_rate, output_rate):
+    resampler = Resampler(input_rate, output_rate)
+
+    out = resampler.process(_tone(440, input_rate))
+
+    assert len(out) == output_rate
+    assert out.dtype == np.float32
+    assert abs(_peak_hz(out, output_rate) - 440) < 2
+    # skip the filter's start-up transient
+    steady = out[int(resampler.delay) * 2 :]
+    assert np.max(np.abs(steady)) == pytest.approx(0.5, abs=0.02)
+
+
+def test_chunked_matches_one_shot():
+    data = _tone(440, 44100)
+    whole = Resampler(44100, 16000).process(data)
+
+    resampler = Resampler(44100, 16000)
+    sizes = [1, 4096, 333, 2048, 4096]
+    parts, start = [], 0
+    for size in sizes + [len(data)]:
+        parts.append(resampler.process(data[start : start + size]))
+        start += size
+
+    np.testing.assert_allclose(np.concatenate(parts), whole, atol=1e-6)
+
+
+def test_suppresses_content_above_output_nyquist():
+    # 12 kHz would alias to 4 kHz at 16 kHz
+    out = Resampler(48000, 16000).process(_tone(12000, 48000))
+
+    assert np.sqrt(np.mean(out[100:] ** 2)) < 1e-3
+
+
+def test_int16_in_int16_out():
+    data = (_tone(440, 48000) * 32767).astype(np.int16)
+
+    out = Resampler(48000, 16000).process(data)
+
+    assert out.dtype == np.int16
+    assert len(out) == 16000
+
+
+def test_equal_rates_pass_through():
+    data = _tone(440, 16000)
+
+    assert Resampler(16000, 16000).process(data) is data
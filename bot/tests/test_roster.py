@@ -0,0 +1,71 @@
+import asyncio
+import threading
+
+import pytest
+
+from bot.roster import RosterFeed
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _next(events):
+    return await asyncio.wait_for(anext(events), 1)
+
+
+async def test_watch_streams_a_snapshot_then_deltas():
+    roster = RosterFeed(asyncio.get_running_loop())
+    roster.update(["Ada"])
+    await asyncio.sleep(0)
+
+    events = roster.watch()
+    assert await _next(events) == ("snapshot", ["Ada"], 1)
+
+    threading.Thread(target=roster.update, args=(["Ada", "Grace"],)).start()
+    assert await _next(events) == ("joined", ["Grace"], 2)
+
+    roster.update(["Grace", "Linus"])
+    assert await _next(events) == ("left", ["Ada"], 3)
+    assert await _next(events) == ("joined", ["Linus"], 3)
+    assert roster.participants == ["Grace", "Linus"]
+
+
+async def test_unchanged_and_duplicate_names():
+    roster = RosterFeed(asyncio.get_running_loop())
+    events = roster.watch()
+    assert await _next(events) == ("snapshot", [], 0)
+
+    roster.update(["Ada"])
+    roster.update(["Ada"])  # no change, no event
+    roster.update(["Ada", "Ada"])
+    assert await _next(events) == ("joined", ["Ada"], 1)
+    assert await _next(events) == ("joined", ["Ada"], 2)
+    assert roster.version == 2
+
+
+async def test_slow_watcher_is_resynced():
+    roster = RosterFeed(asyncio.get_running_loop(), max_pending=2)
+    events = roster.watch()
+    assert await _next(events) == ("snapshot", [], 0)
+
+    for n in range(1, 6):
+        roster.update([f"p{i}" for i in range(n)])
+    await asyncio.sleep(0)
+
+    # deltas it could not keep up with were replaced by the latest roster
+    assert await _next(events) == ("snapshot", ["p0", "p1", "p2", "p3", "p4"], 5)
+    roster.update(["p1"])
+    assert await _next(events) == ("left", ["p0", "p2", "p3", "p4"], 6)
+
+
+async def test_close_ends_watches():
+    roster = RosterFeed(asyncio.get_running_loop())
+    events = roster.watch()
+    await _next(events)
+
+    roster.close()
+    with pytest.raises(StopAsyncIteration):
+        await _next(events)
+
+    # watching a closed roster still gets its snapshot
+    assert [e async for e in roster.watch()] == [("snapshot", [], 0)]
@@ -0,0 +1,139 @@
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+SCRIPT = os.path.join(
+    os.path.dirname(__file__), "..", "src", "bot", "selenium_bot", "roster_tracker.js"
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+
+# just enough of the DOM for roster_tracker.js: descendant selectors made of
+# tag[attr='value'] parts, matched against the whole page like the browser does
+FAKE_DOM = """
+class El {
+  constructor(tag, attrs, children, text) {
+    this.tag = tag; this.attrs = attrs || {}; this.text = text || "";
+    this.parentNode = null; this.children = [];
+    for (const child of children || []) this.append(child);
+  }
+  append(child) { child.parentNode = this; this.children.push(child); return child; }
+  get isConnected() { return document.body.contains(this); }
+  get textContent() { return this.text + this.children.map((c) => c.textContent).join(""); }
+  contains(other) {
+    for (let n = other; n; n = n.parentNode) if (n === this) return true;
+    return false;
+  }
+  matches(part) {
+    const m = part.match(/^(\\w+)(?:\\[(\\w+)='([^']*)'\\])?$/);
+    return this.tag === m[1] && (!m[2] || this.attrs[m[2]] === m[3]);
+  }
+  querySelectorAll(selector) {
+    const parts = selector.split(" ");
+    const found = [];
+    const walk = (el) => {
+      for (const child of el.children) {
+        let i = parts.length - 1;
+        if (child.matches(parts[i])) {
+          for (let n = child.parentNode; n && i > 0; n = n.parentNode) {
+            if (n.matches(parts[i - 1])) i -= 1;
+          }
+          if (i === 0) found.push(child);
+        }
+        walk(child);
+      }
+    };
+    walk(this);
+    return found;
+  }
+}
+const panel = (...names) => new El("div", { jsname: "giiMnc" }, names.map(
+  (name) => new El("div", {}, [new El("span", { class: "notranslate" }, [], name)])
+));
+const observed = [];
+global.MutationObserver = class {
+  constructor(callback) { this.callback = callback; }
+  observe(target, options) { observed.push({ target, options }); }
+  disconnect() {}
+};
+global.document = { body: new El("body") };
+document.querySelectorAll = (selector) => document.body.querySelectorAll(selector);
+global.window = {};
+global.console = { log: () => {} };
+"""
+
+
+def run_tracker(scenario: str) -> dict:
+    with open(SCRIPT) as f:
+        script = f.read()
+    result = subprocess.run(
+        [
+            "node",
+            "-e",
+            FAKE_DOM
+            + script
+            + "\nconst rosterTracker = window.rosterTracker;"
+            + "\n(async () => {"
+            + scenario
+            + "})();",
+        ],
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+def test_tracks_every_panel():
+    result = run_tracker(
+        """
+        const list = document.body.append(new El("div", {}, [
+          panel("Participant A"), new El("div", {}, [panel("Participant B")]),
+        ]));
+        rosterTracker.start({ debounceMs: 1 });
+        const attached = observed[observed.length - 1];
+
+        // a name added to the second panel is seen through the common ancestor
+        list.children[1].children[0].append(panel("Participant C"));
+        rosterTracker.observer.callback([{}]);
+        await new Promise((resolve) => setTimeout(resolve, 10));
+
+        process.stdout.write(JSON.stringify({
+          target_is_list: attached.target === list,
+          character_data: attached.options.characterData,
+          participants: rosterTracker.snapshot().participants,
+        }));
+        """
+    )
+
+    assert result["target_is_list"] is True
+    assert result["character_data"] is True
+    assert result["participants"] == ["Participant A", "Participant B", "Participant C"]
+
+
+def test_snapshot_notices_a_panel_outside_the_observed_one():
+    result = run_tracker(
+        """
+        document.body.append(panel("Participant A"));
+        rosterTracker.start({ debounceMs: 1 });
+        const first = rosterTracker.snapshot();
+
+        // nothing under the observed panel changes, no mutation is reported
+        document.body.append(panel("Participant B"));
+        const second = rosterTracker.snapshot(first.version);
+
+        process.stdout.write(JSON.stringify({
+          first: first.participants,
+          second: second.participants,
+          target_is_body: rosterTracker.target === document.body,
+        }));
+        """
+    )
+
+    assert result["first"] == ["Participant A"]
+    assert result["second"] == ["Participant A", "Participant B"]
+    assert result["target_is_body"] is True
@@ -8,6 +8,10 @@ from bot.pb import bot_pb2
 from bot.server import MeetingBotServicer
 from bot import server as bot_server
 from bot.models import Session
+from bot.admission import AdmissionController
+from bot.roster import RosterFeed
+from bot.session_events import SessionEventHub
+from bot.metrics import MetricsRegistry
 
 pytestmark = pytest.mark.asyncio
 
@@ -20,61 +24,35 @@ def mock_context():
     return context
 
 
-@patch("bot.server.asyncio.get_running_loop")
-@patch("bot.server.threading.Thread")
+@patch("bot.server.run_bot")
 @patch("bot.server.LiveKitStreamer")
 @patch("bot.server.Bot")
 async def test_join_meeting_success(
     MockBot,
     MockLiveKit,
-    MockThread,
-    MockGetLoop,
+    MockRunBot,
     mock_context,
 ):
     event_store = {}  # store real events
 
     mock_bot_instance = MockBot.return_value
+    mock_bot_instance.get_join_steps.return_value = [
+        ("page_load", 1700000000000.0, 0.8),
+        ("admitted", 1700000005000.0, 4.2),
+    ]
 
     def bot_init_capture(*args, **kwargs):
-        print("Captured Bot init, storing real events...")
         event_store["pending"] = args[4]
         event_store["joined"] = args[5]
         assert isinstance(event_store["pending"], threading.Event)
         assert isinstance(event_store["joined"], threading.Event)
+        # built off the loop; set later on, the RPC awaits them without a thread
+        threading.Timer(0.01, args[4].set).start()
+        threading.Timer(0.02, args[5].set).start()
         return mock_bot_instance
 
     MockBot.side_effect = bot_init_capture
 
-    mock_thread_instance = MagicMock()
-    mock_thread_instance.start = MagicMock()
-    MockThread.return_value = mock_thread_instance
-
-    mock_executor = AsyncMock()  # AsyncMock as run_in_executor is awaited
-
-    async def run_in_executor_side_effect(executor, func, *args):
-        func_name = getattr(func, "__name__", "unknown")
-        func_self = getattr(func, "__self__", None)
-
-        print(f"run_in_executor called with func: {func_name}")
-
-        if func_name == "wait" and isinstance(func_self, threading.Event):
-            event = func_self
-            print(f"Intercepted run_in_executor for event.wait() for {event}")
-            print("Simulating event.set()")
-            event.set()
-            await asyncio.sleep(0)  # yield control briefly
-            print("Returning from mocked event.wait()")
-            return None
-        else:
-            print(
-                f"Warning: Unexpected function passed to run_in_executor: {func_name}"
-            )
-            await asyncio.sleep(0)
-            return None
-
-    mock_executor.run_in_executor = AsyncMock(side_effect=run_in_executor_side_effect)
-    MockGetLoop.return_value = mock_executor
-
     meepo_id = "test-meepo-1"
     bot_id = "test-bot-1"
     request = bot_pb2.JoinMeetingRequest(
@@ -83,13 +61,9 @@ async def test_join_meeting_success(
 
     servicer = MeetingBotServicer()
     responses = []
-    print("Calling JoinMeeting...")
     async for resp in servicer.JoinMeeting(request, mock_context):
-        print(f"Received response: state={resp.state}")
         responses.append(resp)
-    print("JoinMeeting call finished.")
 
-    print(f"Join meeting responses: {[r.state for r in responses]}")
     assert (
         len(responses) == 3
     ), f"Expected 3 responses, got {len(responses)}: {[r.state for r in responses]}"
@@ -97,17 +71,168 @@ async def test_join_meeting_success(
     assert responses[1].state == bot_pb2.JoinMeetingResponse.PENDING
     assert responses[2].state == bot_pb2.JoinMeetingResponse.JOINED
     assert responses[2].bot_id == bot_id
+    assert [s.name for s in responses[2].steps] == ["page_load", "admitted"]
+    assert responses[2].steps[1].duration_ms == pytest.approx(4200)
 
     MockBot.assert_called_once()
     MockLiveKit.assert_called_once()
-    assert MockThread.call_count == 2  # threads created for bot and livekit
-    assert mock_thread_instance.start.call_count == 2
+    MockRunBot.assert_called_once()  # the bot thread was started
+    assert MockRunBot.call_args.args[0] is mock_bot_instance
+
+    assert bot_id in bot_server._active_sessions
+
+
+@patch("bot.server.LiveKitStreamer")
+@patch("bot.server.Bot")
+async def test_join_meeting_fails_as_soon_as_bot_fails(
+    MockBot, MockLiveKit, mock_context
+):
+    MockBot.return_value.execute.side_effect = Exception("driver crashed")
+    request = bot_pb2.JoinMeetingRequest(
+        meepo_id="m", bot_id="test-bot-crash", url="http://fake.url", name="Bot"
+    )
+
+    servicer = MeetingBotServicer()
+    responses = await asyncio.wait_for(
+        _collect(servicer.JoinMeeting(request, mock_context)), timeout=2
+    )
+
+    assert responses[-1].state == bot_pb2.JoinMeetingResponse.FAILED
+    assert "driver crashed" in responses[-1].message
+    assert "test-bot-crash" not in bot_server._active_sessions
+
+
+@patch("bot.server.JOIN_PENDING_TIMEOUT", 0.05)
+@patch("bot.server.LiveKitStreamer")
+@patch("bot.server.Bot")
+async def test_join_meeting_phase_deadline(MockBot, MockLiveKit, mock_context):
+    running = threading.Event()
+
+    def bot_init(*args, **kwargs):
+        # never asks to join
+        MockBot.return_value.execute.side_effect = lambda: running.wait(1)
+        return MockBot.return_value
+
+    MockBot.side_effect = bot_init
+    request = bot_pb2.JoinMeetingRequest(
+        meepo_id="m", bot_id="test-bot-slow", url="http://fake.url", name="Bot"
+    )
+
+    servicer = MeetingBotServicer()
+    responses = await _collect(servicer.JoinMeeting(request, mock_context))
+    running.set()
+
+    assert responses[-1].state == bot_pb2.JoinMeetingResponse.FAILED
+    assert "timed out while starting" in responses[-1].message
+    mock_context.set_code.assert_called_once_with(grpc.StatusCode.DEADLINE_EXCEEDED)
+
+
+@patch("bot.server.run_bot")
+@patch("bot.server.LiveKitStreamer")
+@patch("bot.server.Bot")
+async def test_join_meeting_closed_mid_join_tears_down(
+    MockBot, MockLiveKit, MockRunBot, mock_context
+):
+    def bot_init(*args, **kwargs):
+        args[4].set()  # pending, never joined
+        return MockBot.return_value
+
+    MockBot.side_effect = bot_init
+    MockBot.return_value.get_join_steps.return_value = []
+    reaper = MagicMock()
+    reaper.teardown = AsyncMock()
+    request = bot_pb2.JoinMeetingRequest(
+        meepo_id="m", bot_id="test-bot-closed", url="http://fake.url", name="Bot"
+    )
+
+    with patch("bot.server._reaper", reaper):
+        servicer = MeetingBotServicer()
+        responses = servicer.JoinMeeting(request, mock_context)
+        assert (await anext(responses)).state == bot_pb2.JoinMeetingResponse.RECEIVED
+        assert (await anext(responses)).state == bot_pb2.JoinMeetingResponse.PENDING
+        await responses.aclose()  # the client went away
+        await asyncio.sleep(0)
+
+    assert "test-bot-closed" not in bot_server._active_sessions
+    reaper.teardown.assert_awaited_once()
+    assert reaper.teardown.await_args.args[0] == "test-bot-closed"
+
+
+@patch("bot.server.run_bot")
+@patch("bot.server.LiveKitStreamer")
+@patch("bot.server.Bot")
+async def test_join_meeting_registered_before_joined(
+    MockBot, MockLiveKit, MockRunBot, mock_context
+):
+    def bot_init(*args, **kwargs):
+        args[4].set()
+        args[5].set()
+        return MockBot.return_value
 
-    assert mock_executor.run_in_executor.call_count == 2
-    mock_executor.run_in_executor.assert_any_call(None, event_store["pending"].wait)
-    mock_executor.run_in_executor.assert_any_call(None, event_store["joined"].wait)
+    MockBot.side_effect = bot_init
+    MockBot.return_value.get_join_steps.return_value = []
+    reaper = MagicMock()
+    reaper.teardown = AsyncMock()
+    bot_id = "test-bot-registered"
+    request = bot_pb2.JoinMeetingRequest(
+        meepo_id="m", bot_id=bot_id, url="http://fake.url", name="Bot"
+    )
+
+    with patch("bot.server._reaper", reaper):
+        servicer = MeetingBotServicer()
+        responses = servicer.JoinMeeting(request, mock_context)
+        async for response in responses:
+            if response.state == bot_pb2.JoinMeetingResponse.JOINED:
+                # registered by the time the client sees it joined
+                assert bot_id in bot_server._active_sessions
+                break
+        await responses.aclose()
+        await asyncio.sleep(0)
 
     assert bot_id in bot_server._active_sessions
+    reaper.teardown.assert_not_called()
+    del bot_server._active_sessions[bot_id]
+
+
+async def test_construct_keeps_the_loop_running():
+    launched = threading.Event()
+    ticks = []
+
+    def launch():
+        launched.wait(1)  # e.g. a cold browser start
+        return MagicMock()
+
+    building = asyncio.ensure_future(bot_server._construct(launch))
+    for _ in range(3):
+        ticks.append(await asyncio.sleep(0.01, "tick"))
+    launched.set()
+
+    assert ticks == ["tick"] * 3
+    assert (await building).driver is not None
+
+
+async def test_construct_quits_driver_when_abandoned():
+    launched = threading.Event()
+    quit = threading.Event()
+    bot_instance = MagicMock()
+    bot_instance.driver.quit.side_effect = quit.set
+
+    def launch():
+        launched.wait(1)
+        return bot_instance
+
+    building = asyncio.ensure_future(bot_server._construct(launch))
+    await asyncio.sleep(0.01)
+    building.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await building
+    launched.set()
+
+    assert await asyncio.to_thread(quit.wait, 1)
+
+
+async def _collect(responses):
+    return [r async for r in responses]
 
 
 async def test_get_meeting_details_success(mock_context):
@@ -131,6 +256,54 @@ async def test_get_meeting_details_success(mock_context):
     mock_context.set_code.assert_not_called()
 
 
+async def test_get_meeting_details_from_roster(mock_context):
+    bot_id = "test-bot-roster"
+    roster = RosterFeed(asyncio.get_running_loop())
+    roster.update(["Participant A"])
+    await asyncio.sleep(0)
+    mock_bot = MagicMock()
+    bot_server._active_sessions[bot_id] = {"bot": mock_bot, "roster": roster}
+
+    response = await MeetingBotServicer().GetMeetingDetails(
+        bot_pb2.MeetingDetailsRequest(bot_id=bot_id), mock_context
+    )
+
+    assert [p.name for p in response.participants] == ["Participant A"]
+    mock_bot.get_participants.assert_not_called()
+
+
+async def test_watch_participants(mock_context):
+    bot_id = "test-bot-watch"
+    roster = RosterFeed(asyncio.get_running_loop())
+    roster.update(["Participant A"])
+    await asyncio.sleep(0)
+    bot_server._active_sessions[bot_id] = {"roster": roster}
+    request = bot_pb2.WatchParticipantsRequest(bot_id=bot_id)
+
+    events = MeetingBotServicer().WatchParticipants(request, mock_context)
+    first = await anext(events)
+    roster.update(["Participant A", "Participant B"])
+    second = await anext(events)
+    roster.close()
+
+    assert first.kind == bot_pb2.ParticipantEvent.SNAPSHOT
+    assert [p.name for p in first.participants] == ["Participant A"]
+    assert second.kind == bot_pb2.ParticipantEvent.JOINED
+    assert [p.name for p in second.participants] == ["Participant B"]
+    assert second.version == 2
+    assert [e async for e in events] == []
+
+
+async def test_watch_participants_not_found(mock_context):
+    request = bot_pb2.WatchParticipantsRequest(bot_id="test-bot-nowatch")
+
+    servicer = MeetingBotServicer()
+    events = [e async for e in servicer.WatchParticipants(request, mock_context)]
+
+    assert events == []
+    mock_context.set_code.assert_called_once_with(grpc.StatusCode.NOT_FOUND)
+
+
 async def test_get_meeting_details_not_found(mock_context):
     meepo_id = "test-meepo-nf"
     bot_id = "test-bot-nf"
@@ -163,6 +336,21 @@ async def test_leave_meeting_success(mock_context):
     assert response.state == bot_pb2.LeaveMeetingResponse.DONE
 
 
+async def test_leave_meeting_tears_down_session(mock_context):
+    bot_id = "test-bot-td"
+    session = {"bot": MagicMock(), "selenium_evt": threading.Event()}
+    bot_server._active_sessions[bot_id] = session
+    request = bot_pb2.LeaveMeetingRequest(bot_id=bot_id, meepo_id="test-meepo-td")
+
+    with patch.object(bot_server, "_reaper") as mock_reaper:
+        mock_reaper.teardown = AsyncMock()
+        response = await MeetingBotServicer().LeaveMeeting(request, mock_context)
+
+    mock_reaper.teardown.assert_awaited_once_with(bot_id, session, None)
+    assert bot_id not in bot_server._active_sessions
+    assert response.state == bot_pb2.LeaveMeetingResponse.DONE
+
+
 async def test_leave_meeting_not_found(mock_context):
     meepo_id = "test-meepo-lnf"
     bot_id = "test-bot-lnf"
@@ -189,3 +377,352 @@ async def test_join_meeting_already_exists(mock_context):
     assert "already active" in responses[0].message.lower()
     mock_context.set_code.assert_called_once_with(grpc.StatusCode.ALREADY_EXISTS)
     mock_context.set_details.assert_called_once()
+
+
+@patch("bot.server.run_bot")
+@patch("bot.server.LiveKitStreamer")
+@patch("bot.server.Bot")
+async def test_join_meeting_same_id_while_joining(
+    MockBot, MockLiveKit, MockRunBot, mock_context
+):
+    MockBot.return_value.get_join_steps.return_value = []
+    reaper = MagicMock()
+    reaper.teardown = AsyncMock()
+    bot_id = "test-bot-twice"
+    request = bot_pb2.JoinMeetingRequest(
+        meepo_id="m", bot_id=bot_id, url="http://fake.url", name="Bot"
+    )
+
+    with patch("bot.server._reaper", reaper):
+        servicer = MeetingBotServicer()
+        first = servicer.JoinMeeting(request, mock_context)
+        assert (await anext(first)).state == bot_pb2.JoinMeetingResponse.RECEIVED
+
+        # not registered before it joins, the id is taken all the same
+        second = await asyncio.wait_for(
+            _collect(servicer.JoinMeeting(request, MagicMock())), timeout=2
+        )
+        assert [r.state for r in second] == [bot_pb2.JoinMeetingResponse.FAILED]
+        assert "already active" in second[0].message
+
+        await first.aclose()  # failed, the id is free again
+        third = servicer.JoinMeeting(request, mock_context)
+        assert (await anext(third)).state == bot_pb2.JoinMeetingResponse.RECEIVED
+        await third.aclose()
+        await asyncio.sleep(0)
+
+    assert bot_id not in bot_server._active_sessions
+    assert bot_id not in bot_server._joining_ids
+
+
+@patch("bot.server.LiveKitStreamer")
+@patch("bot.server.Bot")
+async def test_join_meeting_uses_streamer_host(MockBot, MockLiveKit, mock_context):
+    def bot_init(*args, **kwargs):
+        # admitted straight away
+        args[4].set()
+        args[5].set()
+        return MockBot.return_value
+
+    MockBot.side_effect = bot_init
+    host = MagicMock()
+    bot_id = "test-bot-host"
+    request = bot_pb2.JoinMeetingRequest(
+        meepo_id="test-meepo-host", bot_id=bot_id, url="http://fake.url", name="Bot"
+    )
+
+    with patch("bot.server._streamer_host", host):
+        servicer = MeetingBotServicer()
+        responses = [r async for r in servicer.JoinMeeting(request, mock_context)]
+
+        assert responses[-1].state == bot_pb2.JoinMeetingResponse.JOINED
+        host.start_streamer.assert_called_once_with(MockLiveKit.return_value)
+        # no thread of its own for the streamer
+        MockLiveKit.return_value.execute.assert_not_called()
+
+        await servicer.LeaveMeeting(
+            bot_pb2.LeaveMeetingRequest(bot_id=bot_id, meepo_id="test-meepo-host"),
+            mock_context,
+        )
+        host.stop_streamer.assert_called_once_with(bot_id)
+
+
+@patch("bot.server.Bot")
+async def test_join_meeting_in_worker(MockBot, mock_context):
+    steps = {"steps": [("admitted", 1.0, 0.5)], "timings": {"admitted": 0.5}}
+
+    async def join(bot_id, name, link, timeouts=None, on_roster=None):
+        pool.sessions[bot_id] = 1
+        yield "pending", steps
+        on_roster(["Participant A"])  # from the dispatcher thread
+        yield "joined", steps
+
+    pool = MagicMock()
+    pool.sessions = {}
+    pool.join = join
+    bot_id = "test-bot-worker"
+    request = bot_pb2.JoinMeetingRequest(
+        meepo_id="test-meepo-worker", bot_id=bot_id, url="http://fake.url", name="Bot"
+    )
+
+    with patch("bot.server._worker_pool", pool):
+        servicer = MeetingBotServicer()
+        responses = [r async for r in servicer.JoinMeeting(request, mock_context)]
+
+        assert [r.state for r in responses] == [
+            bot_pb2.JoinMeetingResponse.RECEIVED,
+            bot_pb2.JoinMeetingResponse.PENDING,
+            bot_pb2.JoinMeetingResponse.JOINED,
+        ]
+        assert responses[-1].steps[0].name == "admitted"
+        assert bot_server._active_sessions[bot_id]["worker"] == 1
+        MockBot.assert_not_called()
+
+        await asyncio.sleep(0)  # roster updates are applied on the loop
+        details = await servicer.GetMeetingDetails(
+            bot_pb2.MeetingDetailsRequest(bot_id=bot_id), mock_context
+        )
+        assert details.participants[0].name == "Participant A"
+
+        await servicer.LeaveMeeting(
+            bot_pb2.LeaveMeetingRequest(bot_id=bot_id), mock_context
+        )
+        pool.leave.assert_called_once_with(bot_id)
+        assert bot_id not in bot_server._active_sessions
+
+
+async def test_join_meeting_in_worker_failure(mock_context):
+    async def join(bot_id, name, link, timeouts=None, on_roster=None):
+        yield "failed", {"message": "session worker exited"}
+
+    pool = MagicMock()
+    pool.join = join
+    request = bot_pb2.JoinMeetingRequest(
+        meepo_id="m", bot_id="test-bot-worker-fail", url="http://fake.url", name="Bot"
+    )
+
+    with patch("bot.server._worker_pool", pool):
+        servicer = MeetingBotServicer()
+        responses = [r async for r in servicer.JoinMeeting(request, mock_context)]
+
+    assert responses[-1].state == bot_pb2.JoinMeetingResponse.FAILED
+    assert "session worker exited" in responses[-1].message
+    assert "test-bot-worker-fail" not in bot_server._active_sessions
+
+
+async def test_batch_join_and_leave(mock_context):
+    steps = {"steps": [], "timings": {}}
+
+    async def join(bot_id, name, link, timeouts=None, on_roster=None):
+        if bot_id == "test-bot-batch-2":
+            yield "failed", {"message": "no browser"}
+            return
+        yield "pending", steps
+        await asyncio.sleep(0.01)
+        yield "joined", steps
+
+    pool = MagicMock()
+    pool.sessions = {}
+    pool.join = join
+    joins = [
+        bot_pb2.JoinMeetingRequest(meepo_id="m", bot_id=f"test-bot-batch-{n}")
+        for n in (1, 2)
+    ]
+    hub = SessionEventHub()
+
+    with (
+        patch("bot.server._worker_pool", pool),
+        patch("bot.server._session_events", hub),
+    ):
+        servicer = MeetingBotServicer()
+        watch = servicer.WatchSessions(bot_pb2.WatchSessionsRequest(), mock_context)
+        watching = asyncio.create_task(anext(watch))
+        await asyncio.sleep(0)
+
+        responses = [
+            (r.bot_id, r.state)
+            async for r in servicer.BatchJoin(
+                bot_pb2.BatchJoinRequest(joins=joins), mock_context
+            )
+        ]
+        first = await watching
+
+        results = await servicer.BatchLeave(
+            bot_pb2.BatchLeaveRequest(
+                leaves=[
+                    bot_pb2.LeaveMeetingRequest(bot_id="test-bot-batch-1"),
+                    bot_pb2.LeaveMeetingRequest(bot_id="test-bot-batch-2"),
+                ]
+            ),
+            mock_context,
+        )
+        transitions = [await asyncio.wait_for(anext(watch), 1) for _ in range(5)]
+
+    failed = ("test-bot-batch-2", bot_pb2.JoinMeetingResponse.FAILED)
+    joined = ("test-bot-batch-1", bot_pb2.JoinMeetingResponse.JOINED)
+    assert failed in responses and joined in responses
+    assert responses.index(failed) < responses.index(joined)
+
+    assert [(r.bot_id, r.state) for r in results.results] == [
+        ("test-bot-batch-1", bot_pb2.LeaveMeetingResponse.DONE),
+        ("test-bot-batch-2", bot_pb2.LeaveMeetingResponse.FAILED),
+    ]
+    mock_context.set_code.assert_not_called()
+
+    assert first.bot_id == "test-bot-batch-1"
+    assert first.state == bot_pb2.SessionEvent.RECEIVED
+    assert not first.snapshot
+    events = [(e.bot_id, e.state) for e in [first, *transitions]]
+    assert [s for b, s in events if b == "test-bot-batch-1"] == [
+        bot_pb2.SessionEvent.RECEIVED,
+        bot_pb2.SessionEvent.PENDING,
+        bot_pb2.SessionEvent.JOINED,
+        bot_pb2.SessionEvent.STOPPED,
+    ]
+    assert [s for b, s in events if b == "test-bot-batch-2"] == [
+        bot_pb2.SessionEvent.RECEIVED,
+        bot_pb2.SessionEvent.FAILED,
+    ]
+    assert hub.sessions == {}
+
+
+async def test_batch_join_closed_mid_join(mock_context):
+    admission = AdmissionController(max_sessions=4, queue_timeout=1, poll_interval=0.01)
+
+    async def join(bot_id, name, link, timeouts=None, on_roster=None):
+        yield "pending", {"steps": []}
+        await asyncio.Event().wait()  # never let in
+
+    pool = MagicMock()
+    pool.sessions = {}
+    pool.join = join
+    joins = [
+        bot_pb2.JoinMeetingRequest(meepo_id="m", bot_id=f"test-bot-abandoned-{n}")
+        for n in (1, 2)
+    ]
+
+    with patch("bot.server._admission", admission), patch(
+        "bot.server._worker_pool", pool
+    ):
+        servicer = MeetingBotServicer()
+        responses = servicer.BatchJoin(bot_pb2.BatchJoinRequest(joins=joins), mock_context)
+        pending = set()
+        async for response in responses:
+            if response.state == bot_pb2.JoinMeetingResponse.PENDING:
+                pending.add(response.bot_id)
+            if len(pending) == 2:
+                break
+        await responses.aclose()  # the client went away
+
+    # both joins were abandoned and cleaned up before the stream closed
+    assert admission.sessions == set()
+    assert admission.joining == set()
+    assert sorted(c.args[0] for c in pool.leave.call_args_list) == [
+        "test-bot-abandoned-1",
+        "test-bot-abandoned-2",
+    ]
+
+
+async def test_join_meeting_rejected_without_capacity(mock_context):
+    admission = AdmissionController(max_sessions=1, queue_timeout=0.05, poll_interval=0.01)
+    admission.sessions.add("other-bot")
+    request = bot_pb2.JoinMeetingRequest(
+        meepo_id="m", bot_id="test-bot-queued", url="http://fake.url", name="Bot"
+    )
+
+    with patch("bot.server._admission", admission):
+        servicer = MeetingBotServicer()
+        responses = [r async for r in servicer.JoinMeeting(request, mock_context)]
+
+    # RECEIVED while waiting, then rejected
+    assert responses[0].state == bot_pb2.JoinMeetingResponse.RECEIVED
+    assert "waiting for capacity" in responses[0].message
+    assert responses[-1].state == bot_pb2.JoinMeetingResponse.FAILED
+    mock_context.set_code.assert_called_once_with(grpc.StatusCode.RESOURCE_EXHAUSTED)
+
+
+async def test_join_meeting_cancelled_releases_admission(mock_context):
+    admission = AdmissionController(max_sessions=2, queue_timeout=1, poll_interval=0.01)
+    admitted = asyncio.Event()
+
+    async def join(bot_id, name, link, timeouts=None, on_roster=None):
+        yield "pending", {"steps": []}
+        admitted.set()
+        await asyncio.Event().wait()  # never let in
+        yield "joined", {"steps": [], "timings": {}}
+
+    pool = MagicMock()
+    pool.sessions = {}
+    pool.join = join
+    request = bot_pb2.JoinMeetingRequest(
+        meepo_id="m", bot_id="test-bot-cancelled", url="http://fake.url", name="Bot"
+    )
+
+    with patch("bot.server._admission", admission), patch(
+        "bot.server._worker_pool", pool
+    ):
+        servicer = MeetingBotServicer()
+        responses = []
+
+        async def consume():
+            async for response in servicer.JoinMeeting(request, mock_context):
+                responses.append(response)
+
+        task = asyncio.create_task(consume())
+        await asyncio.wait_for(admitted.wait(), 1)
+        assert admission.joining == {"test-bot-cancelled"}
+
+        task.cancel()  # the client went away
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert responses[-1].state == bot_pb2.JoinMeetingResponse.PENDING
+    assert admission.sessions == set()
+    assert admission.joining == set()
+
+
+@patch("bot.server.REAP_INTERVAL", 0.01)
+async def test_reaper_pass_releases_idle_browsers():
+    hosts = MagicMock()
+    reaper = MagicMock()
+    reaper.reap = AsyncMock(return_value=[])
+
+    with patch("bot.server._browser_hosts", hosts), patch(
+        "bot.server._reaper", reaper
+    ):
+        task = asyncio.create_task(bot_server._reap_sessions())
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+    reaper.reap.assert_awaited()
+    hosts.release_idle.assert_called()
+
+
+async def test_server_metrics():
+    metrics = MetricsRegistry()
+    metrics.register("server", bot_server._server_samples)
+
+    sessions = {"bot-m": {"worker": 0}}
+    with patch.dict(bot_server._active_sessions, sessions, clear=True):
+        text = metrics.render()
+
+    assert "meepo_sessions_active 1" in text
+    assert "# TYPE meepo_sessions_torn_down_total counter" in text
+
+
+async def test_server_metrics_include_worker_sessions():
+    metrics = MetricsRegistry()
+    metrics.register("server", bot_server._server_samples)
+    pool = MagicMock()
+    pool.worker_stats.return_value = {"alive": 1, "worker_restarts": 0}
+    pool.session_samples.return_value = [
+        ("meepo_jitter_underruns_total", {"bot_id": "bot-w"}, 2)
+    ]
+
+    sessions = {"bot-w": {"worker": 0}}
+    with patch.dict(bot_server._active_sessions, sessions, clear=True), patch(
+        "bot.server._worker_pool", pool
+    ):
+        text = metrics.render()
+
+    assert 'meepo_jitter_underruns_total{bot_id="bot-w"} 2' in text
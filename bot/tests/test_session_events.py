@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from bot.session_events import SessionEventHub
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _next(events):
+    event, snapshot = await asyncio.wait_for(anext(events), 1)
+    return event["bot_id"], event["state"], snapshot
+
+
+async def test_watch_streams_a_snapshot_then_transitions():
+    hub = SessionEventHub()
+    hub.publish("bot-1", "meepo-1", "joined")
+    hub.publish("bot-2", "meepo-1", "received")
+
+    events = hub.watch()
+    assert await _next(events) == ("bot-1", "joined", True)
+    assert await _next(events) == ("bot-2", "received", True)
+
+    hub.publish("bot-2", "meepo-1", "pending")
+    hub.publish("bot-1", "", "stopped", "left the meeting")
+    assert await _next(events) == ("bot-2", "pending", False)
+    event, _ = await anext(events)
+    assert event["meepo_id"] == "meepo-1"  # remembered from earlier events
+    assert event["message"] == "left the meeting"
+    assert list(hub.sessions) == ["bot-2"]
+
+
+async def test_repeats_and_unknown_sessions_are_not_published():
+    hub = SessionEventHub()
+    hub.publish("bot-1", "meepo-1", "received", "waiting, 1 ahead")
+    hub.publish("bot-1", "meepo-1", "received", "waiting, 1 ahead")
+    hub.publish("bot-2", "meepo-1", "stopped")
+    hub.publish("bot-2", "meepo-1", "failed")
+
+    assert hub.stats["published"] == 1
+
+
+async def test_slow_watcher_is_resynced():
+    hub = SessionEventHub(max_pending=2)
+    hub.publish("bot-0", "meepo-1", "received")
+    events = hub.watch()
+    assert await _next(events) == ("bot-0", "received", True)
+
+    for n in range(1, 4):
+        hub.publish(f"bot-{n}", "meepo-1", "received")
+
+    # two transitions queued, the third replaced them with a snapshot
+    states = [await _next(events) for _ in range(4)]
+    assert all(snapshot for _, _, snapshot in states)
+    assert {bot_id for bot_id, _, _ in states} == set(hub.sessions)
+    assert hub.stats["resyncs"] == 1
@@ -0,0 +1,57 @@
+import asyncio
+import threading
+
+import pytest
+from unittest.mock import MagicMock
+
+from bot.session_state import SessionPhase, SessionState, run_bot
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_events_from_threads_advance_the_state():
+    state = SessionState(asyncio.get_running_loop())
+
+    threading.Thread(target=state.pending.set).start()
+    assert await state.wait_for(SessionPhase.PENDING, 1) == SessionPhase.PENDING
+    assert state.pending.is_set()
+
+    threading.Thread(target=state.joined.set).start()
+    assert await state.wait_for(SessionPhase.JOINED, 1) == SessionPhase.JOINED
+    assert [p for p, _ in state.transitions] == [
+        SessionPhase.STARTING,
+        SessionPhase.PENDING,
+        SessionPhase.JOINED,
+    ]
+
+
+async def test_phases_only_move_forward():
+    state = SessionState(asyncio.get_running_loop())
+
+    state.joined.set()
+    state.pending.set()  # late, ignored
+    await state.wait_for(SessionPhase.PENDING, 1)
+
+    assert state.phase == SessionPhase.JOINED
+    assert state.reached(SessionPhase.PENDING)
+
+
+async def test_failure_wakes_waiters_at_once():
+    state = SessionState(asyncio.get_running_loop())
+    bot = MagicMock()
+    bot.execute.side_effect = Exception("no driver")
+
+    threading.Thread(target=run_bot, args=(bot, state)).start()
+    phase = await state.wait_for(SessionPhase.JOINED, 1)
+
+    assert phase == SessionPhase.FAILED
+    assert state.error == "no driver"
+    assert not state.reached(SessionPhase.PENDING)
+
+
+async def test_wait_times_out():
+    state = SessionState(asyncio.get_running_loop())
+
+    with pytest.raises(TimeoutError):
+        await state.wait_for(SessionPhase.PENDING, 0.01)
@@ -0,0 +1,111 @@
+import threading
+
+import numpy as np
+import pytest
+
+from unittest.mock import patch
+
+from bot.audio.chunk import AudioChunk
+from bot.audio.spool import AudioSpool, create_session_spool
+
+
+RATE = 16000
+
+
+def _block(index, length=1600):
+    # 100 ms blocks whose samples encode their position
+    data = np.arange(index * length, (index + 1) * length, dtype=np.int64) % 30000
+    return AudioChunk(data.astype(np.int16), RATE, 1000.0 + index * 100)
+
+
+@pytest.fixture
+def spool(tmp_path):
+    spool = AudioSpool(str(tmp_path / "bot.spool"), data_capacity=RATE, index_capacity=64)
+    yield spool
+    spool.close()
+
+
+def test_reads_back_time_range(spool):
+    for i in range(5):
+        spool.write(_block(i))
+
+    chunks = list(spool.read(1150, 1250))
+
+    assert [c.timestamp for c in chunks] == [1150, 1200]
+    data = np.concatenate([c.data for c in chunks])
+    np.testing.assert_array_equal(data, np.arange(2400, 4000, dtype=np.int16))
+
+
+def test_oldest_audio_is_overwritten(spool):
+    # 1.5 s into a 1 s ring
+    for i in range(15):
+        spool.write(_block(i))
+
+    chunks = list(spool.read())
+
+    assert chunks[0].timestamp == 1500
+    assert len(chunks) == 10
+    np.testing.assert_array_equal(chunks[-1].data, _block(14).data)
+
+
+def test_writer_thread_and_reopen(spool):
+    spool.start()
+    float_block = AudioChunk(np.full(800, 0.5, dtype=np.float32), RATE, 2000.0, source_id=2)
+    assert spool.append(_block(0))
+    assert spool.append(float_block)
+    # close() writes what is still queued
+    spool.close()
+
+    reader = AudioSpool.open(spool.path)
+    try:
+        chunks = list(reader.read(source_id=2))
+        assert len(chunks) == 1
+        assert chunks[0].data.dtype == np.int16
+        assert np.all(chunks[0].data == 16383)
+        assert reader.stats()["blocks"] == 2
+    finally:
+        reader.close()
+
+
+def test_close_from_several_threads(spool):
+    # the Bot and the reaper may both close a session's spool
+    spool.start()
+    spool.append(_block(0))
+    closers = [threading.Thread(target=spool.close) for _ in range(4)]
+    for closer in closers:
+        closer.start()
+    for closer in closers:
+        closer.join(2)
+
+    assert not any(closer.is_alive() for closer in closers)
+    spool.close()
+
+
+def test_existing_file_is_not_overwritten(spool):
+    with pytest.raises(FileExistsError):
+        AudioSpool(spool.path, data_capacity=RATE, index_capacity=64)
+
+
+@pytest.mark.parametrize("bot_id", ["../../etc/x", "/etc/x", "..", "", "a/b"])
+def test_session_spool_rejects_unsafe_bot_ids(tmp_path, bot_id):
+    with patch("bot.audio.spool.SPOOL_DIR", str(tmp_path)):
+        with pytest.raises(ValueError):
+            create_session_spool(bot_id)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_session_spools_get_a_file_each(tmp_path):
+    with patch("bot.audio.spool.SPOOL_DIR", str(tmp_path)), patch(
+        "bot.audio.spool.SPOOL_SECONDS", 1
+    ), patch("bot.audio.spool.time.time", side_effect=[1.0, 2.0]):
+        first = create_session_spool("bot-1")
+        second = create_session_spool("bot-1")
+    try:
+        assert first.path != second.path
+        assert {p.name for p in tmp_path.iterdir()} == {
+            "bot-1-1000.spool",
+            "bot-1-2000.spool",
+        }
+    finally:
+        first.close()
+        second.close()
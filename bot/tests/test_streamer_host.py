@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+import pytest
+
+from bot.livekit_streamer.streamer_host import StreamerHost
+
+
+class FakeStreamer:
+    def __init__(self, participant_id, fail=False):
+        self.participant_id = participant_id
+        self.running = threading.Event()
+        self.fail = fail
+        self.thread = None
+        self.connected = threading.Event()
+
+    async def connect(self):
+        self.running.set()
+        self.thread = threading.current_thread()
+        self.connected.set()
+        if self.fail:
+            raise RuntimeError("Failed to connect to LiveKit")
+        while self.running.is_set():
+            await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def host():
+    host = StreamerHost(loops=2)
+    host.start()
+    yield host
+    host.stop(timeout=1)
+
+
+def test_sessions_share_a_fixed_number_of_threads(host):
+    threads_before = threading.active_count()
+    streamers = [FakeStreamer(f"bot-{i}") for i in range(20)]
+
+    for streamer in streamers:
+        host.start_streamer(streamer)
+    for streamer in streamers:
+        assert streamer.connected.wait(timeout=1)
+
+    assert threading.active_count() == threads_before
+    assert {s.thread.name for s in streamers} <= {"livekit-loop-0", "livekit-loop-1"}
+    stats = host.stats()
+    assert stats["sessions"] == 20
+    assert sum(stats["per_loop"]) == 20
+
+
+def test_stop_streamer_ends_session(host):
+    streamer = FakeStreamer("bot-1")
+    future = host.start_streamer(streamer)
+    assert streamer.connected.wait(timeout=1)
+
+    host.stop_streamer("bot-1")
+
+    future.result(timeout=1)
+    assert "bot-1" not in host.sessions
+
+
+def test_failed_streamer_is_removed(host):
+    future = host.start_streamer(FakeStreamer("bot-1", fail=True))
+
+    with pytest.raises(RuntimeError):
+        future.result(timeout=1)
+    assert "bot-1" not in host.sessions
+
+
+def test_sharding_is_stable(host):
+    assert host.loop_for("bot-1") is host.loop_for("bot-1")
+    assert len({host.loop_for(f"bot-{i}") for i in range(20)}) == 2
+
+
+def test_stop_disconnects_sessions():
+    host = StreamerHost(loops=1)
+    host.start()
+    streamer = FakeStreamer("bot-1")
+    future = host.start_streamer(streamer)
+    assert streamer.connected.wait(timeout=1)
+
+    host.stop(timeout=1)
+
+    assert future.done()
+    assert not streamer.running.is_set()
+    assert host.loops == []
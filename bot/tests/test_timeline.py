@@ -0,0 +1,83 @@
+import numpy as np
+
+from bot.audio.timeline import CaptureTimeline
+
+
+def _decoded(seq, position, length=100, sample_rate=1000, dtype=np.float32):
+    return {
+        "timestamp": float(position),
+        "seq": seq,
+        "position": position,
+        "audio_data": np.ones(length, dtype=dtype),
+        "sample_rate": sample_rate,
+    }
+
+
+def test_contiguous_chunks_pass_through():
+    timeline = CaptureTimeline()
+
+    first = timeline.push(_decoded(0, 0))
+    second = timeline.push(_decoded(1, 100))
+
+    assert [c.position for c in first + second] == [0, 100]
+    assert timeline.stats() == {
+        "chunks_received": 2,
+        "chunks_dropped": 0,
+        "gaps": 0,
+        "silence_samples": 0,
+        "overlap_samples": 0,
+    }
+
+
+def test_gap_is_filled_with_silence():
+    timeline = CaptureTimeline()
+    timeline.push(_decoded(0, 0, dtype=np.int16))
+
+    chunks = timeline.push(_decoded(3, 350, dtype=np.int16))
+
+    assert len(chunks) == 2
+    silence, audio = chunks
+    assert silence.position == 100
+    assert len(silence.data) == 250
+    assert silence.data.dtype == np.int16
+    assert not silence.data.any()
+    assert silence.timestamp == 100.0  # 250 samples at 1 kHz before the chunk
+    assert audio.position == 350
+    assert timeline.chunks_dropped == 2
+    assert timeline.gaps == 1
+    assert timeline.silence_samples == 250
+
+
+def test_overlap_is_trimmed():
+    timeline = CaptureTimeline()
+    timeline.push(_decoded(0, 0))
+
+    chunks = timeline.push(_decoded(1, 60))
+
+    assert len(chunks) == 1
+    assert chunks[0].position == 100
+    assert len(chunks[0].data) == 60
+    assert timeline.overlap_samples == 40
+
+
+def test_long_gap_restarts_without_filling():
+    timeline = CaptureTimeline(max_gap=1.0)
+    timeline.push(_decoded(0, 0))
+
+    chunks = timeline.push(_decoded(1, 5000))
+
+    assert len(chunks) == 1
+    assert timeline.gaps == 1
+    assert timeline.silence_samples == 0
+    assert timeline.next_position == 5100
+
+
+def test_chunks_without_position_stay_contiguous():
+    timeline = CaptureTimeline()
+    first = {"timestamp": 0.0, "audio_data": np.ones(10), "sample_rate": 1000}
+    second = dict(first, timestamp=10.0)
+
+    positions = [c.position for c in timeline.push(first) + timeline.push(second)]
+
+    assert positions == [0, 10]
+
@@ -0,0 +1,75 @@
+import numpy as np
+
+from bot.audio.vad import VoiceGate
+
+
+SPF = 160  # 10 ms at 16 kHz
+
+
+def _tone(frames, level=0.3):
+    t = np.arange(frames * SPF) / 16000
+    return (np.sin(2 * np.pi * 220 * t) * level * 32767).astype(np.int16).reshape(
+        frames, SPF
+    )
+
+
+def _quiet(frames, level=0.0005):
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal((frames, SPF)) * level * 32767).astype(np.int16)
+
+
+def test_classifies_tone_as_speech_and_noise_as_silence():
+    gate = VoiceGate(0.01)
+
+    assert not gate.classify(_quiet(20)).any()
+    assert gate.classify(_tone(20)).all()
+
+    # loud broadband noise crosses zero too often to be speech
+    rng = np.random.default_rng(1)
+    noise = (rng.standard_normal((20, SPF)) * 0.3 * 32767).astype(np.int16)
+    assert not gate.classify(noise).any()
+
+
+def test_long_silence_is_suppressed():
+    gate = VoiceGate(0.01, hangover=0.05, pre_roll=0.03)
+
+    sent = gate.process(_quiet(100))
+
+    assert sent == []
+    assert gate.suppressed_frames == 97  # 3 frames held back as pre-roll
+    assert gate.stats()["speech_ratio"] == 0
+
+
+def test_pre_roll_and_hangover_around_speech():
+    gate = VoiceGate(0.01, hangover=0.05, pre_roll=0.03)
+    quiet = _quiet(20)
+    tone = _tone(10)
+
+    assert gate.process(quiet) == []
+    sent = gate.process(np.concatenate((tone, quiet)))
+
+    # 3 frames of pre-roll, the speech, then 5 frames of hangover
+    assert len(sent) == 3 + 10 + 5
+    np.testing.assert_array_equal(sent[0], quiet[-3])
+    np.testing.assert_array_equal(sent[3], tone[0])
+    np.testing.assert_array_equal(sent[13], quiet[0])
+
+    stats = gate.stats()
+    assert stats["speech_frames"] == 10
+    assert stats["silence_frames"] == 40
+    assert stats["speech_ratio"] == 0.2
+    assert stats["sent_frames"] == 18
+
+
+def test_gaps_keep_the_timing():
+    gate = VoiceGate(0.01, hangover=0.0, pre_roll=0.03)
+    quiet = _quiet(10)
+    tone = _tone(2)
+
+    sent = gate.process(np.concatenate((quiet, tone)), gaps=True)
+
+    # 7 frames left out in their place, 3 of pre-roll, then the speech
+    assert [frame is None for frame in sent] == [True] * 7 + [False] * 5
+    np.testing.assert_array_equal(sent[7], quiet[-3])
+    assert gate.stats()["sent_frames"] == 5
+    assert gate.held == 0
@@ -0,0 +1,246 @@
+import asyncio
+import queue
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from bot.workers import SessionWorkerPool, run_worker
+
+
+@pytest.fixture
+def pool():
+    # workers replaced by in-process fakes: a process mock and a plain queue
+    pool = SessionWorkerPool(processes=2, sessions_per_worker=1)
+    pool._events = queue.Queue()
+
+    def spawn(index):
+        process = MagicMock()
+        process.is_alive.return_value = True
+        pool._workers[index] = (process, queue.Queue())
+
+    with patch.object(pool, "_spawn", side_effect=spawn):
+        pool.start()
+        yield pool
+        pool._stopped.set()
+        pool._dispatcher.join(timeout=2)
+
+
+def _commands(pool, index):
+    return pool._workers[index][1]
+
+
+@pytest.mark.asyncio
+async def test_join_reports_states_until_joined(pool):
+    steps = {"steps": [("page_load", 1.0, 0.5)], "timings": {"page_load": 0.5}}
+
+    async def worker():
+        command = await asyncio.to_thread(_commands(pool, 0).get, timeout=2)
+        assert command == ("join", "bot-1", "Bot", "http://meet")
+        pool._events.put(("bot-1", "pending", steps))
+        pool._events.put(("bot-1", "joined", steps))
+
+    task = asyncio.create_task(worker())
+    states = [state async for state, _ in pool.join("bot-1", "Bot", "http://meet")]
+    await task
+
+    assert states == ["pending", "joined"]
+    assert pool.sessions == {"bot-1": 0}
+    assert pool.worker_stats()["per_worker"] == [1, 0]
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_spread_and_bounded(pool):
+    pool.sessions = {"bot-1": 0, "bot-2": 1}
+
+    with pytest.raises(RuntimeError):
+        async for _ in pool.join("bot-3", "Bot", "http://meet"):
+            pass
+
+    del pool.sessions["bot-2"]
+    with pool._lock:
+        assert pool._pick_worker() == 1
+
+
+@pytest.mark.asyncio
+async def test_dead_worker_fails_its_sessions_and_is_replaced(pool):
+    results = []
+
+    async def join():
+        async for state, payload in pool.join("bot-1", "Bot", "http://meet"):
+            results.append((state, payload))
+
+    task = asyncio.create_task(join())
+    await asyncio.sleep(0.05)
+    pool._workers[0][0].is_alive.return_value = False
+    await asyncio.wait_for(task, timeout=3)
+
+    assert results == [("failed", {"message": "session worker exited"})]
+    assert pool.sessions == {}
+    assert pool.stats["worker_restarts"] == 1
+    assert pool._workers[0][0].is_alive()
+
+
+def test_roster_and_leave_are_routed(pool):
+    pool.sessions = {"bot-1": 1}
+    rosters = queue.Queue()
+    pool._rosters["bot-1"] = rosters.put
+
+    pool._events.put(("bot-1", "roster", ["Ada", "Grace"]))
+    assert rosters.get(timeout=2) == ["Ada", "Grace"]
+
+    assert pool.leave("bot-1") is True
+    assert _commands(pool, 1).get_nowait() == ("leave", "bot-1")
+    assert pool.leave("bot-1") is False
+
+
+def test_session_samples_are_kept_while_it_runs(pool):
+    pool.sessions = {"bot-1": 0}
+    sample = ("meepo_queue_depth", {"bot_id": "bot-1"}, 3)
+
+    pool._events.put(("bot-1", "samples", [sample]))
+    deadline = time.monotonic() + 2
+    while not pool.session_samples() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pool.session_samples() == [sample]
+
+    pool.leave("bot-1")
+    assert pool.session_samples() == []
+
+
+def test_stopped_session_frees_its_slot(pool):
+    pool.sessions = {"bot-1": 0}
+
+    pool._events.put(("bot-1", "stopped", 1))  # another worker's session
+    pool._events.put(("bot-1", "stopped", 0))
+    deadline = time.monotonic() + 2
+    while pool.sessions and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert pool.sessions == {}
+
+
+@patch("bot.workers.LiveKitStreamer")
+@patch("bot.workers.Bot")
+def test_run_worker_runs_sessions(MockBot, MockLiveKit):
+    def bot(
+        bot_id,
+        name,
+        link,
+        audio_queue,
+        pending,
+        joined,
+        running,
+        spool=None,
+        on_roster=None,
+    ):
+        def execute():
+            running.set()
+            pending.set()
+            joined.set()
+            on_roster(["Ada"])
+            while running.is_set():
+                time.sleep(0.01)
+
+        instance = MagicMock()
+        instance.execute.side_effect = execute
+        instance.get_join_steps.return_value = [("admitted", 1.0, 2.0)]
+        instance.timings = {"admitted": 2.0}
+        return instance
+
+    MockBot.side_effect = bot
+    MockLiveKit.return_value.participant_id = "bot-1"
+    commands, events = queue.Queue(), queue.Queue()
+
+    with patch("bot.workers.StreamerHost") as MockHost:
+        MockHost.return_value.start_streamer.return_value = None
+        worker = threading.Thread(target=run_worker, args=(0, commands, events))
+        worker.start()
+
+        commands.put(("join", "bot-1", "Bot", "http://meet"))
+        received = {}
+        while not {"joined", "roster"} <= received.keys():
+            key, state, payload = events.get(timeout=2)
+            assert key == "bot-1"
+            received[state] = payload
+        assert received["joined"]["timings"] == {"admitted": 2.0}
+        assert received["roster"] == ["Ada"]
+
+        commands.put(("leave", "bot-1"))
+        assert events.get(timeout=2) == ("bot-1", "stopped", 0)
+        commands.put(None)
+        worker.join(timeout=2)
+
+    MockHost.return_value.start_streamer.assert_called_once_with(
+        MockLiveKit.return_value
+    )
+
+
+def _worker_events(MockBot, MockHost, execute, commands):
+    # runs a worker whose bots run `execute(running, pending, joined)`
+    def bot(bot_id, name, link, audio_queue, pending, joined, running, **kwargs):
+        instance = MagicMock()
+        instance.execute.side_effect = lambda: execute(running, pending, joined)
+        instance.get_join_steps.return_value = []
+        instance.timings = {}
+        return instance
+
+    MockBot.side_effect = bot
+    MockHost.return_value.start_streamer.return_value = None
+    events = queue.Queue()
+    worker = threading.Thread(
+        target=run_worker, args=(0, commands, events), daemon=True
+    )
+    worker.start()
+    return worker, events
+
+
+@patch("bot.workers.StreamerHost")
+@patch("bot.workers.LiveKitStreamer")
+@patch("bot.workers.Bot")
+def test_run_worker_reports_why_the_bot_failed(MockBot, MockLiveKit, MockHost):
+    def execute(running, pending, joined):
+        raise Exception("An error occurred during execution: no join button")
+
+    commands = queue.Queue()
+    worker, events = _worker_events(MockBot, MockHost, execute, commands)
+    commands.put(("join", "bot-1", "Bot", "http://meet"))
+    assert events.get(timeout=2) == (
+        "bot-1",
+        "failed",
+        {"message": "An error occurred during execution: no join button"},
+    )
+    assert events.get(timeout=2) == ("bot-1", "stopped", 0)
+    commands.put(None)
+    worker.join(timeout=2)
+
+
+@patch("bot.workers.SAMPLES_INTERVAL", 0.0)
+@patch("bot.workers.session_samples")
+@patch("bot.workers.StreamerHost")
+@patch("bot.workers.LiveKitStreamer")
+@patch("bot.workers.Bot")
+def test_run_worker_sends_session_samples(MockBot, MockLiveKit, MockHost, samples):
+    samples.return_value = iter([("meepo_queue_depth", {"bot_id": "bot-1"}, 3)])
+
+    def execute(running, pending, joined):
+        running.set()
+        pending.set()
+        joined.set()
+        while running.is_set():
+            time.sleep(0.01)
+
+    commands = queue.Queue()
+    worker, events = _worker_events(MockBot, MockHost, execute, commands)
+    commands.put(("join", "bot-1", "Bot", "http://meet"))
+
+    received = {}
+    while "samples" not in received:
+        key, state, payload = events.get(timeout=2)
+        received[state] = payload
+    assert received["samples"] == [("meepo_queue_depth", {"bot_id": "bot-1"}, 3)]
+    assert samples.call_args.args[0] == "bot-1"
+
+    commands.put(None)
+    worker.join(timeout=2)
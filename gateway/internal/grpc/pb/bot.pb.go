@@ -73,6 +73,55 @@ func (JoinMeetingResponse_State) EnumDescriptor() ([]byte, []int) {
 	return file_bot_proto_rawDescGZIP(), []int{1, 0}
 }
 
+type ParticipantEvent_Kind int32
+
+const (
+	ParticipantEvent_SNAPSHOT ParticipantEvent_Kind = 0
+	ParticipantEvent_JOINED   ParticipantEvent_Kind = 1
+	ParticipantEvent_LEFT     ParticipantEvent_Kind = 2
+)
+
+// Enum value maps for ParticipantEvent_Kind.
+var (
+	ParticipantEvent_Kind_name = map[int32]string{
+		0: "SNAPSHOT",
+		1: "JOINED",
+		2: "LEFT",
+	}
+	ParticipantEvent_Kind_value = map[string]int32{
+		"SNAPSHOT": 0,
+		"JOINED":   1,
+		"LEFT":     2,
+	}
+)
+
+func (x ParticipantEvent_Kind) Enum() *ParticipantEvent_Kind {
+	p := new(ParticipantEvent_Kind)
+	*p = x
+	return p
+}
+
+func (x ParticipantEvent_Kind) String() string {
+	return protoimpl.X.EnumStringOf(x.Descriptor(), protoreflect.EnumNumber(x))
+}
+
+func (ParticipantEvent_Kind) Descriptor() protoreflect.EnumDescriptor {
+	return file_bot_proto_enumTypes[1].Descriptor()
+}
+
+func (ParticipantEvent_Kind) Type() protoreflect.EnumType {
+	return &file_bot_proto_enumTypes[1]
+}
+
+func (x ParticipantEvent_Kind) Number() protoreflect.EnumNumber {
+	return protoreflect.EnumNumber(x)
+}
+
+// Deprecated: Use ParticipantEvent_Kind.Descriptor instead.
+func (ParticipantEvent_Kind) EnumDescriptor() ([]byte, []int) {
+	return file_bot_proto_rawDescGZIP(), []int{7, 0}
+}
+
 type LeaveMeetingResponse_State int32
 
 const (
@@ -106,11 +155,11 @@ func (x LeaveMeetingResponse_State) String() string {
 }
 
 func (LeaveMeetingResponse_State) Descriptor() protoreflect.EnumDescriptor {
-	return file_bot_proto_enumTypes[1].Descriptor()
+	return file_bot_proto_enumTypes[2].Descriptor()
 }
 
 func (LeaveMeetingResponse_State) Type() protoreflect.EnumType {
-	return &file_bot_proto_enumTypes[1]
+	return &file_bot_proto_enumTypes[2]
 }
 
 func (x LeaveMeetingResponse_State) Number() protoreflect.EnumNumber {
@@ -119,7 +168,62 @@ func (x LeaveMeetingResponse_State) Number() protoreflect.EnumNumber {
 
 // Deprecated: Use LeaveMeetingResponse_State.Descriptor instead.
 func (LeaveMeetingResponse_State) EnumDescriptor() ([]byte, []int) {
-	return file_bot_proto_rawDescGZIP(), []int{6, 0}
+	return file_bot_proto_rawDescGZIP(), []int{9, 0}
+}
+
+type SessionEvent_State int32
+
+const (
+	SessionEvent_RECEIVED SessionEvent_State = 0
+	SessionEvent_PENDING  SessionEvent_State = 1
+	SessionEvent_JOINED   SessionEvent_State = 2
+	SessionEvent_FAILED   SessionEvent_State = 3
+	SessionEvent_STOPPED  SessionEvent_State = 4
+)
+
+// Enum value maps for SessionEvent_State.
+var (
+	SessionEvent_State_name = map[int32]string{
+		0: "RECEIVED",
+		1: "PENDING",
+		2: "JOINED",
+		3: "FAILED",
+		4: "STOPPED",
+	}
+	SessionEvent_State_value = map[string]int32{
+		"RECEIVED": 0,
+		"PENDING":  1,
+		"JOINED":   2,
+		"FAILED":   3,
+		"STOPPED":  4,
+	}
+)
+
+func (x SessionEvent_State) Enum() *SessionEvent_State {
+	p := new(SessionEvent_State)
+	*p = x
+	return p
+}
+
+func (x SessionEvent_State) String() string {
+	return protoimpl.X.EnumStringOf(x.Descriptor(), protoreflect.EnumNumber(x))
+}
+
+func (SessionEvent_State) Descriptor() protoreflect.EnumDescriptor {
+	return file_bot_proto_enumTypes[3].Descriptor()
+}
+
+func (SessionEvent_State) Type() protoreflect.EnumType {
+	return &file_bot_proto_enumTypes[3]
+}
+
+func (x SessionEvent_State) Number() protoreflect.EnumNumber {
+	return protoreflect.EnumNumber(x)
+}
+
+// Deprecated: Use SessionEvent_State.Descriptor instead.
+func (SessionEvent_State) EnumDescriptor() ([]byte, []int) {
+	return file_bot_proto_rawDescGZIP(), []int{14, 0}
 }
 
 type JoinMeetingRequest struct {
@@ -191,10 +295,12 @@ func (x *JoinMeetingRequest) GetName() string {
 }
 
 type JoinMeetingResponse struct {
-	state         protoimpl.MessageState    `protogen:"open.v1"`
-	State         JoinMeetingResponse_State `protobuf:"varint,1,opt,name=state,proto3,enum=JoinMeetingResponse_State" json:"state,omitempty"`
-	Message       string                    `protobuf:"bytes,2,opt,name=message,proto3" json:"message,omitempty"`
-	BotId         string                    `protobuf:"bytes,3,opt,name=bot_id,json=botId,proto3" json:"bot_id,omitempty"`
+	state   protoimpl.MessageState    `protogen:"open.v1"`
+	State   JoinMeetingResponse_State `protobuf:"varint,1,opt,name=state,proto3,enum=JoinMeetingResponse_State" json:"state,omitempty"`
+	Message string                    `protobuf:"bytes,2,opt,name=message,proto3" json:"message,omitempty"`
+	BotId   string                    `protobuf:"bytes,3,opt,name=bot_id,json=botId,proto3" json:"bot_id,omitempty"`
+	// join steps completed so far, in order
+	Steps         []*JoinStep `protobuf:"bytes,4,rep,name=steps,proto3" json:"steps,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -250,6 +356,90 @@ func (x *JoinMeetingResponse) GetBotId() string {
 	return ""
 }
 
+func (x *JoinMeetingResponse) GetSteps() []*JoinStep {
+	if x != nil {
+		return x.Steps
+	}
+	return nil
+}
+
+type JoinStep struct {
+	state       protoimpl.MessageState `protogen:"open.v1"`
+	Name        string                 `protobuf:"bytes,1,opt,name=name,proto3" json:"name,omitempty"`
+	CompletedAt float64                `protobuf:"fixed64,2,opt,name=completed_at,json=completedAt,proto3" json:"completed_at,omitempty"` // ms since epoch
+	DurationMs  float64                `protobuf:"fixed64,3,opt,name=duration_ms,json=durationMs,proto3" json:"duration_ms,omitempty"`
+	// over recent joins on this bot server
+	P50Ms         float64 `protobuf:"fixed64,4,opt,name=p50_ms,json=p50Ms,proto3" json:"p50_ms,omitempty"`
+	P99Ms         float64 `protobuf:"fixed64,5,opt,name=p99_ms,json=p99Ms,proto3" json:"p99_ms,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *JoinStep) Reset() {
+	*x = JoinStep{}
+	mi := &file_bot_proto_msgTypes[2]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *JoinStep) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*JoinStep) ProtoMessage() {}
+
+func (x *JoinStep) ProtoReflect() protoreflect.Message {
+	mi := &file_bot_proto_msgTypes[2]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use JoinStep.ProtoReflect.Descriptor instead.
+func (*JoinStep) Descriptor() ([]byte, []int) {
+	return file_bot_proto_rawDescGZIP(), []int{2}
+}
+
+func (x *JoinStep) GetName() string {
+	if x != nil {
+		return x.Name
+	}
+	return ""
+}
+
+func (x *JoinStep) GetCompletedAt() float64 {
+	if x != nil {
+		return x.CompletedAt
+	}
+	return 0
+}
+
+func (x *JoinStep) GetDurationMs() float64 {
+	if x != nil {
+		return x.DurationMs
+	}
+	return 0
+}
+
+func (x *JoinStep) GetP50Ms() float64 {
+	if x != nil {
+		return x.P50Ms
+	}
+	return 0
+}
+
+func (x *JoinStep) GetP99Ms() float64 {
+	if x != nil {
+		return x.P99Ms
+	}
+	return 0
+}
+
 type MeetingDetailsRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	BotId         string                 `protobuf:"bytes,1,opt,name=bot_id,json=botId,proto3" json:"bot_id,omitempty"`
@@ -260,7 +450,7 @@ type MeetingDetailsRequest struct {
 
 func (x *MeetingDetailsRequest) Reset() {
 	*x = MeetingDetailsRequest{}
-	mi := &file_bot_proto_msgTypes[2]
+	mi := &file_bot_proto_msgTypes[3]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -272,7 +462,7 @@ func (x *MeetingDetailsRequest) String() string {
 func (*MeetingDetailsRequest) ProtoMessage() {}
 
 func (x *MeetingDetailsRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_bot_proto_msgTypes[2]
+	mi := &file_bot_proto_msgTypes[3]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -285,7 +475,7 @@ func (x *MeetingDetailsRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use MeetingDetailsRequest.ProtoReflect.Descriptor instead.
 func (*MeetingDetailsRequest) Descriptor() ([]byte, []int) {
-	return file_bot_proto_rawDescGZIP(), []int{2}
+	return file_bot_proto_rawDescGZIP(), []int{3}
 }
 
 func (x *MeetingDetailsRequest) GetBotId() string {
@@ -311,7 +501,7 @@ type MeetingDetailsResponse struct {
 
 func (x *MeetingDetailsResponse) Reset() {
 	*x = MeetingDetailsResponse{}
-	mi := &file_bot_proto_msgTypes[3]
+	mi := &file_bot_proto_msgTypes[4]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -323,7 +513,7 @@ func (x *MeetingDetailsResponse) String() string {
 func (*MeetingDetailsResponse) ProtoMessage() {}
 
 func (x *MeetingDetailsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_bot_proto_msgTypes[3]
+	mi := &file_bot_proto_msgTypes[4]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -336,7 +526,7 @@ func (x *MeetingDetailsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use MeetingDetailsResponse.ProtoReflect.Descriptor instead.
 func (*MeetingDetailsResponse) Descriptor() ([]byte, []int) {
-	return file_bot_proto_rawDescGZIP(), []int{3}
+	return file_bot_proto_rawDescGZIP(), []int{4}
 }
 
 func (x *MeetingDetailsResponse) GetParticipants() []*Participant {
@@ -355,7 +545,7 @@ type Participant struct {
 
 func (x *Participant) Reset() {
 	*x = Participant{}
-	mi := &file_bot_proto_msgTypes[4]
+	mi := &file_bot_proto_msgTypes[5]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -367,7 +557,7 @@ func (x *Participant) String() string {
 func (*Participant) ProtoMessage() {}
 
 func (x *Participant) ProtoReflect() protoreflect.Message {
-	mi := &file_bot_proto_msgTypes[4]
+	mi := &file_bot_proto_msgTypes[5]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -380,7 +570,7 @@ func (x *Participant) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use Participant.ProtoReflect.Descriptor instead.
 func (*Participant) Descriptor() ([]byte, []int) {
-	return file_bot_proto_rawDescGZIP(), []int{4}
+	return file_bot_proto_rawDescGZIP(), []int{5}
 }
 
 func (x *Participant) GetName() string {
@@ -390,6 +580,121 @@ func (x *Participant) GetName() string {
 	return ""
 }
 
+type WatchParticipantsRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	BotId         string                 `protobuf:"bytes,1,opt,name=bot_id,json=botId,proto3" json:"bot_id,omitempty"`
+	MeepoId       string                 `protobuf:"bytes,2,opt,name=meepo_id,json=meepoId,proto3" json:"meepo_id,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *WatchParticipantsRequest) Reset() {
+	*x = WatchParticipantsRequest{}
+	mi := &file_bot_proto_msgTypes[6]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *WatchParticipantsRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*WatchParticipantsRequest) ProtoMessage() {}
+
+func (x *WatchParticipantsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_bot_proto_msgTypes[6]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use WatchParticipantsRequest.ProtoReflect.Descriptor instead.
+func (*WatchParticipantsRequest) Descriptor() ([]byte, []int) {
+	return file_bot_proto_rawDescGZIP(), []int{6}
+}
+
+func (x *WatchParticipantsRequest) GetBotId() string {
+	if x != nil {
+		return x.BotId
+	}
+	return ""
+}
+
+func (x *WatchParticipantsRequest) GetMeepoId() string {
+	if x != nil {
+		return x.MeepoId
+	}
+	return ""
+}
+
+// The first event is a SNAPSHOT of the whole roster, then JOINED and LEFT
+// deltas follow. Another SNAPSHOT replaces the roster if the watcher fell
+// behind. The stream ends when the bot leaves the meeting.
+type ParticipantEvent struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Kind          ParticipantEvent_Kind  `protobuf:"varint,1,opt,name=kind,proto3,enum=ParticipantEvent_Kind" json:"kind,omitempty"`
+	Participants  []*Participant         `protobuf:"bytes,2,rep,name=participants,proto3" json:"participants,omitempty"`
+	Version       uint64                 `protobuf:"varint,3,opt,name=version,proto3" json:"version,omitempty"` // of the roster after this event
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ParticipantEvent) Reset() {
+	*x = ParticipantEvent{}
+	mi := &file_bot_proto_msgTypes[7]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ParticipantEvent) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ParticipantEvent) ProtoMessage() {}
+
+func (x *ParticipantEvent) ProtoReflect() protoreflect.Message {
+	mi := &file_bot_proto_msgTypes[7]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ParticipantEvent.ProtoReflect.Descriptor instead.
+func (*ParticipantEvent) Descriptor() ([]byte, []int) {
+	return file_bot_proto_rawDescGZIP(), []int{7}
+}
+
+func (x *ParticipantEvent) GetKind() ParticipantEvent_Kind {
+	if x != nil {
+		return x.Kind
+	}
+	return ParticipantEvent_SNAPSHOT
+}
+
+func (x *ParticipantEvent) GetParticipants() []*Participant {
+	if x != nil {
+		return x.Participants
+	}
+	return nil
+}
+
+func (x *ParticipantEvent) GetVersion() uint64 {
+	if x != nil {
+		return x.Version
+	}
+	return 0
+}
+
 type LeaveMeetingRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	BotId         string                 `protobuf:"bytes,1,opt,name=bot_id,json=botId,proto3" json:"bot_id,omitempty"`
@@ -400,7 +705,7 @@ type LeaveMeetingRequest struct {
 
 func (x *LeaveMeetingRequest) Reset() {
 	*x = LeaveMeetingRequest{}
-	mi := &file_bot_proto_msgTypes[5]
+	mi := &file_bot_proto_msgTypes[8]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -412,7 +717,7 @@ func (x *LeaveMeetingRequest) String() string {
 func (*LeaveMeetingRequest) ProtoMessage() {}
 
 func (x *LeaveMeetingRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_bot_proto_msgTypes[5]
+	mi := &file_bot_proto_msgTypes[8]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -425,7 +730,7 @@ func (x *LeaveMeetingRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use LeaveMeetingRequest.ProtoReflect.Descriptor instead.
 func (*LeaveMeetingRequest) Descriptor() ([]byte, []int) {
-	return file_bot_proto_rawDescGZIP(), []int{5}
+	return file_bot_proto_rawDescGZIP(), []int{8}
 }
 
 func (x *LeaveMeetingRequest) GetBotId() string {
@@ -446,13 +751,14 @@ type LeaveMeetingResponse struct {
 	state         protoimpl.MessageState     `protogen:"open.v1"`
 	State         LeaveMeetingResponse_State `protobuf:"varint,1,opt,name=state,proto3,enum=LeaveMeetingResponse_State" json:"state,omitempty"`
 	Message       string                     `protobuf:"bytes,2,opt,name=message,proto3" json:"message,omitempty"`
+	BotId         string                     `protobuf:"bytes,3,opt,name=bot_id,json=botId,proto3" json:"bot_id,omitempty"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
 func (x *LeaveMeetingResponse) Reset() {
 	*x = LeaveMeetingResponse{}
-	mi := &file_bot_proto_msgTypes[6]
+	mi := &file_bot_proto_msgTypes[9]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -464,7 +770,7 @@ func (x *LeaveMeetingResponse) String() string {
 func (*LeaveMeetingResponse) ProtoMessage() {}
 
 func (x *LeaveMeetingResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_bot_proto_msgTypes[6]
+	mi := &file_bot_proto_msgTypes[9]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -477,7 +783,7 @@ func (x *LeaveMeetingResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use LeaveMeetingResponse.ProtoReflect.Descriptor instead.
 func (*LeaveMeetingResponse) Descriptor() ([]byte, []int) {
-	return file_bot_proto_rawDescGZIP(), []int{6}
+	return file_bot_proto_rawDescGZIP(), []int{9}
 }
 
 func (x *LeaveMeetingResponse) GetState() LeaveMeetingResponse_State {
@@ -494,6 +800,268 @@ func (x *LeaveMeetingResponse) GetMessage() string {
 	return ""
 }
 
+func (x *LeaveMeetingResponse) GetBotId() string {
+	if x != nil {
+		return x.BotId
+	}
+	return ""
+}
+
+type BatchJoinRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Joins         []*JoinMeetingRequest  `protobuf:"bytes,1,rep,name=joins,proto3" json:"joins,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *BatchJoinRequest) Reset() {
+	*x = BatchJoinRequest{}
+	mi := &file_bot_proto_msgTypes[10]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *BatchJoinRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*BatchJoinRequest) ProtoMessage() {}
+
+func (x *BatchJoinRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_bot_proto_msgTypes[10]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use BatchJoinRequest.ProtoReflect.Descriptor instead.
+func (*BatchJoinRequest) Descriptor() ([]byte, []int) {
+	return file_bot_proto_rawDescGZIP(), []int{10}
+}
+
+func (x *BatchJoinRequest) GetJoins() []*JoinMeetingRequest {
+	if x != nil {
+		return x.Joins
+	}
+	return nil
+}
+
+type BatchLeaveRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Leaves        []*LeaveMeetingRequest `protobuf:"bytes,1,rep,name=leaves,proto3" json:"leaves,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *BatchLeaveRequest) Reset() {
+	*x = BatchLeaveRequest{}
+	mi := &file_bot_proto_msgTypes[11]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *BatchLeaveRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*BatchLeaveRequest) ProtoMessage() {}
+
+func (x *BatchLeaveRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_bot_proto_msgTypes[11]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use BatchLeaveRequest.ProtoReflect.Descriptor instead.
+func (*BatchLeaveRequest) Descriptor() ([]byte, []int) {
+	return file_bot_proto_rawDescGZIP(), []int{11}
+}
+
+func (x *BatchLeaveRequest) GetLeaves() []*LeaveMeetingRequest {
+	if x != nil {
+		return x.Leaves
+	}
+	return nil
+}
+
+type BatchLeaveResponse struct {
+	state         protoimpl.MessageState  `protogen:"open.v1"`
+	Results       []*LeaveMeetingResponse `protobuf:"bytes,1,rep,name=results,proto3" json:"results,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *BatchLeaveResponse) Reset() {
+	*x = BatchLeaveResponse{}
+	mi := &file_bot_proto_msgTypes[12]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *BatchLeaveResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*BatchLeaveResponse) ProtoMessage() {}
+
+func (x *BatchLeaveResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_bot_proto_msgTypes[12]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use BatchLeaveResponse.ProtoReflect.Descriptor instead.
+func (*BatchLeaveResponse) Descriptor() ([]byte, []int) {
+	return file_bot_proto_rawDescGZIP(), []int{12}
+}
+
+func (x *BatchLeaveResponse) GetResults() []*LeaveMeetingResponse {
+	if x != nil {
+		return x.Results
+	}
+	return nil
+}
+
+type WatchSessionsRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *WatchSessionsRequest) Reset() {
+	*x = WatchSessionsRequest{}
+	mi := &file_bot_proto_msgTypes[13]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *WatchSessionsRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*WatchSessionsRequest) ProtoMessage() {}
+
+func (x *WatchSessionsRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_bot_proto_msgTypes[13]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use WatchSessionsRequest.ProtoReflect.Descriptor instead.
+func (*WatchSessionsRequest) Descriptor() ([]byte, []int) {
+	return file_bot_proto_rawDescGZIP(), []int{13}
+}
+
+// The current state of each session is sent first, marked as snapshot;
+// the stream then carries every transition. A watcher that fell behind is
+// sent a new snapshot.
+type SessionEvent struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	BotId         string                 `protobuf:"bytes,1,opt,name=bot_id,json=botId,proto3" json:"bot_id,omitempty"`
+	MeepoId       string                 `protobuf:"bytes,2,opt,name=meepo_id,json=meepoId,proto3" json:"meepo_id,omitempty"`
+	State         SessionEvent_State     `protobuf:"varint,3,opt,name=state,proto3,enum=SessionEvent_State" json:"state,omitempty"`
+	Message       string                 `protobuf:"bytes,4,opt,name=message,proto3" json:"message,omitempty"`
+	At            float64                `protobuf:"fixed64,5,opt,name=at,proto3" json:"at,omitempty"` // ms since epoch
+	Snapshot      bool                   `protobuf:"varint,6,opt,name=snapshot,proto3" json:"snapshot,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *SessionEvent) Reset() {
+	*x = SessionEvent{}
+	mi := &file_bot_proto_msgTypes[14]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *SessionEvent) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*SessionEvent) ProtoMessage() {}
+
+func (x *SessionEvent) ProtoReflect() protoreflect.Message {
+	mi := &file_bot_proto_msgTypes[14]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use SessionEvent.ProtoReflect.Descriptor instead.
+func (*SessionEvent) Descriptor() ([]byte, []int) {
+	return file_bot_proto_rawDescGZIP(), []int{14}
+}
+
+func (x *SessionEvent) GetBotId() string {
+	if x != nil {
+		return x.BotId
+	}
+	return ""
+}
+
+func (x *SessionEvent) GetMeepoId() string {
+	if x != nil {
+		return x.MeepoId
+	}
+	return ""
+}
+
+func (x *SessionEvent) GetState() SessionEvent_State {
+	if x != nil {
+		return x.State
+	}
+	return SessionEvent_RECEIVED
+}
+
+func (x *SessionEvent) GetMessage() string {
+	if x != nil {
+		return x.Message
+	}
+	return ""
+}
+
+func (x *SessionEvent) GetAt() float64 {
+	if x != nil {
+		return x.At
+	}
+	return 0
+}
+
+func (x *SessionEvent) GetSnapshot() bool {
+	if x != nil {
+		return x.Snapshot
+	}
+	return false
+}
+
 var File_bot_proto protoreflect.FileDescriptor
 
 const file_bot_proto_rawDesc = "" +
@@ -503,41 +1071,89 @@ const file_bot_proto_rawDesc = "" +
 	"\bmeepo_id\x18\x01 \x01(\tR\ameepoId\x12\x15\n" +
 	"\x06bot_id\x18\x02 \x01(\tR\x05botId\x12\x10\n" +
 	"\x03url\x18\x03 \x01(\tR\x03url\x12\x12\n" +
-	"\x04name\x18\x04 \x01(\tR\x04name\"\xb4\x01\n" +
+	"\x04name\x18\x04 \x01(\tR\x04name\"\xd5\x01\n" +
 	"\x13JoinMeetingResponse\x120\n" +
 	"\x05state\x18\x01 \x01(\x0e2\x1a.JoinMeetingResponse.StateR\x05state\x12\x18\n" +
 	"\amessage\x18\x02 \x01(\tR\amessage\x12\x15\n" +
-	"\x06bot_id\x18\x03 \x01(\tR\x05botId\":\n" +
+	"\x06bot_id\x18\x03 \x01(\tR\x05botId\x12\x1f\n" +
+	"\x05steps\x18\x04 \x03(\v2\t.JoinStepR\x05steps\":\n" +
 	"\x05State\x12\f\n" +
 	"\bRECEIVED\x10\x00\x12\v\n" +
 	"\aPENDING\x10\x01\x12\n" +
 	"\n" +
 	"\x06JOINED\x10\x02\x12\n" +
 	"\n" +
-	"\x06FAILED\x10\x03\"I\n" +
+	"\x06FAILED\x10\x03\"\x90\x01\n" +
+	"\bJoinStep\x12\x12\n" +
+	"\x04name\x18\x01 \x01(\tR\x04name\x12!\n" +
+	"\fcompleted_at\x18\x02 \x01(\x01R\vcompletedAt\x12\x1f\n" +
+	"\vduration_ms\x18\x03 \x01(\x01R\n" +
+	"durationMs\x12\x15\n" +
+	"\x06p50_ms\x18\x04 \x01(\x01R\x05p50Ms\x12\x15\n" +
+	"\x06p99_ms\x18\x05 \x01(\x01R\x05p99Ms\"I\n" +
 	"\x15MeetingDetailsRequest\x12\x15\n" +
 	"\x06bot_id\x18\x01 \x01(\tR\x05botId\x12\x19\n" +
 	"\bmeepo_id\x18\x02 \x01(\tR\ameepoId\"J\n" +
 	"\x16MeetingDetailsResponse\x120\n" +
 	"\fparticipants\x18\x01 \x03(\v2\f.ParticipantR\fparticipants\"!\n" +
 	"\vParticipant\x12\x12\n" +
-	"\x04name\x18\x01 \x01(\tR\x04name\"G\n" +
+	"\x04name\x18\x01 \x01(\tR\x04name\"L\n" +
+	"\x18WatchParticipantsRequest\x12\x15\n" +
+	"\x06bot_id\x18\x01 \x01(\tR\x05botId\x12\x19\n" +
+	"\bmeepo_id\x18\x02 \x01(\tR\ameepoId\"\xb6\x01\n" +
+	"\x10ParticipantEvent\x12*\n" +
+	"\x04kind\x18\x01 \x01(\x0e2\x16.ParticipantEvent.KindR\x04kind\x120\n" +
+	"\fparticipants\x18\x02 \x03(\v2\f.ParticipantR\fparticipants\x12\x18\n" +
+	"\aversion\x18\x03 \x01(\x04R\aversion\"*\n" +
+	"\x04Kind\x12\f\n" +
+	"\bSNAPSHOT\x10\x00\x12\n" +
+	"\n" +
+	"\x06JOINED\x10\x01\x12\b\n" +
+	"\x04LEFT\x10\x02\"G\n" +
 	"\x13LeaveMeetingRequest\x12\x15\n" +
 	"\x06bot_id\x18\x01 \x01(\tR\x05botId\x12\x19\n" +
-	"\bmeepo_id\x18\x02 \x01(\tR\ameepoId\"\x90\x01\n" +
+	"\bmeepo_id\x18\x02 \x01(\tR\ameepoId\"\xa7\x01\n" +
 	"\x14LeaveMeetingResponse\x121\n" +
 	"\x05state\x18\x01 \x01(\x0e2\x1b.LeaveMeetingResponse.StateR\x05state\x12\x18\n" +
-	"\amessage\x18\x02 \x01(\tR\amessage\"+\n" +
+	"\amessage\x18\x02 \x01(\tR\amessage\x12\x15\n" +
+	"\x06bot_id\x18\x03 \x01(\tR\x05botId\"+\n" +
 	"\x05State\x12\f\n" +
 	"\bRECEIVED\x10\x00\x12\b\n" +
 	"\x04DONE\x10\x01\x12\n" +
 	"\n" +
-	"\x06FAILED\x10\x022\xcb\x01\n" +
+	"\x06FAILED\x10\x02\"=\n" +
+	"\x10BatchJoinRequest\x12)\n" +
+	"\x05joins\x18\x01 \x03(\v2\x13.JoinMeetingRequestR\x05joins\"A\n" +
+	"\x11BatchLeaveRequest\x12,\n" +
+	"\x06leaves\x18\x01 \x03(\v2\x14.LeaveMeetingRequestR\x06leaves\"E\n" +
+	"\x12BatchLeaveResponse\x12/\n" +
+	"\aresults\x18\x01 \x03(\v2\x15.LeaveMeetingResponseR\aresults\"\x16\n" +
+	"\x14WatchSessionsRequest\"\xfa\x01\n" +
+	"\fSessionEvent\x12\x15\n" +
+	"\x06bot_id\x18\x01 \x01(\tR\x05botId\x12\x19\n" +
+	"\bmeepo_id\x18\x02 \x01(\tR\ameepoId\x12)\n" +
+	"\x05state\x18\x03 \x01(\x0e2\x13.SessionEvent.StateR\x05state\x12\x18\n" +
+	"\amessage\x18\x04 \x01(\tR\amessage\x12\x0e\n" +
+	"\x02at\x18\x05 \x01(\x01R\x02at\x12\x1a\n" +
+	"\bsnapshot\x18\x06 \x01(\bR\bsnapshot\"G\n" +
+	"\x05State\x12\f\n" +
+	"\bRECEIVED\x10\x00\x12\v\n" +
+	"\aPENDING\x10\x01\x12\n" +
+	"\n" +
+	"\x06JOINED\x10\x02\x12\n" +
+	"\n" +
+	"\x06FAILED\x10\x03\x12\v\n" +
+	"\aSTOPPED\x10\x042\xb8\x03\n" +
 	"\n" +
 	"BotService\x12:\n" +
 	"\vJoinMeeting\x12\x13.JoinMeetingRequest\x1a\x14.JoinMeetingResponse0\x01\x12D\n" +
 	"\x11GetMeetingDetails\x12\x16.MeetingDetailsRequest\x1a\x17.MeetingDetailsResponse\x12;\n" +
-	"\fLeaveMeeting\x12\x14.LeaveMeetingRequest\x1a\x15.LeaveMeetingResponseB4Z2github.com/xyberii4/meepo/gateway/internal/grpc/pbb\x06proto3"
+	"\fLeaveMeeting\x12\x14.LeaveMeetingRequest\x1a\x15.LeaveMeetingResponse\x12C\n" +
+	"\x11WatchParticipants\x12\x19.WatchParticipantsRequest\x1a\x11.ParticipantEvent0\x01\x126\n" +
+	"\tBatchJoin\x12\x11.BatchJoinRequest\x1a\x14.JoinMeetingResponse0\x01\x125\n" +
+	"\n" +
+	"BatchLeave\x12\x12.BatchLeaveRequest\x1a\x13.BatchLeaveResponse\x127\n" +
+	"\rWatchSessions\x12\x15.WatchSessionsRequest\x1a\r.SessionEvent0\x01B4Z2github.com/xyberii4/meepo/gateway/internal/grpc/pbb\x06proto3"
 
 var (
 	file_bot_proto_rawDescOnce sync.Once
@@ -551,34 +1167,59 @@ func file_bot_proto_rawDescGZIP() []byte {
 	return file_bot_proto_rawDescData
 }
 
-var file_bot_proto_enumTypes = make([]protoimpl.EnumInfo, 2)
-var file_bot_proto_msgTypes = make([]protoimpl.MessageInfo, 7)
+var file_bot_proto_enumTypes = make([]protoimpl.EnumInfo, 4)
+var file_bot_proto_msgTypes = make([]protoimpl.MessageInfo, 15)
 var file_bot_proto_goTypes = []any{
-	(JoinMeetingResponse_State)(0),  // 0: JoinMeetingResponse.State
-	(LeaveMeetingResponse_State)(0), // 1: LeaveMeetingResponse.State
-	(*JoinMeetingRequest)(nil),      // 2: JoinMeetingRequest
-	(*JoinMeetingResponse)(nil),     // 3: JoinMeetingResponse
-	(*MeetingDetailsRequest)(nil),   // 4: MeetingDetailsRequest
-	(*MeetingDetailsResponse)(nil),  // 5: MeetingDetailsResponse
-	(*Participant)(nil),             // 6: Participant
-	(*LeaveMeetingRequest)(nil),     // 7: LeaveMeetingRequest
-	(*LeaveMeetingResponse)(nil),    // 8: LeaveMeetingResponse
+	(JoinMeetingResponse_State)(0),   // 0: JoinMeetingResponse.State
+	(ParticipantEvent_Kind)(0),       // 1: ParticipantEvent.Kind
+	(LeaveMeetingResponse_State)(0),  // 2: LeaveMeetingResponse.State
+	(SessionEvent_State)(0),          // 3: SessionEvent.State
+	(*JoinMeetingRequest)(nil),       // 4: JoinMeetingRequest
+	(*JoinMeetingResponse)(nil),      // 5: JoinMeetingResponse
+	(*JoinStep)(nil),                 // 6: JoinStep
+	(*MeetingDetailsRequest)(nil),    // 7: MeetingDetailsRequest
+	(*MeetingDetailsResponse)(nil),   // 8: MeetingDetailsResponse
+	(*Participant)(nil),              // 9: Participant
+	(*WatchParticipantsRequest)(nil), // 10: WatchParticipantsRequest
+	(*ParticipantEvent)(nil),         // 11: ParticipantEvent
+	(*LeaveMeetingRequest)(nil),      // 12: LeaveMeetingRequest
+	(*LeaveMeetingResponse)(nil),     // 13: LeaveMeetingResponse
+	(*BatchJoinRequest)(nil),         // 14: BatchJoinRequest
+	(*BatchLeaveRequest)(nil),        // 15: BatchLeaveRequest
+	(*BatchLeaveResponse)(nil),       // 16: BatchLeaveResponse
+	(*WatchSessionsRequest)(nil),     // 17: WatchSessionsRequest
+	(*SessionEvent)(nil),             // 18: SessionEvent
 }
 var file_bot_proto_depIdxs = []int32{
-	0, // 0: JoinMeetingResponse.state:type_name -> JoinMeetingResponse.State
-	6, // 1: MeetingDetailsResponse.participants:type_name -> Participant
-	1, // 2: LeaveMeetingResponse.state:type_name -> LeaveMeetingResponse.State
-	2, // 3: BotService.JoinMeeting:input_type -> JoinMeetingRequest
-	4, // 4: BotService.GetMeetingDetails:input_type -> MeetingDetailsRequest
-	7, // 5: BotService.LeaveMeeting:input_type -> LeaveMeetingRequest
-	3, // 6: BotService.JoinMeeting:output_type -> JoinMeetingResponse
-	5, // 7: BotService.GetMeetingDetails:output_type -> MeetingDetailsResponse
-	8, // 8: BotService.LeaveMeeting:output_type -> LeaveMeetingResponse
-	6, // [6:9] is the sub-list for method output_type
-	3, // [3:6] is the sub-list for method input_type
-	3, // [3:3] is the sub-list for extension type_name
-	3, // [3:3] is the sub-list for extension extendee
-	0, // [0:3] is the sub-list for field type_name
+	0,  // 0: JoinMeetingResponse.state:type_name -> JoinMeetingResponse.State
+	6,  // 1: JoinMeetingResponse.steps:type_name -> JoinStep
+	9,  // 2: MeetingDetailsResponse.participants:type_name -> Participant
+	1,  // 3: ParticipantEvent.kind:type_name -> ParticipantEvent.Kind
+	9,  // 4: ParticipantEvent.participants:type_name -> Participant
+	2,  // 5: LeaveMeetingResponse.state:type_name -> LeaveMeetingResponse.State
+	4,  // 6: BatchJoinRequest.joins:type_name -> JoinMeetingRequest
+	12, // 7: BatchLeaveRequest.leaves:type_name -> LeaveMeetingRequest
+	13, // 8: BatchLeaveResponse.results:type_name -> LeaveMeetingResponse
+	3,  // 9: SessionEvent.state:type_name -> SessionEvent.State
+	4,  // 10: BotService.JoinMeeting:input_type -> JoinMeetingRequest
+	7,  // 11: BotService.GetMeetingDetails:input_type -> MeetingDetailsRequest
+	12, // 12: BotService.LeaveMeeting:input_type -> LeaveMeetingRequest
+	10, // 13: BotService.WatchParticipants:input_type -> WatchParticipantsRequest
+	14, // 14: BotService.BatchJoin:input_type -> BatchJoinRequest
+	15, // 15: BotService.BatchLeave:input_type -> BatchLeaveRequest
+	17, // 16: BotService.WatchSessions:input_type -> WatchSessionsRequest
+	5,  // 17: BotService.JoinMeeting:output_type -> JoinMeetingResponse
+	8,  // 18: BotService.GetMeetingDetails:output_type -> MeetingDetailsResponse
+	13, // 19: BotService.LeaveMeeting:output_type -> LeaveMeetingResponse
+	11, // 20: BotService.WatchParticipants:output_type -> ParticipantEvent
+	5,  // 21: BotService.BatchJoin:output_type -> JoinMeetingResponse
+	16, // 22: BotService.BatchLeave:output_type -> BatchLeaveResponse
+	18, // 23: BotService.WatchSessions:output_type -> SessionEvent
+	17, // [17:24] is the sub-list for method output_type
+	10, // [10:17] is the sub-list for method input_type
+	10, // [10:10] is the sub-list for extension type_name
+	10, // [10:10] is the sub-list for extension extendee
+	0,  // [0:10] is the sub-list for field type_name
 }
 
 func init() { file_bot_proto_init() }
@@ -591,8 +1232,8 @@ func file_bot_proto_init() {
 		File: protoimpl.DescBuilder{
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_bot_proto_rawDesc), len(file_bot_proto_rawDesc)),
-			NumEnums:      2,
-			NumMessages:   7,
+			NumEnums:      4,
+			NumMessages:   15,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
@@ -22,6 +22,10 @@ const (
 	BotService_JoinMeeting_FullMethodName       = "/BotService/JoinMeeting"
 	BotService_GetMeetingDetails_FullMethodName = "/BotService/GetMeetingDetails"
 	BotService_LeaveMeeting_FullMethodName      = "/BotService/LeaveMeeting"
+	BotService_WatchParticipants_FullMethodName = "/BotService/WatchParticipants"
+	BotService_BatchJoin_FullMethodName         = "/BotService/BatchJoin"
+	BotService_BatchLeave_FullMethodName        = "/BotService/BatchLeave"
+	BotService_WatchSessions_FullMethodName     = "/BotService/WatchSessions"
 )
 
 // BotServiceClient is the client API for BotService service.
@@ -31,6 +35,14 @@ type BotServiceClient interface {
 	JoinMeeting(ctx context.Context, in *JoinMeetingRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[JoinMeetingResponse], error)
 	GetMeetingDetails(ctx context.Context, in *MeetingDetailsRequest, opts ...grpc.CallOption) (*MeetingDetailsResponse, error)
 	LeaveMeeting(ctx context.Context, in *LeaveMeetingRequest, opts ...grpc.CallOption) (*LeaveMeetingResponse, error)
+	WatchParticipants(ctx context.Context, in *WatchParticipantsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ParticipantEvent], error)
+	// Many joins or leaves in one call, run concurrently on the bot server.
+	// BatchJoin streams the responses of all joins interleaved, told apart by
+	// their bot_id; BatchLeave answers in request order.
+	BatchJoin(ctx context.Context, in *BatchJoinRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[JoinMeetingResponse], error)
+	BatchLeave(ctx context.Context, in *BatchLeaveRequest, opts ...grpc.CallOption) (*BatchLeaveResponse, error)
+	// State transitions of every session on the bot server.
+	WatchSessions(ctx context.Context, in *WatchSessionsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[SessionEvent], error)
 }
 
 type botServiceClient struct {
@@ -80,6 +92,73 @@ func (c *botServiceClient) LeaveMeeting(ctx context.Context, in *LeaveMeetingReq
 	return out, nil
 }
 
+func (c *botServiceClient) WatchParticipants(ctx context.Context, in *WatchParticipantsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ParticipantEvent], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &BotService_ServiceDesc.Streams[1], BotService_WatchParticipants_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[WatchParticipantsRequest, ParticipantEvent]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type BotService_WatchParticipantsClient = grpc.ServerStreamingClient[ParticipantEvent]
+
+func (c *botServiceClient) BatchJoin(ctx context.Context, in *BatchJoinRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[JoinMeetingResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &BotService_ServiceDesc.Streams[2], BotService_BatchJoin_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[BatchJoinRequest, JoinMeetingResponse]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type BotService_BatchJoinClient = grpc.ServerStreamingClient[JoinMeetingResponse]
+
+func (c *botServiceClient) BatchLeave(ctx context.Context, in *BatchLeaveRequest, opts ...grpc.CallOption) (*BatchLeaveResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(BatchLeaveResponse)
+	err := c.cc.Invoke(ctx, BotService_BatchLeave_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *botServiceClient) WatchSessions(ctx context.Context, in *WatchSessionsRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[SessionEvent], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &BotService_ServiceDesc.Streams[3], BotService_WatchSessions_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[WatchSessionsRequest, SessionEvent]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type BotService_WatchSessionsClient = grpc.ServerStreamingClient[SessionEvent]
+
 // BotServiceServer is the server API for BotService service.
 // All implementations must embed UnimplementedBotServiceServer
 // for forward compatibility.
@@ -87,6 +166,14 @@ type BotServiceServer interface {
 	JoinMeeting(*JoinMeetingRequest, grpc.ServerStreamingServer[JoinMeetingResponse]) error
 	GetMeetingDetails(context.Context, *MeetingDetailsRequest) (*MeetingDetailsResponse, error)
 	LeaveMeeting(context.Context, *LeaveMeetingRequest) (*LeaveMeetingResponse, error)
+	WatchParticipants(*WatchParticipantsRequest, grpc.ServerStreamingServer[ParticipantEvent]) error
+	// Many joins or leaves in one call, run concurrently on the bot server.
+	// BatchJoin streams the responses of all joins interleaved, told apart by
+	// their bot_id; BatchLeave answers in request order.
+	BatchJoin(*BatchJoinRequest, grpc.ServerStreamingServer[JoinMeetingResponse]) error
+	BatchLeave(context.Context, *BatchLeaveRequest) (*BatchLeaveResponse, error)
+	// State transitions of every session on the bot server.
+	WatchSessions(*WatchSessionsRequest, grpc.ServerStreamingServer[SessionEvent]) error
 	mustEmbedUnimplementedBotServiceServer()
 }
 
@@ -106,6 +193,18 @@ func (UnimplementedBotServiceServer) GetMeetingDetails(context.Context, *Meeting
 func (UnimplementedBotServiceServer) LeaveMeeting(context.Context, *LeaveMeetingRequest) (*LeaveMeetingResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method LeaveMeeting not implemented")
 }
+func (UnimplementedBotServiceServer) WatchParticipants(*WatchParticipantsRequest, grpc.ServerStreamingServer[ParticipantEvent]) error {
+	return status.Errorf(codes.Unimplemented, "method WatchParticipants not implemented")
+}
+func (UnimplementedBotServiceServer) BatchJoin(*BatchJoinRequest, grpc.ServerStreamingServer[JoinMeetingResponse]) error {
+	return status.Errorf(codes.Unimplemented, "method BatchJoin not implemented")
+}
+func (UnimplementedBotServiceServer) BatchLeave(context.Context, *BatchLeaveRequest) (*BatchLeaveResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method BatchLeave not implemented")
+}
+func (UnimplementedBotServiceServer) WatchSessions(*WatchSessionsRequest, grpc.ServerStreamingServer[SessionEvent]) error {
+	return status.Errorf(codes.Unimplemented, "method WatchSessions not implemented")
+}
 func (UnimplementedBotServiceServer) mustEmbedUnimplementedBotServiceServer() {}
 func (UnimplementedBotServiceServer) testEmbeddedByValue()                    {}
 
@@ -174,6 +273,57 @@ func _BotService_LeaveMeeting_Handler(srv interface{}, ctx context.Context, dec
 	return interceptor(ctx, in, info, handler)
 }
 
+func _BotService_WatchParticipants_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(WatchParticipantsRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(BotServiceServer).WatchParticipants(m, &grpc.GenericServerStream[WatchParticipantsRequest, ParticipantEvent]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type BotService_WatchParticipantsServer = grpc.ServerStreamingServer[ParticipantEvent]
+
+func _BotService_BatchJoin_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(BatchJoinRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(BotServiceServer).BatchJoin(m, &grpc.GenericServerStream[BatchJoinRequest, JoinMeetingResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type BotService_BatchJoinServer = grpc.ServerStreamingServer[JoinMeetingResponse]
+
+func _BotService_BatchLeave_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(BatchLeaveRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(BotServiceServer).BatchLeave(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: BotService_BatchLeave_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(BotServiceServer).BatchLeave(ctx, req.(*BatchLeaveRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _BotService_WatchSessions_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(WatchSessionsRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(BotServiceServer).WatchSessions(m, &grpc.GenericServerStream[WatchSessionsRequest, SessionEvent]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type BotService_WatchSessionsServer = grpc.ServerStreamingServer[SessionEvent]
+
 // BotService_ServiceDesc is the grpc.ServiceDesc for BotService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -189,6 +339,10 @@ var BotService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "LeaveMeeting",
 			Handler:    _BotService_LeaveMeeting_Handler,
 		},
+		{
+			MethodName: "BatchLeave",
+			Handler:    _BotService_BatchLeave_Handler,
+		},
 	},
 	Streams: []grpc.StreamDesc{
 		{
@@ -196,6 +350,21 @@ var BotService_ServiceDesc = grpc.ServiceDesc{
 			Handler:       _BotService_JoinMeeting_Handler,
 			ServerStreams: true,
 		},
+		{
+			StreamName:    "WatchParticipants",
+			Handler:       _BotService_WatchParticipants_Handler,
+			ServerStreams: true,
+		},
+		{
+			StreamName:    "BatchJoin",
+			Handler:       _BotService_BatchJoin_Handler,
+			ServerStreams: true,
+		},
+		{
+			StreamName:    "WatchSessions",
+			Handler:       _BotService_WatchSessions_Handler,
+			ServerStreams: true,
+		},
 	},
 	Metadata: "bot.proto",
 }